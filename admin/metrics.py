@@ -0,0 +1,89 @@
+"""관리자용 구간 측정 대시보드 (학생 화면의 페이지 목록에는 나타나지 않음).
+
+    MATHHH_METRICS_FILE=metrics/sections.jsonl streamlit run main.py     # 측정하며 서비스
+    MATHHH_METRICS_FILE=metrics/sections.jsonl streamlit run admin/metrics.py --server.port 8502
+
+JSONL 파일의 최근 이벤트로 페이지·구간별 호출 수와 p50/p95/p99 를 보여 줍니다.
+읽는 파일은 MATHHH_METRICS_FILE 로 정한 측정 파일 하나뿐이며, 화면에서 바꿀 수 없습니다.
+"""
+import json
+import os
+import sys
+import time
+from collections import deque
+
+import streamlit as st
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.metrics import METRICS_FILE  # noqa: E402
+
+st.set_page_config(page_title="구간 측정 (관리자)", page_icon="⏱️", layout="wide")
+st.title("⏱️ 페이지 구간별 실행 시간")
+
+if not METRICS_FILE:
+    st.warning("MATHHH_METRICS_FILE 이 설정되지 않았습니다. 앱과 이 대시보드를 같은 값으로 실행하세요.")
+    st.stop()
+path = METRICS_FILE
+st.caption(f"측정 파일: {path}")
+col1, col2 = st.columns(2)
+with col1:
+    window_min = st.slider("최근 몇 분", 1, 120, 15)
+with col2:
+    max_events = st.select_slider("최대 이벤트 수", [1_000, 10_000, 50_000, 200_000], value=50_000)
+st.button("🔄 새로 고침")
+
+if path.endswith(".prom"):
+    st.info("Prometheus 형식(.prom)은 누적값만 담고 있어 백분위를 계산할 수 없습니다. 파일 내용을 그대로 보여 줍니다.")
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            st.code(f.read(), language="text")
+    st.stop()
+
+if not os.path.exists(path):
+    st.warning(f"{path} 가 없습니다. MATHHH_METRICS_FILE 을 설정하고 앱을 실행했는지 확인하세요.")
+    st.stop()
+
+
+def percentile(sorted_values, q):
+    k = min(len(sorted_values) - 1, max(0, round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+# 파일 끝부분(최근 이벤트)만 읽습니다.
+with open(path, encoding="utf-8") as f:
+    lines = deque(f, maxlen=max_events)
+
+since = time.time() - window_min * 60
+groups = {}
+for line in lines:
+    try:
+        event = json.loads(line)
+    except ValueError:
+        continue  # 쓰는 중이던 마지막 줄
+    if event["ts"] < since:
+        continue
+    groups.setdefault((event["page"], event["section"]), []).append(event)
+
+if not groups:
+    st.info(f"최근 {window_min}분 동안 기록된 이벤트가 없습니다.")
+    st.stop()
+
+rows = []
+for (page, name), events in sorted(groups.items()):
+    times = sorted(e["ms"] for e in events)
+    allocs = [e["alloc_kb"] for e in events if "alloc_kb" in e]
+    rows.append({
+        "페이지": page,
+        "구간": name,
+        "호출 수": len(times),
+        "p50 ms": round(percentile(times, 50), 2),
+        "p95 ms": round(percentile(times, 95), 2),
+        "p99 ms": round(percentile(times, 99), 2),
+        "최대 ms": round(times[-1], 2),
+        "평균 할당 KB": round(sum(allocs) / len(allocs), 1) if allocs else None,
+    })
+
+st.dataframe(rows, width="stretch", hide_index=True)
+st.caption(f"이벤트 {sum(len(v) for v in groups.values())}개 · 파일 {os.path.getsize(path) / 1024:.0f} KB")
@@ -1,4 +1,9 @@
 import streamlit as st
 
+from utils.warmup import start_background_prewarm
+
+# run.py 없이 `streamlit run main.py` 로 띄운 경우에도 다른 페이지의 무거운 모듈을 미리 불러 둡니다.
+start_background_prewarm()
+
 st.title('나만의 유리함수 디지털 교과서')
 st.write('모바일로 접속한 경우 왼쪽 상단의 >> 버튼을 누른 후 원하는 페이지를 클릭하세요.')
@@ -1,6 +1,6 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
+
+from utils.figures import plot_segments, show_static_figure
 
 # 배경색: RGB(203,147,160)
 st.markdown(
@@ -37,28 +37,37 @@ st.write("""
 # 3️⃣ 기본형 그래프
 st.header("유리함수 기본형 그래프 예시")
 
-x_vals = np.linspace(-10,10,400)
+# 아래 두 그림은 매개변수가 없으므로 서버 프로세스당 한 번만 그리고 모든 접속자가 재사용합니다.
+# (numpy 를 쓰는 계산 모듈도 실제로 그릴 때만 불러옵니다)
 
 # 예시 1: f(x) = 1/x
-x1 = x_vals[x_vals != 0]
-y1 = 1 / x1
-plt.figure(figsize=(6,4))
-plt.plot(x1, y1, label='f(x) = 1/x')
-plt.axhline(0, color='black', linewidth=0.5)
-plt.axvline(0, color='black', linewidth=0.5)
-plt.title("f(x) = 1/x")
-plt.grid(True)
-plt.legend()
-st.pyplot(plt)
+def draw_one_over_x(fig):
+    from utils.rational import RationalFunction
+
+    ax = fig.subplots()
+    f = RationalFunction([1], [1, 0])
+    plot_segments(ax, f.adaptive_segments(-10, 10, -10, 10), label='f(x) = 1/x', color='C0')
+    ax.axhline(0, color='black', linewidth=0.5)
+    ax.axvline(0, color='black', linewidth=0.5)
+    ax.set_ylim(-10, 10)
+    ax.set_title("f(x) = 1/x")
+    ax.grid(True)
+    ax.legend()
+
+show_static_figure(draw_one_over_x)
 
 # 예시 2: f(x) = (x+1)/(x-1)
-x2 = x_vals[x_vals != 1]
-y2 = (x2 + 1)/(x2 - 1)
-plt.figure(figsize=(6,4))
-plt.plot(x2, y2, label='f(x) = (x+1)/(x-1)')
-plt.axhline(1, color='green', linestyle='--', label='y=1')
-plt.axvline(1, color='red', linestyle='--', label='x=1')
-plt.title("f(x) = (x+1)/(x-1)")
-plt.grid(True)
-plt.legend()
-st.pyplot(plt)
+def draw_shifted(fig):
+    from utils.rational import RationalFunction
+
+    ax = fig.subplots()
+    f = RationalFunction.linear(1, 1, 1, -1)
+    plot_segments(ax, f.adaptive_segments(-10, 10, -10, 10), label='f(x) = (x+1)/(x-1)', color='C0')
+    ax.axhline(1, color='green', linestyle='--', label='y=1')
+    ax.axvline(1, color='red', linestyle='--', label='x=1')
+    ax.set_ylim(-10, 10)
+    ax.set_title("f(x) = (x+1)/(x-1)")
+    ax.grid(True)
+    ax.legend()
+
+show_static_figure(draw_shifted)
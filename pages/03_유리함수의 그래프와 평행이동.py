@@ -1,6 +1,12 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
+
+from utils.client_plot import inverse_proportion_chart, linear_fractional_chart
+from utils.coalesce import frame
+from utils.figures import show_cached_figure
+from utils.metrics import section
+from utils.rational_plots import (FIGSIZE, draw_inverse_proportion, draw_linear_fractional,
+                                  inverse_proportion_key, linear_fractional_key, start_precompute)
+from utils.results_store import record_answer
 
 # 배경색 설정 (RGB 203,147,160)
 st.markdown(
@@ -20,25 +26,107 @@ st.markdown("""
 직접 그래프를 조작하면서 함수의 특징을 탐구해 봅시다.
 """)
 
+# 브라우저 그리기 모드: 계수만 한 번 보내고 슬라이더 조작은 브라우저에서 바로 다시 그림
+client_mode = st.toggle("⚡ 브라우저에서 바로 그리기 (슬라이더를 움직여도 서버를 거치지 않음)",
+                        key="client_render")
+
+# 서버에서 그릴 때는 y = a/x 의 모든 a 값을 백그라운드에서 미리 그려 둡니다. (프로세스당 한 번)
+if not client_mode:
+    start_precompute()
+
+
+def kept_slider(label, min_value, max_value, default, step, key):
+    """브라우저 그리기 모드에서 위젯이 사라졌다 돌아와도 값이 이어지는 슬라이더.
+
+    그려지지 않은 위젯의 키는 실행이 끝날 때 지워지므로, 값은 위젯이 아닌 키(_key)에도
+    보관하고 슬라이더를 다시 만들 때 그 값으로 시작합니다.
+    """
+    value = st.slider(label, min_value, max_value, st.session_state.get(f"_{key}", default), step, key=key)
+    st.session_state[f"_{key}"] = value
+    return value
+
+
+# 아래 세 영역(두 그래프와 퀴즈)은 각각 fragment 입니다. 한 영역의 슬라이더를 움직이거나
+# 답안을 제출하면 그 영역만 다시 실행되고, 다른 영역의 그림·퀴즈는 다시 만들지 않습니다.
+
+
+@st.fragment
+def inverse_proportion_section():
+    a = kept_slider("a 값 조절", -5.0, 5.0, 1.0, 0.1, key="inverse_a")
+
+    # 같은 a 값의 그림은 모든 접속자가 함께 쓰는 캐시에서 꺼내 옴 (101개 값은 서버가 미리 그려 둠)
+    # 슬라이더를 끄는 동안에는 최소 간격마다 최신 값만 그림 (utils.coalesce)
+    with frame("03", "inverse"), section("03", "inverse_render"):
+        show_cached_figure(inverse_proportion_key(a), draw_inverse_proportion, FIGSIZE, args=(a,))
+
+
+@st.fragment
+def linear_fractional_section():
+    a2 = kept_slider("a", -5.0, 5.0, 1.0, 0.1, key="lf_a")
+    b2 = kept_slider("b", -10.0, 10.0, 0.0, 0.5, key="lf_b")
+    c2 = kept_slider("c (0 가능)", -5.0, 5.0, 1.0, 0.1, key="lf_c")
+    d2 = kept_slider("d", -10.0, 10.0, 0.0, 0.5, key="lf_d")
+
+    # c = 0 인 경우(일차함수 형태) 안내
+    if abs(c2) < 1e-9:
+        if abs(d2) < 1e-9:
+            st.error("⚠️ c = 0 이고 d = 0 이면 함수가 정의되지 않습니다.")
+        else:
+            st.info("✅ c = 0 이므로 함수는 일차함수 형태입니다.")
+
+    # 그림은 슬라이더 간격으로 양자화한 (a, b, c, d) 를 키로 세션 공용 캐시에 보관
+    with frame("03", "linear_fractional"), section("03", "linear_fractional_render"):
+        show_cached_figure(linear_fractional_key(a2, b2, c2, d2), draw_linear_fractional, FIGSIZE,
+                           args=(a2, b2, c2, d2))
+
+
+@st.fragment
+def quiz_section():
+    with st.form("quiz_form"):
+        q1 = st.radio("① y = a/x 에서 a가 음수일 때 그래프는 어느 사분면에 있나요?",
+                      ["1, 3사분면", "2, 4사분면", "x축 위"], index=None)
+
+        q2 = st.radio("② y = (ax + b)/(cx + d) 에서 수직점근선은 어디에 있나요?",
+                      ["x = -d/c", "y = a/c", "x = 0"], index=None)
+
+        q3 = st.radio("③ y = (ax + b)/(cx + d) 의 수평점근선은?",
+                      ["y = a/b", "y = a/c", "y = -d/c"], index=None)
+
+        submit = st.form_submit_button("✅ 답안 제출")
+
+    if submit:
+        # 선생님이 볼 수 있도록 답안을 기록 (큐에 넣기만 하므로 기다리지 않음)
+        record_answer("03", "quiz_q1", q1, q1 == "2, 4사분면", prompt="① a<0 일 때 y = a/x 의 사분면")
+        record_answer("03", "quiz_q2", q2, q2 == "x = -d/c", prompt="② 수직점근선")
+        record_answer("03", "quiz_q3", q3, q3 == "y = a/c", prompt="③ 수평점근선")
+
+        score = 0
+        if q1 == "2, 4사분면":
+            score += 1
+        if q2 == "x = -d/c":
+            score += 1
+        if q3 == "y = a/c":
+            score += 1
+
+        st.subheader(f"🎯 결과: {score}/3 점")
+        if score == 3:
+            st.success("완벽합니다! 유리함수의 점근선을 정확히 이해했습니다.")
+        elif score == 2:
+            st.info("좋아요! 한 문제만 더 복습해 봅시다.")
+        else:
+            st.warning("조금 더 복습이 필요해요. 그래프 변화를 다시 관찰해 보세요.")
+
+
 # ------------------------
 # 1️⃣ y = a/x
 # ------------------------
 st.header("1️⃣ 함수 y = a/x 의 그래프")
 
-a = st.slider("a 값 조절", -5.0, 5.0, 1.0, 0.1)
-x = np.linspace(-10, 10, 800)
-y = np.where(x != 0, a / x, np.nan)
-
-fig, ax = plt.subplots(figsize=(6,6))
-ax.plot(x, y, label=f"y = {a}/x")
-ax.axhline(0, color='black', linewidth=1)
-ax.axvline(0, color='black', linewidth=1)
-ax.set_xlim(-10, 10)
-ax.set_ylim(-10, 10)
-ax.set_aspect('equal')
-ax.grid(True)
-ax.legend()
-st.pyplot(fig)
+if client_mode:
+    # 서버 쪽 슬라이더에 두었던 값에서 이어서 그림 (kept_slider 가 보관한 값)
+    inverse_proportion_chart(st.session_state.get("_inverse_a", 1.0))
+else:
+    inverse_proportion_section()
 
 st.markdown("""
 - a > 0이면 1,3사분면 / a < 0이면 2,4사분면  
@@ -50,83 +138,11 @@ st.markdown("""
 # ------------------------
 st.header("2️⃣ 함수 y = (ax + b) / (cx + d)의 그래프")
 
-a2 = st.slider("a", -5.0, 5.0, 1.0, 0.1)
-b2 = st.slider("b", -10.0, 10.0, 0.0, 0.5)
-c2 = st.slider("c (0 가능)", -5.0, 5.0, 1.0, 0.1)
-d2 = st.slider("d", -10.0, 10.0, 0.0, 0.5)
-
-# 화면 표시 범위
-xmin, xmax = -10, 10
-ymin, ymax = -10, 10
-
-fig2, ax2 = plt.subplots(figsize=(6,6))
-
-# c = 0 인 경우(일차함수 형태) 처리
-if abs(c2) < 1e-9:
-    if abs(d2) < 1e-9:
-        st.error("⚠️ c = 0 이고 d = 0 이면 함수가 정의되지 않습니다.")
-        # 빈 플롯만 표시
-        ax2.text(0.5, 0.5, "함수 불가", transform=ax2.transAxes, ha='center')
-    else:
-        # y = (a/d) x + (b/d)
-        slope = a2 / d2
-        intercept = b2 / d2
-        x_line = np.linspace(xmin, xmax, 400)
-        y_line = slope * x_line + intercept
-        # 화면 밖의 값은 nan으로 만들어 이상 연결 방지(여기선 불필요하지만 일관성 유지)
-        y_line = np.where(np.abs(y_line) > 1e6, np.nan, y_line)
-        ax2.plot(x_line, y_line, color='green', label=f"y = {slope:.2f}x + {intercept:.2f}")
-        st.info("✅ c = 0 이므로 함수는 일차함수 형태입니다.")
+if client_mode:
+    linear_fractional_chart(*(st.session_state.get(key, default) for key, default in
+                              (("_lf_a", 1.0), ("_lf_b", 0.0), ("_lf_c", 1.0), ("_lf_d", 0.0))))
 else:
-    # 일반적인 유리함수: 분모 = c2*x + d2
-    asym_x = -d2 / c2  # 세로점근선 위치
-    # 만약 점근선이 화면 범위 안에 있으면 구간을 둘로 나눠서 그림
-    eps = 1e-3
-    # 구간 왼쪽: xmin .. asym_x - delta, 오른쪽: asym_x + delta .. xmax
-    delta = max(0.01, (xmax - xmin) * 1e-3)
-    x_left = np.linspace(xmin, min(asym_x - delta, xmax), 500)
-    x_right = np.linspace(max(asym_x + delta, xmin), xmax, 500)
-
-    # 계산 시 분모가 0에 가까운 값 제외하고 계산
-    def safe_compute(x_arr):
-        denom = c2 * x_arr + d2
-        # denom가 0에 가깝거나 계산 결과가 너무 큰 경우 np.nan으로 처리
-        y_arr = np.full_like(x_arr, np.nan, dtype=float)
-        mask = np.abs(denom) > 1e-8
-        y_tmp = (a2 * x_arr[mask] + b2) / denom[mask]
-        # 화면 범위를 벗어나는 값은 np.nan 으로 바꿔 연결선 방지
-        y_tmp = np.where(np.abs(y_tmp) > 1e6, np.nan, y_tmp)
-        y_tmp = np.where((y_tmp < ymin*100) | (y_tmp > ymax*100), np.nan, y_tmp)
-        y_arr[mask] = y_tmp
-        return y_arr
-
-    # 왼쪽/오른쪽 각각 계산 및 플롯 (점근선 근처에서 선 연결 안 됨)
-    if len(x_left) > 0:
-        y_left = safe_compute(x_left)
-        ax2.plot(x_left, y_left, color='tomato')
-    if len(x_right) > 0:
-        y_right = safe_compute(x_right)
-        ax2.plot(x_right, y_right, color='tomato')
-
-    # 점근선(세로/가로) 표시 — 화면 범위에 있을 때만
-    if xmin < asym_x < xmax:
-        ax2.axvline(asym_x, color='gray', linestyle='--', label=f"x = {asym_x:.2f} (수직점근선)")
-    # 가로 점근선 y = a/c
-    horiz = a2 / c2
-    if ymin < horiz < ymax:
-        ax2.axhline(horiz, color='purple', linestyle='--', label=f"y = {horiz:.2f} (수평점근선)")
-    else:
-        # 그래도 보여주기 위해 점선(범위 밖이면 레이블 없이)
-        ax2.axhline(horiz, color='purple', linestyle='--', alpha=0.5)
-
-ax2.axhline(0, color='black', linewidth=1)
-ax2.axvline(0, color='black', linewidth=1)
-ax2.set_xlim(xmin, xmax)
-ax2.set_ylim(ymin, ymax)
-ax2.set_aspect('equal')
-ax2.grid(True)
-ax2.legend(loc='upper right')
-st.pyplot(fig2)
+    linear_fractional_section()
 
 st.markdown("""
 👉 **그래프 특징 정리**
@@ -140,34 +156,7 @@ st.markdown("""
 # ------------------------
 st.header("3️⃣ 학습 확인 퀴즈")
 
-with st.form("quiz_form"):
-    q1 = st.radio("① y = a/x 에서 a가 음수일 때 그래프는 어느 사분면에 있나요?",
-                  ["1, 3사분면", "2, 4사분면", "x축 위"], index=None)
-
-    q2 = st.radio("② y = (ax + b)/(cx + d) 에서 수직점근선은 어디에 있나요?",
-                  ["x = -d/c", "y = a/c", "x = 0"], index=None)
-
-    q3 = st.radio("③ y = (ax + b)/(cx + d) 의 수평점근선은?",
-                  ["y = a/b", "y = a/c", "y = -d/c"], index=None)
-
-    submit = st.form_submit_button("✅ 답안 제출")
-
-if submit:
-    score = 0
-    if q1 == "2, 4사분면":
-        score += 1
-    if q2 == "x = -d/c":
-        score += 1
-    if q3 == "y = a/c":
-        score += 1
-
-    st.subheader(f"🎯 결과: {score}/3 점")
-    if score == 3:
-        st.success("완벽합니다! 유리함수의 점근선을 정확히 이해했습니다.")
-    elif score == 2:
-        st.info("좋아요! 한 문제만 더 복습해 봅시다.")
-    else:
-        st.warning("조금 더 복습이 필요해요. 그래프 변화를 다시 관찰해 보세요.")
+quiz_section()
 
 st.markdown("""
 ---
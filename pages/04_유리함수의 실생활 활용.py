@@ -1,6 +1,10 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
+
+from utils.coalesce import frame
+from utils.figures import show_cached_figure, show_rendered_figure
+from utils.metrics import section
+from utils.model_plots import draw_servers_needed, draw_time_curve
+from utils.sweep import MAX_SERVERS, model_sweep
 
 # --------------------- 기본 설정 ---------------------
 st.set_page_config(page_title="유리함수 실생활 | 공통수학Ⅱ", page_icon="📘", layout="wide")
@@ -89,16 +93,14 @@ s = st.slider("암호화 느려짐 정도 s (배)", 1, 100, 20, 1)
 W = st.slider("전체 연산량 W", 100, 1000, 400, 50)
 r = st.slider("서버 1대 처리속도 r", 10, 200, 50, 5)
 
-x = np.linspace(1, 200, 400)
-T = (s * W) / (r * x)
+# 모든 (s, W, r) 의 K = sW/r 를 미리 계산해 둔 격자에서 현재 설정의 곡선 K/x 를 만듦
+sweep = model_sweep()
+x, T = sweep.curve(s, W, r)
 
-fig, ax = plt.subplots()
-ax.plot(x, T)
-ax.set_xlabel("서버 수 x (대)")
-ax.set_ylabel("처리 시간 T")
-ax.set_title("🔒 암호화된 데이터 처리 시간 — 유리함수 관계")
-ax.grid(True, alpha=0.3)
-st.pyplot(fig)
+# 잘라 낸 곡선만 그림 명세로 넘기면 (렌더링 풀이 켜져 있으면) 작업 프로세스에서 그림
+# 슬라이더를 끄는 동안에는 최소 간격마다 최신 값만 그림 (utils.coalesce)
+with frame("04", "time_curve"), section("04", "render"):
+    show_rendered_figure(draw_time_curve, args=(x, T))
 
 st.markdown("""
 <div class="mathbox">
@@ -110,6 +112,30 @@ st.markdown("""
 """, unsafe_allow_html=True)
 st.markdown('</div>', unsafe_allow_html=True)
 
+# --------------------- 서버 수 지도 ---------------------
+st.markdown('<h3 class="section">📊 목표 시간 안에 끝내려면 서버가 몇 대 필요할까?</h3>', unsafe_allow_html=True)
+st.markdown('<div class="card">', unsafe_allow_html=True)
+st.write(f"""
+위에서 고른 처리속도 **r = {r}** 에서, 모든 (s, W) 조합에 대해 \(T(x) \le\) 목표 시간이 되는
+**가장 적은 서버 수 x** 를 색으로 나타냈다. (서버 {MAX_SERVERS}대로도 안 되는 칸은 비워 둠)
+""")
+target = st.slider("목표 처리 시간", 0.5, 50.0, 5.0, 0.5)
+
+# 지도는 (r, 목표 시간) 으로만 정해지므로 세션 공용 캐시에 두고 s·W 를 움직일 때는 다시 그리지 않음
+needed = sweep.servers_needed(r, target)
+extent = (sweep.s[0] - 0.5, sweep.s[-1] + 0.5, sweep.W[0] - 25, sweep.W[-1] + 25)
+with frame("04", "servers_needed"), section("04", "heatmap_render"):
+    show_cached_figure(("servers_needed", r, target), draw_servers_needed, (7, 4.5),
+                       args=(needed, extent, r, target))
+
+# 현재 (s, W) 칸의 값
+fewest = sweep.min_servers(s, W, r, target)
+if fewest is None:
+    st.warning(f"현재 설정(s={s}, W={W})에서는 서버 {MAX_SERVERS}대로도 목표 시간 {target} 안에 끝낼 수 없다.")
+else:
+    st.info(f"현재 설정(s={s}, W={W})에서는 서버 **{fewest}대** 이상이면 목표 시간 {target} 안에 끝난다.")
+st.markdown('</div>', unsafe_allow_html=True)
+
 # --------------------- 정리 ---------------------
 st.markdown('<h3 class="section">3️⃣ 정리</h3>', unsafe_allow_html=True)
 st.markdown('<div class="card">', unsafe_allow_html=True)
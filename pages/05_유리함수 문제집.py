@@ -1,6 +1,12 @@
 import streamlit as st
 import random
-from PIL import Image
+
+from utils.assets import show_image_asset
+from utils.expression_problems import PROMPTS, TOPICS, generate_unique
+from utils.metrics import section
+from utils.problem_index import operation_index
+from utils.problem_set import ProblemSet, reset_problem_set, session_problem_set
+from utils.results_store import record_answer
 
 st.set_page_config(page_title="유리함수 문제집", page_icon="📘", layout="centered")
 
@@ -35,41 +41,15 @@ st.title("📗 유리식 문제집 (고1 수준)")
 st.write("유리식의 성질 · 연산 · 유리함수 성질 문제 총 15문제 — 객관식 보기 5개")
 
 # -----------------------
-# 유리식 연산 문제 생성: 결과가 정수(1~100)로 떨어지도록 반복 생성
+# 유리식 연산 문제 생성: 결과가 정수(1~100)인 문제 색인에서 바로 고름
+# (색인은 서버 프로세스당 한 번만 만들어짐)
 # -----------------------
-def generate_rational_operation():
-    for _ in range(500):
-        a = random.randint(1, 12)
-        b = random.randint(1, 12)
-        c = random.randint(1, 12)
-        d = random.randint(1, 12)
-        op = random.choice(["+", "-", "*", "/"])
-
-        if op == "+":
-            expr = f"({a}/{b}) + ({c}/{d})"
-            num = a * d + b * c
-            den = b * d
-        elif op == "-":
-            expr = f"({a}/{b}) - ({c}/{d})"
-            num = a * d - b * c
-            den = b * d
-        elif op == "*":
-            expr = f"({a}/{b}) × ({c}/{d})"
-            num = a * c
-            den = b * d
-        else:
-            expr = f"({a}/{b}) ÷ ({c}/{d})"
-            num = a * d
-            den = b * c
-
-        if den == 0:
-            continue
-        if num % den != 0:
-            continue
-        value = num // den
-        if 1 <= value <= 100:
-            return expr, str(value)
-    return "(1/1) + (1/1)", "2"
+def generate_rational_operation(rng=random, ops=None, value_range=None):
+    """결과가 정수인 분수 연산 문제를 (식, 정답 문자열) 로 돌려줍니다.
+
+    ops 로 연산자(+, -, *, /)를, value_range 로 결과값 범위를 제한할 수 있습니다.
+    """
+    return operation_index().sample(rng, ops=ops, value_range=value_range)
 
 # -----------------------
 # 객관식 개념 문제 (고1 공통수학 수준)
@@ -94,43 +74,70 @@ concept_problems = [
 ]
 
 # -----------------------
-# 문제 조합 만들기
+# 문제 조합 만들기: seed 하나로 15문제를 결정적으로 만들고 세션에 보관
+# (답을 고를 때마다 일어나는 재실행에서는 다시 만들지 않음)
 # -----------------------
-problems = []
-for q, ans, opts in concept_problems:
-    problems.append((q, ans, opts.copy()))
-
-for _ in range(6):
-    expr, correct = generate_rational_operation()
-    wrongs = set()
-    while len(wrongs) < 4:
-        w = str(random.randint(1, 100))
-        if w != correct:
-            wrongs.add(w)
-    options = list(wrongs) + [correct]
-    random.shuffle(options)
-    problems.append((f"다음을 계산하시오: {expr}", correct, options))
-
-problems.append(("유리함수에서 분모가 0이면 어떤 일이 일어나나요?", "정의되지 않는다",
-                 ["정의된다", "무한히 커진다", "정의되지 않는다", "항상 0이 된다", "함수값이 1이 된다"]))
-
-assert len(problems) == 15, f"문제 개수 오류: {len(problems)} (기대값 15)"
+NUM_PROBLEMS = 15
+ANSWER_KEYS = [f"q{i}" for i in range(1, NUM_PROBLEMS + 1)]
+
+def build_problem_set(seed):
+    rng = random.Random(seed)
+    problems = []
+    for q, ans, opts in concept_problems:
+        problems.append((q, ans, opts.copy()))
+
+    for _ in range(3):
+        expr, correct = generate_rational_operation(rng)
+        wrongs = set()
+        while len(wrongs) < 4:
+            w = str(rng.randint(1, 100))
+            if w != correct:
+                wrongs.add(w)
+        options = sorted(wrongs, key=int) + [correct]
+        rng.shuffle(options)
+        problems.append((f"다음을 계산하시오: {expr}", correct, options))
+
+    # 유리식 약분 · 통분 · 곱셈·나눗셈 한 문제씩 (정답 검산, 실수 유형별 오답 보기, 중복 없음)
+    for problem in generate_unique(rng, 3):
+        problems.append((problem.question, problem.answer, list(problem.options)))
+
+    problems.append(("유리함수에서 분모가 0이면 어떤 일이 일어나나요?", "정의되지 않는다",
+                     ["정의된다", "무한히 커진다", "정의되지 않는다", "항상 0이 된다", "함수값이 1이 된다"]))
+
+    assert len(problems) == NUM_PROBLEMS, f"문제 개수 오류: {len(problems)} (기대값 {NUM_PROBLEMS})"
+    return ProblemSet(seed, tuple(problems))
+
+with section("05", "problem_set"):
+    problems = session_problem_set(build_problem_set)
+
+st.button("🔄 새 문제 세트", on_click=reset_problem_set, args=(build_problem_set,),
+          kwargs={"answer_keys": ANSWER_KEYS})
+st.caption(f"문제 세트 번호: {problems.seed}")
 
 # -----------------------
 # 문제 출력 및 채점
 # -----------------------
-st.markdown("## 🧮 문제 풀이 (총 15문제)")
+st.markdown(f"## 🧮 문제 풀이 (총 {NUM_PROBLEMS}문제)")
 score = 0
 
-ganadi_img = None
-try:
-    ganadi_img = Image.open(GANADI_PATH)
-except Exception:
-    ganadi_img = None
+# 답을 고를 때마다 기록 (문제 세트 번호 + 문제 번호로 구분)
+# 자동 생성되는 계산 문제는 세트마다 식이 달라 현황판에서는 종류별로 한 묶음으로 봅니다.
+def problem_topic(question):
+    if question.startswith("다음을 계산하시오"):
+        return "분수 계산 (자동 생성)"
+    for kind, prompt in PROMPTS.items():
+        if question.startswith(prompt):
+            return TOPICS[kind]
+    return question
+
+def record_choice(i, question, answer):
+    choice = st.session_state[f"q{i}"]
+    topic = problem_topic(question)
+    record_answer("05", f"{problems.seed}-q{i}", choice, choice == answer, prompt=question, topic=topic)
 
 for i, (q, answer, opts) in enumerate(problems, start=1):
     st.write(f"### {i}. {q}")
-    choice = st.radio(f"문제 {i} 답 선택:", opts, key=f"q{i}")
+    choice = st.radio(f"문제 {i} 답 선택:", opts, key=f"q{i}", on_change=record_choice, args=(i, q, answer))
 
     if choice:
         if choice == answer:
@@ -138,9 +145,8 @@ for i, (q, answer, opts) in enumerate(problems, start=1):
             score += 1
         else:
             st.error("응 아니야 😅")
-            if ganadi_img:
-                st.image(ganadi_img, caption="가나디: 응 아니야!", use_column_width=False)
-            else:
+            # 오답 이미지는 서버 프로세스당 한 번만 읽어 작게 줄여 둔 것을 씀 (없는 파일도 잠시 기억)
+            if not show_image_asset(GANADI_PATH, caption="가나디: 응 아니야!"):
                 st.warning(f"오답일 때 표시할 이미지({GANADI_PATH})를 찾을 수 없습니다. "
                            "images/IMG_0019.png 파일을 프로젝트의 images 폴더에 넣어주세요.")
 
@@ -1,8 +1,10 @@
 import streamlit as st
 import random
-from sympy import symbols, simplify, Function, Eq
-import numpy as np
-import matplotlib.pyplot as plt
+
+from utils.grading import same_linear_fractional
+from utils.metrics import section
+from utils.results_store import record_answer
+from utils.session_store import page_state
 
 # -----------------
 # 1. 앱 설정 및 제목
@@ -62,6 +64,12 @@ def generate_problem():
     st.session_state.user_inv_d = 0
 
 
+# 문제·채점 여부·입력값은 세션 저장소에도 두어, 다른 서버 프로세스로 연결되거나
+# 서버를 다시 시작해도 같은 문제를 이어서 풉니다. (utils.session_store, 주소의 ?sid=)
+STATE_KEYS = ("problem_a", "problem_b", "problem_c", "problem_d", "checked", "show_graph",
+              "user_inv_a", "user_inv_b", "user_inv_c", "user_inv_d")
+state = page_state("06", STATE_KEYS)
+
 # 초기 문제 생성 및 입력값 초기화 (앱 시작 시)
 if 'problem_a' not in st.session_state:
     generate_problem()
@@ -96,12 +104,16 @@ st.markdown("---")
 # 5. 사용자 입력 및 채점 로직
 # -----------------
 
-x = symbols('x')
-
 def check_answer():
-    """사용자 입력과 정답을 SymPy를 사용하여 비교하고 채점합니다."""
+    """사용자 입력과 정답을 정수 교차곱으로 비교하고 채점합니다. (필요할 때만 SymPy 사용)
+
+    결과는 st.session_state.feedback 에 남기고, 표시는 아래 풀이 영역이 합니다.
+    (풀이 영역만 다시 실행될 때 콜백에서 그린 요소는 페이지 맨 위로 가기 때문)
+    """
     st.session_state.checked = True
-    
+
+    a, b, c, d = (st.session_state[f"problem_{k}"] for k in "abcd")
+
     # 정답 계수
     inv_a_true = -d
     inv_b_true = b
@@ -113,37 +125,38 @@ def check_answer():
     user_b = st.session_state.user_inv_b
     user_c = st.session_state.user_inv_c
     user_d = st.session_state.user_inv_d
+    question = f"({a}, {b}, {c}, {d})"
+    answer = f"({user_a}, {user_b}, {user_c}, {user_d})"
 
     is_correct = False
     
     # C=0 예외 처리
     if user_c == 0:
-        st.error("❌ **오답입니다.** 역함수 $f^{-1}(x)$가 유리함수 형태를 유지하려면, 분모 $x$ 계수 (C)는 0이 아니어야 합니다.")
+        st.session_state.feedback = "c_zero"
         st.session_state.checked = False
+        record_answer("06", question, answer, False, topic="역함수 구하기")
         return
 
-    # SymPy 계산 로직
-    true_inverse_func = (inv_a_true * x + inv_b_true) / (inv_c_true * x + inv_d_true)
-    
-    try:
-        user_inverse_func = (user_a * x + user_b) / (user_c * x + user_d)
-        difference = simplify(user_inverse_func - true_inverse_func)
-        is_correct = (difference == 0)
-        
-    except Exception:
-        is_correct = False
-        
-    
-    # -----------------
-    # 채점 결과 및 피드백 표시
-    # -----------------
-    if is_correct:
+    # (Ax+B)(C'x+D') = (A'x+B')(Cx+D) 인지 정수 계산으로 바로 판정
+    with section("06", "grading"):
+        is_correct = same_linear_fractional((user_a, user_b, user_c, user_d),
+                                            (inv_a_true, inv_b_true, inv_c_true, inv_d_true))
+    record_answer("06", question, answer, is_correct, topic="역함수 구하기")
+    st.session_state.feedback = "correct" if is_correct else "wrong"
+    st.session_state.show_graph = is_correct
+
+
+def show_feedback(feedback):
+    """check_answer() 의 채점 결과 및 피드백 표시 (정답 확인을 누른 직후 한 번만)."""
+    if feedback == "c_zero":
+        st.error("❌ **오답입니다.** 역함수 $f^{-1}(x)$가 유리함수 형태를 유지하려면, 분모 $x$ 계수 (C)는 0이 아니어야 합니다.")
+    elif feedback == "correct":
         st.success("🎉 **정답입니다!** 역함수 공식을 완벽하게 이해했어요.")
-        st.session_state.show_graph = True 
-    else:
+    elif feedback == "wrong":
+        a, b, c, d = (st.session_state[f"problem_{k}"] for k in "abcd")
+        inv_a_true, inv_b_true, inv_c_true, inv_d_true = -d, b, c, -a
         st.error("❌ **오답입니다.** 다시 한번 공식을 확인하고 풀어보세요.")
-        st.session_state.show_graph = False
-        
+
         # 🌟 수정/강조: 정답 수식 문자열을 별도로 생성하여 오류 방지
         correct_latex = r'f^{-1}(x) = \frac{%sx + %s}{%sx + %s}' % (inv_a_true, inv_b_true, inv_c_true, inv_d_true)
 
@@ -160,118 +173,67 @@ def check_answer():
         st.latex(correct_latex)
 
 
-st.subheader("🔑 정답 입력")
-st.markdown("$$f^{-1}(x) = \frac{A x + B}{C x + D}$$ 일 때, 정수 계수 A, B, C, D의 값을 입력하세요.")
+def request_new_problem():
+    generate_problem()
+    st.session_state.show_graph = False
+    st.session_state.new_problem_requested = True
 
-col1, col2 = st.columns(2)
-with col1:
-    user_inv_a = st.number_input("분자 $x$ 계수 (A):", key="user_inv_a", value=st.session_state.user_inv_a, format="%d")
-    user_inv_b = st.number_input("분자 상수항 (B):", key="user_inv_b", value=st.session_state.user_inv_b, format="%d")
 
-with col2:
-    user_inv_c = st.number_input("분모 $x$ 계수 (C):", key="user_inv_c", value=st.session_state.user_inv_c, format="%d")
-    user_inv_d = st.number_input("분모 상수항 (D):", key="user_inv_d", value=st.session_state.user_inv_d, format="%d")
+if 'show_graph' not in st.session_state:
+    st.session_state.show_graph = False
 
 
-col_btn1, col_btn2 = st.columns(2)
+# -----------------
+# 입력·채점·그래프 영역: 숫자를 바꾸거나 정답을 확인하면 이 부분만 다시 실행됩니다.
+# (위쪽 개념 설명과 문제 수식은 다시 만들지 않음)
+# -----------------
+@st.fragment
+def answer_section():
+    # 새 문제는 위쪽 문제 수식도 바꿔야 하므로 앱 전체를 다시 실행
+    if st.session_state.pop("new_problem_requested", False):
+        st.rerun()
 
-with col_btn1:
-    st.button("✅ 정답 확인", on_click=check_answer)
+    st.subheader("🔑 정답 입력")
+    st.markdown("$$f^{-1}(x) = \frac{A x + B}{C x + D}$$ 일 때, 정수 계수 A, B, C, D의 값을 입력하세요.")
 
-with col_btn2:
-    # 새 문제 버튼 클릭 시 그래프 숨김
-    st.button("🔄 새 문제", on_click=lambda: (generate_problem(), setattr(st.session_state, 'show_graph', False)))
+    col1, col2 = st.columns(2)
+    with col1:
+        st.number_input("분자 $x$ 계수 (A):", key="user_inv_a", value=st.session_state.user_inv_a, format="%d")
+        st.number_input("분자 상수항 (B):", key="user_inv_b", value=st.session_state.user_inv_b, format="%d")
 
+    with col2:
+        st.number_input("분모 $x$ 계수 (C):", key="user_inv_c", value=st.session_state.user_inv_c, format="%d")
+        st.number_input("분모 상수항 (D):", key="user_inv_d", value=st.session_state.user_inv_d, format="%d")
 
-# -----------------
-# 6. 그래프 시각화 섹션
-# -----------------
+    col_btn1, col_btn2 = st.columns(2)
 
-if 'show_graph' not in st.session_state:
-    st.session_state.show_graph = False
+    with col_btn1:
+        st.button("✅ 정답 확인", on_click=check_answer)
 
+    with col_btn2:
+        # 새 문제 버튼 클릭 시 그래프 숨김
+        st.button("🔄 새 문제", on_click=request_new_problem)
 
-if st.session_state.checked and st.session_state.show_graph:
-    st.markdown("---")
-    st.header("3. 함수와 역함수의 그래프 비교")
+    show_feedback(st.session_state.pop("feedback", None))
 
-    # 계수 정의
-    a, b, c, d = st.session_state.problem_a, st.session_state.problem_b, st.session_state.problem_c, st.session_state.problem_d
-    
-    # 정답 역함수 계수
-    inv_a, inv_b, inv_c, inv_d = -d, b, c, -a
+    # -----------------
+    # 6. 그래프 시각화 섹션
+    # -----------------
+    if st.session_state.checked and st.session_state.show_graph:
+        st.markdown("---")
+        st.header("3. 함수와 역함수의 그래프 비교")
 
-    # 점근선 계산
-    va_f = -d / c  # f(x)의 세로 점근선
-    ha_f = a / c   # f(x)의 가로 점근선
+        # 문제 공간이 유한하므로 (a, b, c, d) 별 그림을 메모리·디스크 캐시에서 꺼내 옴
+        # (없을 때만 그리며, 그래프·계산 라이브러리도 그때 불러옵니다)
+        from utils.inverse_plot import show_inverse_comparison
 
-    va_inv = -inv_d / inv_c # f^-1(x)의 세로 점근선 (ha_f와 같음)
-    ha_inv = inv_a / inv_c  # f^-1(x)의 가로 점근선 (va_f와 같음)
-    
-    # 함수 정의 (그래프용)
-    def func_f(x):
-        return (a * x + b) / (c * x + d)
+        a, b, c, d = (st.session_state[f"problem_{k}"] for k in "abcd")
 
-    def func_inv(x):
-        return (inv_a * x + inv_b) / (inv_c * x + inv_d)
+        with section("06", "render"):
+            show_inverse_comparison(a, b, c, d)
 
-    # 그래프 범위 설정
-    # 점근선 주변 5 범위로 설정
-    x_range_min = min(va_f, va_inv) - 5
-    x_range_max = max(va_f, va_inv) + 5
-    
-    # 점근선 주변 분리
-    x1_f = np.linspace(x_range_min, va_f - 0.1, 300)
-    x2_f = np.linspace(va_f + 0.1, x_range_max, 300)
-    
-    x1_inv = np.linspace(x_range_min, va_inv - 0.1, 300)
-    x2_inv = np.linspace(va_inv + 0.1, x_range_max, 300)
-    
-    # y 값 계산
-    y1_f = func_f(x1_f)
-    y2_f = func_f(x2_f)
-    
-    y1_inv = func_inv(x1_inv)
-    y2_inv = func_inv(x2_inv)
+    # 이번 실행에서 바뀐 값만 저장소에 씀 (콜백·입력 변경은 모두 이 영역의 실행으로 이어짐)
+    state.save()
 
-    # Matplotlib 그리기
-    fig, ax = plt.subplots(figsize=(8, 8))
-    
-    # 1. f(x) 그래프
-    ax.plot(x1_f, y1_f, label=r'$f(x)$', color='blue')
-    ax.plot(x2_f, y2_f, color='blue')
-
-    # 2. f^-1(x) 그래프
-    ax.plot(x1_inv, y1_inv, label=r'$f^{-1}(x)$', color='orange')
-    ax.plot(x2_inv, y2_inv, color='orange')
-
-    # 3. 점근선 표시
-    # 원래 함수 점근선 (파란색)
-    ax.axvline(va_f, color='blue', linestyle='--', linewidth=1, alpha=0.6)
-    ax.axhline(ha_f, color='blue', linestyle='--', linewidth=1, alpha=0.6)
-    
-    # 역함수 점근선 (주황색)
-    ax.axvline(va_inv, color='orange', linestyle=':', linewidth=1, alpha=0.6)
-    ax.axhline(ha_inv, color='orange', linestyle=':', linewidth=1, alpha=0.6)
-    
-    # 4. y=x 대칭선
-    ax.plot([-10, 10], [-10, 10], color='gray', linestyle='-.', linewidth=1, alpha=0.5, label='$y=x$')
-    
-    # 그래프 설정
-    ax.set_title(r'$f(x)$와 $f^{-1}(x)$ 그래프 (y=x 대칭 확인)')
-    ax.set_xlabel('$x$')
-    ax.set_ylabel('$y$')
-    # 축 범위는 그래프 데이터 범위 기반으로 설정 (너무 극단적인 값은 제외)
-    y_lim_min = min(min(y1_f), min(y2_f), min(y1_inv), min(y2_inv))
-    y_lim_max = max(max(y1_f), max(y2_f), max(y1_inv), max(y2_inv))
-    
-    # 너무 큰 발산 값은 무시하고 적절한 범위로 제한 (예: -10에서 10)
-    y_lim = 10
-    ax.set_xlim(x_range_min, x_range_max)
-    ax.set_ylim(-y_lim, y_lim) 
-    
-    ax.grid(True, linestyle=':', alpha=0.7)
-    ax.legend(loc='lower right')
-    ax.set_aspect('equal', adjustable='box') 
 
-    st.pyplot(fig)
+answer_section()
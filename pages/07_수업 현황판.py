@@ -0,0 +1,87 @@
+import hmac
+import os
+
+import streamlit as st
+
+from utils.class_stats import class_aggregate, reset_class_stats
+
+st.set_page_config(page_title="수업 현황판", page_icon="📊", layout="wide")
+
+# 배경색 설정 (RGB 203,147,160)
+st.markdown(
+    """
+    <style>
+    .stApp { background-color: rgb(203,147,160); }
+    </style>
+    """,
+    unsafe_allow_html=True
+)
+
+st.title("📊 수업 현황판 (선생님용)")
+st.write("3쪽 학습 확인 퀴즈, 5쪽 문제집, 6쪽 역함수 문제의 응답을 학생마다 마지막 답 기준으로 실시간 집계합니다.")
+
+# -----------------------
+# 선생님 확인: 이 페이지는 학생 화면의 목록에도 보이므로, MATHHH_TEACHER_KEY 와 같은 값을
+# 입력해야만 볼 수 있습니다. 키가 설정되지 않았으면 아무도 볼 수 없습니다.
+# -----------------------
+TEACHER_KEY = os.environ.get("MATHHH_TEACHER_KEY", "")
+if not TEACHER_KEY:
+    st.warning("서버에 선생님 확인 코드(MATHHH_TEACHER_KEY)가 설정되어 있지 않아 현황판을 열 수 없습니다. "
+               "서버를 실행할 때 MATHHH_TEACHER_KEY 환경 변수를 설정하세요.")
+    st.stop()
+if not hmac.compare_digest(st.text_input("선생님 확인 코드", type="password").encode(), TEACHER_KEY.encode()):
+    st.info("선생님 확인 코드를 입력하세요.")
+    st.stop()
+
+PAGE_NAMES = {"03": "3쪽 퀴즈", "05": "5쪽 문제집", "06": "6쪽 역함수"}
+
+col1, col2 = st.columns([3, 1])
+with col1:
+    refresh = st.select_slider("자동 새로 고침 간격(초)", [1, 2, 5, 10, 30], value=2)
+with col2:
+    st.button("🧹 새 수업 시작 (집계 비우기)", on_click=reset_class_stats)
+
+
+# -----------------------
+# 현황: 이 부분만 주기적으로 다시 실행됨 (집계 스냅숏은 문제 수에만 비례)
+# -----------------------
+@st.fragment(run_every=refresh)
+def live_board():
+    students, rows = class_aggregate().snapshot()
+    answered = sum(r["answered"] for r in rows)
+    correct = sum(r["correct"] for r in rows)
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric("참여 학생", students)
+    m2.metric("응답 수", answered)
+    m3.metric("전체 정답률", f"{correct / answered:.0%}" if answered else "-")
+
+    if not rows:
+        st.info("아직 들어온 응답이 없습니다.")
+        return
+
+    table = []
+    for r in rows:
+        wrong = r["answered"] - r["correct"]
+        wrong_choices = [(count, choice) for (choice, ok), count in r["choices"].items() if not ok]
+        top_count, top_choice = max(wrong_choices) if wrong_choices else (0, "")
+        table.append({
+            "페이지": PAGE_NAMES.get(r["page"], r["page"]),
+            "문제": r["topic"],
+            "응답": r["answered"],
+            "오답": wrong,
+            "오답률": wrong / r["answered"] if r["answered"] else 0.0,
+            "가장 많이 고른 오답": f"{top_choice} ({top_count}명)" if top_count else "-",
+        })
+    table.sort(key=lambda row: (-row["오답률"], -row["응답"]))
+
+    st.subheader("많이 틀린 문제 순")
+    st.dataframe(
+        table,
+        width="stretch",
+        hide_index=True,
+        column_config={"오답률": st.column_config.ProgressColumn("오답률", format="percent", min_value=0.0, max_value=1.0)},
+    )
+
+
+live_board()
@@ -0,0 +1,101 @@
+import streamlit as st
+
+from utils.figures import show_cached_figure
+from utils.metrics import section
+from utils.rational_analysis import ASYMPTOTE_NAMES, analysis_cache_info, analyze, draw_analysis
+
+# 배경색 설정 (RGB 203,147,160)
+st.markdown(
+    """
+    <style>
+    .stApp { background-color: rgb(203,147,160); }
+    </style>
+    """,
+    unsafe_allow_html=True
+)
+
+st.title("🔭 유리함수 탐험실")
+st.markdown("""
+분자 P(x) 와 분모 Q(x) 의 계수를 직접 넣어 보고, **차수에 따라 점근선이 어떻게 달라지는지** 살펴봅시다.
+계수는 높은 차수부터 쉼표로 구분해 적습니다. (예: x² − 4 → `1, 0, -4`)
+""")
+
+# 이름: (분자 계수, 분모 계수)
+EXAMPLES = {
+    "수평점근선: (2x + 1)/(x − 3)": ("2, 1", "1, -3"),
+    "구멍: (x² − 1)/(x − 1)": ("1, 0, -1", "1, -1"),
+    "사선 점근선: (x² + 1)/x": ("1, 0, 1", "1, 0"),
+    "곡선 점근선: (x³ − 2)/(x − 1)": ("1, 0, 0, -2", "1, -1"),
+    "수직점근선 두 개: x/(x² − 4)": ("1, 0", "1, 0, -4"),
+}
+
+example = st.selectbox("예시 고르기", list(EXAMPLES))
+num_default, den_default = EXAMPLES[example]
+
+col1, col2 = st.columns(2)
+with col1:
+    num_text = st.text_input("분자 P(x) 의 계수", num_default, key=f"num_{example}")
+with col2:
+    den_text = st.text_input("분모 Q(x) 의 계수", den_default, key=f"den_{example}")
+
+
+def parse_coefficients(text):
+    return [float(part) for part in text.replace(" ", "").split(",") if part]
+
+
+# -----------------------
+# 분석: 같은 계수는 서버 전체가 함께 쓰는 캐시에서 꺼내므로 기호 계산을 다시 하지 않음
+# -----------------------
+try:
+    with section("08", "analysis"):
+        result = analyze(parse_coefficients(num_text), parse_coefficients(den_text))
+except ValueError as e:
+    st.error(f"⚠️ 계수를 읽을 수 없습니다: {e}")
+    st.stop()
+
+st.latex(rf"f(x) = {result.latex}")
+if result.common_factor_latex:
+    st.latex(rf"= {result.reduced_latex} \quad (\text{{공통인수 }} {result.common_factor_latex} \text{{ 약분}})")
+
+
+def join_values(values):
+    return ", ".join(f"${v.latex}$" for v in values)
+
+
+kind = result.asymptote_kind
+lines = []
+if result.vertical:
+    lines.append("- 수직점근선: " + ", ".join(f"$x = {v.latex}$" for v in result.vertical))
+else:
+    lines.append("- 수직점근선: 없음")
+if kind == "none":
+    lines.append(f"- 점근선: {ASYMPTOTE_NAMES[kind]}")
+else:
+    lines.append(f"- {ASYMPTOTE_NAMES[kind]}: $y = {result.asymptote_latex}$")
+if result.holes:
+    lines.append("- 구멍(정의되지 않는 점): " + ", ".join(f"$({x.latex},\\ {y.latex})$" for x, y in result.holes))
+lines.append("- x절편: " + (join_values(result.x_intercepts) if result.x_intercepts else "없음"))
+lines.append("- y절편: " + (f"${result.y_intercept.latex}$" if result.y_intercept is not None else "없음 (x = 0 에서 정의되지 않음)"))
+st.markdown("\n".join(lines))
+
+st.caption({
+    "horizontal": "분자의 차수 ≤ 분모의 차수 → 수평점근선",
+    "oblique": "분자의 차수 = 분모의 차수 + 1 → 나눗셈의 몫(일차식)이 사선 점근선",
+    "curvilinear": "분자의 차수 ≥ 분모의 차수 + 2 → 나눗셈의 몫(이차 이상)을 따라가는 곡선 점근선",
+    "none": "약분하면 분모가 상수 → 다항함수 (구멍만 남음)",
+}[kind])
+
+# -----------------------
+# 그래프
+# -----------------------
+FIGSIZE = (6, 6)
+view = st.slider("보기 범위 (−r ~ r)", 2, 20, 10, 1)
+
+# 그림도 (계수, 보기 범위) 를 키로 세션 공용 캐시에 보관
+with section("08", "render"):
+    show_cached_figure(("rational_analysis", result.num, result.den, view), draw_analysis, FIGSIZE,
+                       args=(result, view))
+
+if "plotinfo" in st.query_params:
+    info = analysis_cache_info()
+    st.caption(f"분석 캐시: hits {info.hits}, misses {info.misses}, size {info.currsize}/{info.maxsize}")
@@ -0,0 +1,29 @@
+"""서버 실행 스크립트: 무거운 라이브러리와 캐시를 미리 데운 뒤 Streamlit 을 띄웁니다.
+
+    python run.py [--skip-budget] [streamlit run 옵션...]
+
+시작할 때 페이지별 import 시간을 예산과 비교해 출력하므로, 느려진 페이지가 바로 보입니다.
+"""
+import logging
+import sys
+
+from streamlit.web import cli as stcli
+
+from utils.warmup import import_budget_report, log_import_budget, prewarm
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("run")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if "--skip-budget" in args:
+        args.remove("--skip-budget")
+    else:
+        log_import_budget(import_budget_report())
+
+    timings = prewarm()
+    logger.info("[prewarm] %.2fs (%s)", sum(timings.values()),
+                ", ".join(f"{name} {t:.2f}s" for name, t in timings.items()))
+
+    sys.argv = ["streamlit", "run", "main.py", *args]
+    sys.exit(stcli.main())
@@ -0,0 +1,6 @@
+"""pytest 설정: 저장소 최상위를 import 경로에 넣어 utils 를 바로 불러옵니다."""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
@@ -0,0 +1,101 @@
+"""utils.class_stats 수업 응답 집계."""
+import random
+import threading
+import types
+
+import pytest
+
+from utils import class_stats
+from utils.class_stats import ClassAggregate
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """스레드마다 따로인 st.session_state 와 이 시험만의 집계."""
+    local = threading.local()
+
+    class _St:
+        @property
+        def session_state(self):
+            if not hasattr(local, "state"):
+                local.state = {}
+            return local.state
+
+    aggregate = ClassAggregate(stripes=4)
+    monkeypatch.setattr(class_stats, "st", _St())
+    monkeypatch.setattr(class_stats, "class_aggregate", lambda: aggregate)
+    return types.SimpleNamespace(aggregate=aggregate)
+
+
+def _rows(aggregate):
+    students, rows = aggregate.snapshot()
+    return students, {(r["page"], r["topic"]): r for r in rows}
+
+
+def test_changed_answer_replaces_the_previous_one(sessions):
+    class_stats.count_answer("03", "q1", "q1", "A", False)
+    class_stats.count_answer("03", "q1", "q1", "B", True)
+    students, rows = _rows(sessions.aggregate)
+    assert students == 1
+    assert rows["03", "q1"]["answered"] == 1 and rows["03", "q1"]["correct"] == 1
+    assert rows["03", "q1"]["choices"] == {("B", True): 1}
+
+
+def test_answer_after_reset_is_a_new_student_without_previous(sessions):
+    class_stats.count_answer("03", "q1", "q1", "A", True)
+    sessions.aggregate.reset()
+    assert _rows(sessions.aggregate) == (0, {})
+    class_stats.count_answer("03", "q1", "q1", "B", False)
+    students, rows = _rows(sessions.aggregate)
+    assert students == 1
+    assert rows["03", "q1"]["answered"] == 1 and rows["03", "q1"]["correct"] == 0
+
+
+def test_stale_previous_is_ignored():
+    aggregate = ClassAggregate()
+    aggregate.update("03", "q1", "A", True, generation=0)
+    aggregate.reset()
+    applied = aggregate.update("03", "q1", "B", False, previous=("A", True), generation=0)
+    assert applied == 1
+    _, rows = aggregate.snapshot()
+    assert rows == [{"page": "03", "topic": "q1", "answered": 1, "correct": 0, "choices": {("B", False): 1}}]
+
+
+def test_reset_concurrent_with_updates_keeps_counts_consistent(sessions):
+    aggregate = sessions.aggregate
+    questions = [f"q{i}" for i in range(6)]
+    n_students = 8
+    stop = threading.Event()
+    bad = []
+
+    def student(seed):
+        rng = random.Random(seed)
+        while not stop.is_set():
+            q = rng.choice(questions)
+            class_stats.count_answer("05", q, q, rng.choice("ABC"), rng.random() < 0.5)
+        # 마지막 수업: 모든 문제에 한 번씩 더 답함
+        for q in questions:
+            class_stats.count_answer("05", q, q, "A", True)
+
+    def teacher():
+        for _ in range(200):
+            aggregate.reset()
+            _, rows = aggregate.snapshot()
+            bad.extend(r for r in rows if not 0 <= r["correct"] <= r["answered"])
+        stop.set()
+
+    threads = [threading.Thread(target=student, args=(i,)) for i in range(n_students)]
+    threads.append(threading.Thread(target=teacher))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not bad
+    students, rows = _rows(aggregate)
+    assert students == n_students
+    for q in questions:
+        row = rows["05", q]
+        assert row["answered"] == n_students
+        assert 0 <= row["correct"] <= row["answered"]
+        assert sum(row["choices"].values()) == n_students
@@ -0,0 +1,90 @@
+"""utils.expression_problems 유리식 문제 생성기."""
+import random
+import re
+
+import pytest
+
+from utils.expression_problems import (KINDS, NUM_OPTIONS, ONE, Expr, format_den, format_poly, generate,
+                                       generate_unique, linear, pmul)
+
+_SUPERSCRIPT_DIGITS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹", "0123456789")
+
+
+def _parse(text):
+    """학생용 표기를 SymPy 식으로 읽습니다. (x² → x**2, × → *, ÷ → /, (x + 1)(x - 2) 는 곱)"""
+    from sympy.parsing.sympy_parser import (implicit_multiplication_application, parse_expr,
+                                            standard_transformations)
+
+    text = re.sub(r"[⁰¹²³⁴⁵⁶⁷⁸⁹]+", lambda m: "**" + m.group().translate(_SUPERSCRIPT_DIGITS), text)
+    text = text.replace("×", "*").replace("÷", "/")
+    return parse_expr(text, transformations=standard_transformations + (implicit_multiplication_application,))
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_sympy_round_trip(kind):
+    sympy = pytest.importorskip("sympy")
+    rng = random.Random(kind)
+    for _ in range(60):
+        problem = generate(rng, kind)
+        question = _parse(problem.question.split(": ", 1)[1])
+        assert sympy.cancel(question - _parse(problem.answer)) == 0, problem
+        for option in problem.options:
+            if option != problem.answer:
+                assert sympy.cancel(question - _parse(option)) != 0, (problem, option)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_options_are_distinct_and_include_the_answer(kind):
+    rng = random.Random(3)
+    for _ in range(200):
+        problem = generate(rng, kind)
+        assert problem.kind == kind
+        assert len(problem.options) == NUM_OPTIONS == len(set(problem.options))
+        assert problem.answer in problem.options
+
+
+def test_generate_unique_never_repeats_a_key():
+    rng = random.Random(11)
+    seen = set()
+    first = generate_unique(rng, 3, seen=seen)
+    assert [p.kind for p in first] == list(KINDS)
+    second = generate_unique(rng, 30, seen=seen)
+    keys = [p.key for p in first + second]
+    assert len(keys) == len(set(keys)) == len(seen)
+
+
+def test_generate_unique_gives_up_after_max_attempts():
+    with pytest.raises(ValueError):
+        generate_unique(random.Random(0), 2, max_attempts=1)
+
+
+def test_reduced_cancels_common_linear_factors():
+    expr = Expr(pmul(linear(2), linear(-3)), pmul(linear(2), linear(1)))
+    assert expr.reduced() == Expr(linear(-3), linear(1))
+    assert Expr((0,), linear(4)).reduced() == Expr((0,), ONE)
+    assert Expr((-2, -4), (-2, 6)).normalized() == Expr((1, 2), (1, -3))
+
+
+@pytest.mark.parametrize("expr, text", [
+    (Expr((1,), (1, 0, 0)), "1/x²"),
+    (Expr((9,), (2, 0)), "9/(2x)"),
+    (Expr((1, 1), (1, -2)), "(x + 1)/(x - 2)"),
+    (Expr((1, 0, -1), pmul(linear(1), linear(-2))), "(x² - 1)/((x + 1)(x - 2))"),
+    (Expr((3,), pmul(linear(1), linear(1))), "3/(x + 1)²"),
+    (Expr((2, 5)), "2x + 5"),
+])
+def test_text_brackets_only_where_needed(expr, text):
+    assert expr.text() == text
+
+
+def test_operand_wraps_whole_fractions():
+    assert Expr((5,), linear(1)).operand() == "(5/(x + 1))"
+    assert Expr(linear(-3)).operand() == "x - 3"
+
+
+def test_format_helpers():
+    assert format_poly((1, -3, 0, 2)) == "x³ - 3x² + 2"
+    assert format_poly((-1, 0)) == "-x"
+    assert format_poly((0,)) == "0"
+    assert format_den(pmul(linear(0), linear(-4))) == "x(x - 4)"
+    assert format_den((1, 0, 1)) == "x² + 1"
@@ -0,0 +1,51 @@
+"""utils.grading 일차분수함수 답안 채점."""
+from fractions import Fraction
+
+import pytest
+
+from utils.grading import same_linear_fractional
+
+
+@pytest.mark.parametrize("p, q", [
+    ((1, 2, 3, 4), (1, 2, 3, 4)),
+    ((1, 2, 3, 4), (-2, -4, -6, -8)),
+    ((2, -1, 1, 3), (1.0, -0.5, 0.5, 1.5)),
+    ((Fraction(1, 3), 1, 1, 0), (1, 3, 3, 0)),
+    ((0, 5, 0, 1), (0, 10, 0, 2)),
+])
+def test_equivalent_answers_are_accepted(p, q):
+    assert same_linear_fractional(p, q)
+    assert same_linear_fractional(q, p)
+
+
+@pytest.mark.parametrize("p, q", [
+    ((1, 2, 3, 4), (1, 2, 3, 5)),
+    ((1, 2, 3, 4), (2, 1, 4, 3)),
+    ((1, 0, 1, 0), (2, 0, 1, 0)),
+    ((0.1, 0.2, 1, 1), (0.1, 0.2000001, 1, 1)),
+])
+def test_different_functions_are_rejected(p, q):
+    assert not same_linear_fractional(p, q)
+
+
+def test_zero_denominator_is_never_equal():
+    assert not same_linear_fractional((1, 2, 0, 0), (1, 2, 0, 0))
+    assert not same_linear_fractional((1, 2, 3, 4), (2, 4, 0, 0))
+
+
+def test_float_inputs_are_compared_exactly():
+    # 0.1 + 0.2 != 0.3 이므로 근삿값 비교라면 통과했을 답도 정확히 가릅니다.
+    assert not same_linear_fractional((0.1 + 0.2, 0, 1, 0), (0.3, 0, 1, 0))
+    assert same_linear_fractional((0.5, 0.25, 1, 0), (2, 1, 4, 0))
+
+
+def test_bool_and_non_finite_inputs_are_rejected():
+    assert not same_linear_fractional((True, 0, 1, 0), (1, 0, 1, 0))
+    assert not same_linear_fractional((float("nan"), 0, 1, 0), (float("nan"), 0, 1, 0))
+    assert not same_linear_fractional((float("inf"), 0, 1, 0), (1, 0, 1, 0))
+
+
+def test_symbolic_inputs_fall_back_to_sympy():
+    pytest.importorskip("sympy")
+    assert same_linear_fractional(("sqrt(2)", 0, 1, 1), ("sqrt(8)", 0, 2, 2))
+    assert not same_linear_fractional(("sqrt(2)", 0, 1, 1), ("sqrt(3)", 0, 1, 1))
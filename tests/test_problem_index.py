@@ -0,0 +1,81 @@
+"""utils.problem_index 분수 연산 문제 색인."""
+import random
+import re
+from fractions import Fraction
+
+import pytest
+
+from utils.problem_index import OPERATORS, OperationIndex, operation_index
+
+_PROBLEM = re.compile(r"\((\d+)/(\d+)\) ([+\-×÷]) \((\d+)/(\d+)\)")
+_APPLY = {
+    "+": lambda p, q: p + q,
+    "-": lambda p, q: p - q,
+    "×": lambda p, q: p * q,
+    "÷": lambda p, q: p / q,
+}
+
+
+def _solve(text):
+    a, b, op, c, d = _PROBLEM.fullmatch(text).groups()
+    return _APPLY[op](Fraction(int(a), int(b)), Fraction(int(c), int(d)))
+
+
+@pytest.fixture(scope="module")
+def small_index():
+    return OperationIndex(low=1, high=6, value_range=(1, 20))
+
+
+def test_every_indexed_problem_has_its_integer_answer(small_index):
+    for op in OPERATORS:
+        for value, problems in small_index.buckets[op].items():
+            assert 1 <= value <= 20
+            for a, b, c, d in problems:
+                text = f"({a}/{b}) {'+-×÷'[OPERATORS.index(op)]} ({c}/{d})"
+                assert _solve(text) == value
+
+
+def test_index_is_complete(small_index):
+    expected = 0
+    numbers = range(1, 7)
+    for sym in "+-×÷":
+        for a in numbers:
+            for b in numbers:
+                for c in numbers:
+                    for d in numbers:
+                        value = _solve(f"({a}/{b}) {sym} ({c}/{d})")
+                        expected += value.denominator == 1 and 1 <= value <= 20
+    assert small_index.count() == expected
+
+
+def test_sample_returns_a_matching_problem(small_index):
+    rng = random.Random(7)
+    for _ in range(200):
+        text, answer = small_index.sample(rng, ops=("*", "/"), value_range=(2, 5))
+        assert _PROBLEM.fullmatch(text).group(3) in "×÷"
+        assert _solve(text) == int(answer)
+        assert 2 <= int(answer) <= 5
+
+
+def test_count_respects_operator_and_value_filters(small_index):
+    total = small_index.count()
+    by_op = sum(small_index.count(ops=(op,)) for op in OPERATORS)
+    assert by_op == total
+    assert small_index.count(value_range=(1, 20)) == total
+    assert small_index.count(value_range=(3, 3)) == sum(len(small_index.buckets[op].get(3, ())) for op in OPERATORS)
+
+
+def test_sample_without_matches_raises(small_index):
+    with pytest.raises(ValueError):
+        small_index.sample(random.Random(0), ops=("-",), value_range=(19, 20))
+
+
+def test_sample_is_uniform_over_matches():
+    index = OperationIndex(low=1, high=3, value_range=(1, 10))
+    rng = random.Random(1)
+    seen = {index.sample(rng)[0] for _ in range(3000)}
+    assert len(seen) == index.count()
+
+
+def test_default_index_is_shared():
+    assert operation_index() is operation_index()
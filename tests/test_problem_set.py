@@ -0,0 +1,69 @@
+"""utils.problem_set 과 문제집 페이지의 seed 로 만든 문제 세트."""
+import glob
+import os
+import types
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from utils import problem_set
+from utils.problem_set import ProblemSet, reset_problem_set, session_problem_set
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGE = glob.glob(os.path.join(ROOT, "pages", "05_*.py"))[0]
+
+
+@pytest.fixture
+def fake_st(monkeypatch):
+    fake = types.SimpleNamespace(session_state={})
+    monkeypatch.setattr(problem_set, "st", fake)
+    return fake
+
+
+def counting_build():
+    seeds = []
+
+    def build(seed):
+        seeds.append(seed)
+        return ProblemSet(seed, (("문제", "1", ("1", "2")),))
+
+    return build, seeds
+
+
+def test_session_problem_set_builds_once_per_session(fake_st, monkeypatch):
+    monkeypatch.setattr(problem_set, "new_seed", lambda: 7)
+    build, seeds = counting_build()
+    first = session_problem_set(build)
+    assert session_problem_set(build) is first
+    assert seeds == [7] and first.seed == 7 and len(first) == 1
+
+
+def test_reset_builds_new_set_and_clears_answers(fake_st, monkeypatch):
+    monkeypatch.setattr(problem_set, "new_seed", iter([1, 2]).__next__)
+    build, seeds = counting_build()
+    session_problem_set(build)
+    fake_st.session_state.update(q1="1", q2="2", other="keep")
+    reset_problem_set(build, answer_keys=("q1", "q2"))
+    assert seeds == [1, 2]
+    assert fake_st.session_state["problem_set"].seed == 2
+    assert "q1" not in fake_st.session_state and "q2" not in fake_st.session_state
+    assert fake_st.session_state["other"] == "keep"
+
+
+def rendered_problems(seed, monkeypatch):
+    monkeypatch.setattr(problem_set, "new_seed", lambda: seed)
+    at = AppTest.from_file(PAGE, default_timeout=60).run()
+    assert not at.exception
+    problems = at.session_state["problem_set"]
+    assert problems.seed == seed
+    # 화면에 나온 보기도 저장된 세트와 같아야 합니다.
+    assert [tuple(radio.options) for radio in at.radio] == [tuple(opts) for _, _, opts in problems]
+    return problems
+
+
+def test_same_seed_produces_same_problem_set(monkeypatch):
+    monkeypatch.setenv("MATHHH_RESULTS_DB", "")
+    first = rendered_problems(1234, monkeypatch)
+    assert len(first) > 0
+    assert rendered_problems(1234, monkeypatch) == first
+    assert rendered_problems(98765, monkeypatch).problems != first.problems
@@ -0,0 +1,55 @@
+"""utils.rational.RationalFunction 계산 엔진."""
+import numpy as np
+import pytest
+
+from utils.rational import CLIP, RationalFunction
+
+
+def test_trims_leading_zero_coefficients():
+    f = RationalFunction([0, 0, 2, 1], [0, 1, 3])
+    assert f.num.tolist() == [2.0, 1.0]
+    assert f.den.tolist() == [1.0, 3.0]
+
+
+def test_zero_denominator_is_rejected():
+    with pytest.raises(ValueError):
+        RationalFunction([1], [0, 0])
+
+
+@pytest.mark.parametrize("den, expected", [
+    ([3], []),
+    ([2, -4], [2.0]),
+    ([1, 0, -4], [-2.0, 2.0]),
+    ([1, 0, 1], []),
+    ([1, -2, 1], [1.0]),
+])
+def test_poles_are_sorted_real_roots(den, expected):
+    np.testing.assert_allclose(RationalFunction([1], den).poles, expected, atol=1e-7)
+
+
+def test_evaluate_matches_direct_division():
+    f = RationalFunction.linear(2, -1, 1, 3)
+    x = np.linspace(-2.9, 5, 50)
+    np.testing.assert_allclose(f(x), (2 * x - 1) / (x + 3))
+
+
+def test_evaluate_marks_pole_and_clipped_values_as_nan():
+    f = RationalFunction([1], [1, 0])
+    y = f.evaluate(np.array([0.0, 1 / (10 * CLIP), 0.5]))
+    assert np.isnan(y[0]) and np.isnan(y[1])
+    assert y[2] == 2.0
+
+
+def test_evaluate_writes_into_given_output_array():
+    f = RationalFunction([1, 0, -1], [1, 0, -4])
+    x = np.linspace(-5, 5, 101)
+    out = np.empty_like(x)
+    assert f.evaluate(x, out=out) is out
+    np.testing.assert_array_equal(out, f(x))
+
+
+def test_adaptive_segments_do_not_cross_the_asymptote():
+    f = RationalFunction.linear(1, 0, 1, -2)
+    parts = f.adaptive_segments(-10, 10, -10, 10)
+    assert len(parts) == 2
+    assert parts[0][0].max() < 2 < parts[1][0].min()
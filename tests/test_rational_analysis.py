@@ -0,0 +1,56 @@
+"""utils.rational_analysis.analyze 의 점근선·구멍·절편."""
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from utils.rational_analysis import analyze, normalize
+
+
+def values(items):
+    return [item.value for item in items]
+
+
+def test_common_factor_becomes_a_hole():
+    # (x² - 1)/(x - 1) = x + 1, x = 1 에 구멍 (1, 2)
+    result = analyze([1, 0, -1], [1, -1])
+    assert result.vertical == ()
+    assert [(x.value, y.value) for x, y in result.holes] == [(1.0, 2.0)]
+    assert result.asymptote_kind == "none"
+    assert values(result.x_intercepts) == [-1.0]
+    assert result.common_factor_latex == "x - 1"
+
+
+def test_horizontal_and_vertical_asymptotes():
+    # (2x + 1)/(x - 3): 수직 x = 3, 수평 y = 2, y절편 -1/3
+    result = analyze([2, 1], [1, -3])
+    assert values(result.vertical) == [3.0]
+    assert result.asymptote_kind == "horizontal" and result.asymptote == (2.0,)
+    assert values(result.x_intercepts) == [-0.5]
+    assert result.y_intercept.value == pytest.approx(-1 / 3)
+    assert result.y_intercept.latex == r"- \frac{1}{3}"
+
+
+def test_oblique_asymptote_and_undefined_y_intercept():
+    # (x² + 1)/x = x + 1/x
+    result = analyze([1, 0, 1], [1, 0])
+    assert result.asymptote_kind == "oblique" and result.asymptote == (1.0, 0.0)
+    assert result.y_intercept is None
+    assert result.x_intercepts == ()
+
+
+def test_function_matches_reduced_expression():
+    result = analyze([1, 0, -1], [1, -1])
+    x = np.array([-2.0, 0.0, 3.0])
+    np.testing.assert_allclose(result.function()(x), x + 1)
+
+
+def test_equal_coefficients_share_one_cached_result():
+    assert analyze([2, 1], [1, -3]) is analyze([2.0, Fraction(1)], [0, 1, -3])
+    assert normalize([0, 0, 0.5]) == (Fraction(1, 2),)
+
+
+@pytest.mark.parametrize("num, den", [([1], [0, 0]), ([1], [float("nan"), 1])])
+def test_invalid_input_is_rejected(num, den):
+    with pytest.raises(ValueError):
+        analyze(num, den)
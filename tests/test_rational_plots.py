@@ -0,0 +1,32 @@
+"""utils.rational_plots 의 캐시 키와 미리 그리기."""
+import threading
+
+from utils import rational_plots
+from utils.delivery import MOBILE_VIEWPORT
+from utils.rational_plots import inverse_proportion_key, linear_fractional_key, precompute_inverse_proportion
+
+
+def test_keys_are_quantized_to_slider_steps():
+    assert inverse_proportion_key(0.1 + 0.2) == inverse_proportion_key(0.3)
+    assert linear_fractional_key(0.1 + 0.2, 1.5, 1, 2) == linear_fractional_key(0.3, 1.5, 1, 2)
+
+
+def test_precompute_stops_between_renders(monkeypatch):
+    stop = threading.Event()
+    drawn = []
+
+    def fake_figure(a, dpi=None):
+        drawn.append((a, dpi))
+        if len(drawn) == 3:
+            stop.set()
+
+    monkeypatch.setattr(rational_plots, "inverse_proportion_figure", fake_figure)
+    precompute_inverse_proportion(stop=stop)
+    assert [a for a, _ in drawn] == [-5.0, -4.9, -4.8]
+
+
+def test_precompute_covers_every_slider_value_per_viewport(monkeypatch):
+    drawn = []
+    monkeypatch.setattr(rational_plots, "inverse_proportion_figure", lambda a, dpi=None: drawn.append(a))
+    precompute_inverse_proportion(viewports=(MOBILE_VIEWPORT,))
+    assert len(drawn) == 101 and drawn[0] == -5.0 and drawn[50] == 0.0 and drawn[-1] == 5.0
@@ -0,0 +1,81 @@
+"""utils.render_cache.RenderCache 바이트 예산 LRU 캐시."""
+import threading
+
+from utils.render_cache import RenderCache
+
+
+def test_get_returns_stored_value_and_counts_hits():
+    cache = RenderCache(100)
+    assert cache.get("a") is None
+    cache.put("a", b"x", 10)
+    assert cache.get("a") == b"x"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["bytes"]) == (1, 1, 10)
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = RenderCache(30)
+    for key in "abc":
+        cache.put(key, key, 10)
+    cache.get("a")
+    cache.put("d", "d", 10)
+    assert "b" not in cache
+    assert all(key in cache for key in "acd")
+    assert cache.nbytes == 30
+    assert cache.stats()["evictions"] == 1
+
+
+def test_replacing_a_key_updates_its_size():
+    cache = RenderCache(100)
+    cache.put("a", 1, 40)
+    cache.put("a", 2, 10)
+    assert len(cache) == 1 and cache.nbytes == 10 and cache.get("a") == 2
+
+
+def test_oversized_entry_is_kept_alone():
+    cache = RenderCache(10)
+    cache.put("small", 1, 5)
+    cache.put("big", 2, 50)
+    assert len(cache) == 1 and cache.get("big") == 2
+
+
+def test_evicted_entries_spill_to_disk_and_come_back(tmp_path):
+    cache = RenderCache(10, disk_dir=str(tmp_path))
+    cache.put(("inverse", 1.0), b"one", 10)
+    cache.put(("inverse", 2.0), b"two", 10)
+    assert ("inverse", 1.0) not in cache
+    assert cache.stats()["spills"] == 1
+    assert cache.get(("inverse", 1.0)) == b"one"
+    assert cache.stats()["disk_hits"] == 1
+    assert ("inverse", 1.0) in cache
+
+
+def test_write_through_survives_a_new_cache(tmp_path):
+    RenderCache(100, disk_dir=str(tmp_path), write_through=True).put("k", b"v", 1)
+    fresh = RenderCache(100, disk_dir=str(tmp_path))
+    assert fresh.get("k") == b"v"
+
+
+def test_corrupt_disk_entry_is_a_miss(tmp_path):
+    cache = RenderCache(100, disk_dir=str(tmp_path))
+    with open(cache._disk_path("k"), "wb") as f:
+        f.write(b"not a pickle")
+    assert cache.get("k") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_concurrent_puts_respect_the_budget():
+    cache = RenderCache(1000)
+
+    def fill(offset):
+        for i in range(500):
+            cache.put((offset, i), i, 7)
+            cache.get((offset, i // 2))
+
+    threads = [threading.Thread(target=fill, args=(t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.nbytes <= 1000
+    assert cache.nbytes == 7 * len(cache)
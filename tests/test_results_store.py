@@ -0,0 +1,47 @@
+"""utils.results_store.ResultsStore 의 write-behind 기록."""
+import sqlite3
+
+from utils.results_store import ResultsStore
+
+
+def rows(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT session, page, question, answer, correct FROM answers ORDER BY id").fetchall()
+
+
+def test_flush_persists_every_queued_row(tmp_path):
+    path = str(tmp_path / "results.sqlite3")
+    store = ResultsStore(path, batch_size=64, flush_interval=0.01)
+    try:
+        for i in range(1000):
+            assert store.record("s1", "05", f"q{i}", i, i % 2 == 0)
+        assert store.flush()
+        saved = rows(path)
+        assert len(saved) == 1000
+        assert saved[0] == ("s1", "05", "q0", "0", 1)
+        assert saved[-1] == ("s1", "05", "q999", "999", 0)
+        stats = store.stats()
+        assert (stats["enqueued"], stats["written"], stats["dropped"], stats["queued"]) == (1000, 1000, 0, 0)
+    finally:
+        store.close()
+
+
+def test_missing_answer_and_correct_are_stored_as_null(tmp_path):
+    path = str(tmp_path / "results.sqlite3")
+    store = ResultsStore(path, flush_interval=0.01)
+    try:
+        store.record("s1", "04", "q1", None, None, prompt="문제")
+        assert store.flush()
+        assert rows(path) == [("s1", "04", "q1", None, None)]
+    finally:
+        store.close()
+
+
+def test_close_writes_remaining_rows_and_stops_writer(tmp_path):
+    path = str(tmp_path / "nested" / "results.sqlite3")
+    store = ResultsStore(path, flush_interval=10.0)
+    for i in range(5):
+        store.record("s1", "05", f"q{i}", "a", True)
+    store.close()
+    assert not store._thread.is_alive()
+    assert len(rows(path)) == 5
@@ -0,0 +1,54 @@
+"""utils.sampling.adaptive_sample 적응형 표본 추출."""
+import numpy as np
+
+from utils.sampling import adaptive_sample
+
+
+def _points(parts):
+    return sum(len(x) for x, _ in parts)
+
+
+def test_straight_line_keeps_the_initial_grid():
+    parts = adaptive_sample(lambda x: 0.5 * x, -10, 10, -10, 10, initial=17)
+    assert len(parts) == 1
+    assert _points(parts) == 17
+
+
+def test_budget_is_never_exceeded():
+    for budget in (40, 120, 240):
+        parts = adaptive_sample(lambda x: 1 / x, -10, 10, -10, 10, breaks=[0.0], budget=budget)
+        assert _points(parts) <= budget
+
+
+def test_breaks_split_segments_and_stay_out_of_the_gap():
+    parts = adaptive_sample(lambda x: 1 / (x - 1) / (x + 3), -10, 10, -10, 10, breaks=[1.0, -3.0, 42.0])
+    assert len(parts) == 3
+    (x0, _), (x1, _), (x2, _) = parts
+    assert x0[-1] < -3 < x1[0]
+    assert x1[-1] < 1 < x2[0]
+    for x, _ in parts:
+        assert np.all(np.diff(x) > 0)
+
+
+def test_values_are_clipped_one_screen_beyond_the_view():
+    parts = adaptive_sample(lambda x: 1 / x, -10, 10, -10, 10, breaks=[0.0])
+    ys = np.concatenate([y for _, y in parts])
+    assert ys.min() == -30 and ys.max() == 30
+
+
+def test_points_concentrate_near_the_pole():
+    (left, _), (right, _) = adaptive_sample(lambda x: 1 / x, -10, 10, -10, 10, breaks=[0.0])
+    assert np.sum(np.abs(right) < 1) > np.sum(np.abs(right) > 5)
+    assert right[0] < 1e-6
+
+
+def test_undefined_region_is_refined_to_its_boundary():
+    with np.errstate(invalid="ignore"):
+        parts = adaptive_sample(np.sqrt, -10, 10, -10, 10)
+    (x, y), = parts
+    defined = x[np.isfinite(y)]
+    assert defined.min() < 1e-3
+
+
+def test_empty_range_returns_no_segments():
+    assert adaptive_sample(lambda x: x, 1, 1, -10, 10) == []
@@ -0,0 +1,81 @@
+"""utils.session_store 의 저장소와 PageState 되살리기."""
+import types
+
+import pytest
+
+from utils import session_store
+from utils.session_store import MemoryBackend, PageState, SQLiteBackend, dumps, loads
+
+SID = "0123456789abcdef0123456789abcdef"
+
+
+@pytest.fixture
+def fake_st(monkeypatch):
+    """st.session_state 와 st.query_params 를 딕셔너리로 바꿉니다."""
+    fake = types.SimpleNamespace(session_state={}, query_params={"sid": SID})
+    monkeypatch.setattr(session_store, "st", fake)
+    return fake
+
+
+def test_sqlite_backend_round_trips_state_across_connections(tmp_path):
+    path = str(tmp_path / "sessions.sqlite3")
+    values = {"problem_a": 3, "ratio": 0.5, "name": "유리함수", "done": True}
+    first = SQLiteBackend(path)
+    first.set(f"{SID}:06", dumps(values))
+    first.close()
+
+    second = SQLiteBackend(path)
+    try:
+        assert loads(second.get(f"{SID}:06")) == values
+        assert second.get(f"{SID}:07") is None
+        assert second.stats()["hits"] == 1
+    finally:
+        second.close()
+
+
+def test_sqlite_backend_ignores_expired_state(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "sessions.sqlite3"), ttl=-1)
+    try:
+        backend.set("k", b"{}")
+        assert backend.get("k") is None
+    finally:
+        backend.close()
+
+
+def test_memory_backend_purges_expired_and_evicts_oldest():
+    backend = MemoryBackend(max_entries=2, ttl=-1)
+    backend.set("a", b"1")
+    assert backend.get("a") is None
+    assert backend.stats()["purged"] == 1
+
+    backend = MemoryBackend(max_entries=2)
+    for key in "abc":
+        backend.set(key, key.encode())
+    assert backend.get("a") is None
+    assert backend.get("c") == b"c"
+    assert backend.stats()["evicted"] == 1
+
+
+def test_page_state_restores_saved_values_in_a_new_session(fake_st, tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "sessions.sqlite3"))
+    try:
+        state = PageState(backend, SID, "06", ("problem_a", "problem_b"))
+        assert not state.restore()
+        fake_st.session_state.update(problem_a=2, problem_b=-1, other="x")
+        assert state.save()
+        assert not state.save()  # 바뀐 것이 없으면 다시 쓰지 않음
+
+        fake_st.session_state = {}
+        assert PageState(backend, SID, "06", ("problem_a", "problem_b")).restore()
+        assert fake_st.session_state["problem_a"] == 2
+        assert fake_st.session_state["problem_b"] == -1
+        assert "other" not in fake_st.session_state
+    finally:
+        backend.close()
+
+
+def test_session_key_replaces_malformed_sid(fake_st):
+    assert session_store.session_key() == SID
+    fake_st.query_params["sid"] = "../../etc"
+    sid = session_store.session_key()
+    assert sid != "../../etc" and fake_st.query_params["sid"] == sid and len(sid) == 32
@@ -0,0 +1,50 @@
+"""utils.sweep 의 K = sW/r 격자와 최소 서버 수."""
+import numpy as np
+import pytest
+
+from utils.sweep import MAX_SERVERS, R_RANGE, ModelSweep
+
+
+@pytest.fixture(scope="module")
+def sweep():
+    return ModelSweep()
+
+
+def brute_force(k, target):
+    # 정수 서버 수 1..MAX_SERVERS 를 차례로 넣어 보는 기준 답
+    x = np.arange(1, MAX_SERVERS + 1, dtype=float)
+    ok = k[..., None] / x <= target
+    return np.where(ok.any(axis=-1), ok.argmax(axis=-1) + 1.0, np.nan)
+
+
+def test_target_exactly_met_needs_no_extra_server(sweep):
+    # K = 1·100/10 = 10: 목표 5 는 x = 2 에서 정확히 맞음
+    assert sweep.min_servers(1, 100, 10, 5.0) == 2
+    assert sweep.min_servers(1, 100, 10, 10.0) == 1
+    # K = 100·1000/10 = 10000: 목표 50 은 마지막 x = MAX_SERVERS 에서 정확히 맞음
+    assert sweep.min_servers(100, 1000, 10, 10000 / MAX_SERVERS) == MAX_SERVERS
+
+
+def test_unreachable_target_is_nan_or_none(sweep):
+    assert sweep.min_servers(100, 1000, 10, 49.5) is None
+    needed = sweep.servers_needed(10, 0.5)
+    assert np.isnan(needed[-1, -1])
+    assert needed[0, 0] == 20  # K = 10 → 10/20 = 0.5
+
+
+@pytest.mark.parametrize("target", [0.5, 1.0, 2.5, 5.0, 7.5, 33.0, 50.0])
+@pytest.mark.parametrize("r", [10, 15, 35, 200])
+def test_servers_needed_matches_brute_force(sweep, r, target):
+    k = sweep.K[:, :, (r - R_RANGE[0]) // R_RANGE[2]]
+    np.testing.assert_array_equal(sweep.servers_needed(r, target), brute_force(k, target))
+
+
+def test_curve_is_dense_and_matches_model(sweep):
+    x, T = sweep.curve(3, 150, 20)
+    assert x[0] == 1 and x[-1] == MAX_SERVERS and len(x) > MAX_SERVERS
+    np.testing.assert_allclose(T, 3 * 150 / (20 * x))
+
+
+def test_values_outside_slider_grid_are_rejected(sweep):
+    with pytest.raises(ValueError):
+        sweep.curve(0, 150, 20)
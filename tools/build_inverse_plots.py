@@ -0,0 +1,79 @@
+"""6쪽 f/f⁻¹ 비교 그림을 전체 문제 공간에 대해 미리 그려 디스크 캐시에 채웁니다.
+
+    python tools/build_inverse_plots.py --jobs 8
+    python tools/build_inverse_plots.py --viewports desktop --limit 200   # 일부만
+
+(a, b, c, d) 조합(약 1만 2천 개)을 작업 프로세스들에 나눠 주고, 각 프로세스는
+utils.inverse_plot 의 캐시로 그리므로 서버가 쓰는 것과 같은 키·파일로 저장됩니다.
+이미 디스크에 있는 그림은 건너뛰므로 중간에 멈췄다가 다시 실행해도 됩니다.
+서버와 같은 MATHHH_INVERSE_CACHE_DIR, MATHHH_PLOT_FORMAT 으로 실행하세요.
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+from utils.delivery import DESKTOP_VIEWPORT, MOBILE_VIEWPORT, choose_dpi  # noqa: E402
+from utils.inverse_plot import FIGSIZE, inverse_figure, inverse_plot_cache, problem_space  # noqa: E402
+
+VIEWPORTS = {"desktop": DESKTOP_VIEWPORT, "mobile": MOBILE_VIEWPORT}
+CHUNK = 50
+
+
+def _init_worker():
+    # 이 도구가 이미 프로세스마다 나눠 그리므로 렌더링 풀을 또 띄우지 않습니다.
+    os.environ["MATHHH_RENDER_WORKERS"] = "0"
+    # 그림마다 반복되는 글꼴 경고로 출력이 묻히지 않도록 합니다.
+    logging.getLogger("matplotlib").setLevel(logging.ERROR)
+    warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def _build_chunk(problems, dpis):
+    """problems × dpis 를 그리고 (새로 그린 수, 이미 있던 수) 를 돌려줍니다."""
+    cache = inverse_plot_cache()
+    drawn = 0
+    for problem in problems:
+        for dpi in dpis:
+            before = cache.stats()["misses"]
+            inverse_figure(*problem, dpi=dpi)
+            drawn += cache.stats()["misses"] - before
+    return drawn, len(problems) * len(dpis) - drawn
+
+
+def main():
+    parser = argparse.ArgumentParser(description="6쪽 비교 그림 미리 그리기")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="작업 프로세스 수")
+    parser.add_argument("--viewports", default="desktop,mobile", help="그릴 기기 종류 (desktop,mobile)")
+    parser.add_argument("--limit", type=int, help="앞에서부터 이 개수의 문제만 그림")
+    args = parser.parse_args()
+
+    if inverse_plot_cache().disk_dir is None:
+        parser.error("MATHHH_INVERSE_CACHE_DIR 이 비어 있어 저장할 곳이 없습니다.")
+    dpis = sorted({choose_dpi(FIGSIZE[0], VIEWPORTS[v]) for v in args.viewports.split(",")})
+    problems = problem_space()[:args.limit]
+    chunks = [problems[i:i + CHUNK] for i in range(0, len(problems), CHUNK)]
+    print(f"{len(problems)}문제 × DPI {dpis} → {inverse_plot_cache().disk_dir} ({args.jobs}개 프로세스)")
+
+    start = time.perf_counter()
+    drawn = skipped = 0
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker) as pool:
+        futures = [pool.submit(_build_chunk, chunk, dpis) for chunk in chunks]
+        for done, future in enumerate(as_completed(futures), 1):
+            new, old = future.result()
+            drawn += new
+            skipped += old
+            if done % 10 == 0 or done == len(futures):
+                print(f"  {done}/{len(futures)} 묶음, 새로 그림 {drawn}, 이미 있음 {skipped}, "
+                      f"{time.perf_counter() - start:.0f}s", file=sys.stderr)
+    print(f"완료: 새로 그림 {drawn}, 이미 있음 {skipped}, {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""내용만 있는 페이지를 정적 HTML 로 미리 렌더링합니다.
+
+    python tools/export_static.py --out site            # 01, 02, 04 쪽을 site/ 에 내보냄
+    python tools/export_static.py --out site --serve 8600 --live-url https://example.org
+
+1쪽(유리식의 성질), 2쪽(유리함수의 정의), 4쪽 설명 부분은 누가 보아도 똑같으므로
+수업 시간에 이 페이지들을 정적 파일 서버(예: nginx, --serve)로 돌리면 Streamlit
+세션과 스크립트 실행 없이 보여 줄 수 있습니다.
+
+페이지를 Streamlit AppTest 로 한 번 실행해 나온 요소(제목, 마크다운, 수식, 그림, 알림)를
+HTML 로 옮깁니다. 마크다운과 수식은 브라우저에서 marked 와 MathJax(CDN)로 그리고,
+그림은 내용 해시를 파일 이름으로 하는 assets/ 에 저장해 오래 캐시할 수 있게 합니다.
+슬라이더 같은 입력은 기본값을 보여 주고 실시간 페이지로 가는 링크를 붙입니다.
+4쪽처럼 카드의 <div> 와 </div> 만 따로 낸 마크다운은 태그 그대로 옮겨 짝을 맞추므로,
+정적 페이지에서는 카드가 그 사이의 요소들을 감쌉니다.
+따라서 4쪽은 슬라이더가 모두 기본값(s = 20, W = 400, r = 50, 목표 시간 5)일 때의 그래프와
+서버 수 지도로 내보내지며, 다른 값은 실시간 페이지에서만 볼 수 있습니다.
+
+그림 바이트를 꺼내려고 AppTest 내부의 MemoryMediaFileStorage 를 바꿔 끼우므로, 확인한
+Streamlit 버전(SUPPORTED_STREAMLIT)에서만 실행되고, 그 내부가 달라졌으면 바로 멈춥니다.
+"""
+import argparse
+import base64
+import contextlib
+import hashlib
+import html
+import http.server
+import json
+import logging
+import mimetypes
+import os
+import re
+import sys
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import streamlit  # noqa: E402
+from streamlit import logger as st_logger  # noqa: E402
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.testing.v1 import app_test as app_test_module  # noqa: E402
+
+st_logger.set_log_level("error")
+logging.getLogger("matplotlib").setLevel(logging.ERROR)
+warnings.filterwarnings("ignore", category=UserWarning)
+
+DEFAULT_PAGES = ("01", "02", "04")
+# _keep_media() 가 기대는 AppTest 내부를 확인한 Streamlit 버전 (major.minor)
+SUPPORTED_STREAMLIT = ("1.66",)
+ASSET_MAX_AGE = 365 * 24 * 3600
+
+MARKED_URL = "https://cdn.jsdelivr.net/npm/marked@12/marked.min.js"
+MATHJAX_URL = "https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-chtml.js"
+
+# 마크다운 안의 수식은 marked 가 건드리지 않도록 잠시 빼 두었다가 되돌린 뒤 MathJax 로 그립니다.
+RENDER_JS = r"""
+window.MathJax = {tex: {inlineMath: [["$", "$"], ["\\(", "\\)"]], displayMath: [["$$", "$$"], ["\\[", "\\]"]]}};
+document.addEventListener("DOMContentLoaded", function () {
+  var MATH = /(\$\$[\s\S]+?\$\$|\\\[[\s\S]+?\\\]|\\\([\s\S]+?\\\)|\$[^$\n]+?\$)/g;
+  document.querySelectorAll("[data-md]").forEach(function (el) {
+    var saved = [];
+    var text = el.getAttribute("data-md").replace(MATH, function (m) { saved.push(m); return "@@MATH" + (saved.length - 1) + "@@"; });
+    var out = el.hasAttribute("data-inline") ? marked.parseInline(text) : marked.parse(text);
+    el.innerHTML = out.replace(/@@MATH(\d+)@@/g, function (_, i) { return saved[+i].replace(/&/g, "&amp;").replace(/</g, "&lt;"); });
+  });
+  if (window.MathJax && MathJax.typesetPromise) { MathJax.typesetPromise(); }
+});
+"""
+
+BASE_CSS = """
+body { margin: 0; font-family: 'Noto Sans KR', sans-serif; }
+.stApp { min-height: 100vh; }
+.page { max-width: 730px; margin: 0 auto; padding: 48px 16px; }
+.page.wide { max-width: 1200px; }
+.page img { max-width: 100%; }
+figure { margin: 16px 0; } figcaption { font-size: 0.85em; color: #555; text-align: center; }
+.alert { padding: 12px 16px; border-radius: 8px; margin: 12px 0; }
+.alert.info { background: #e8f0fe; } .alert.success { background: #e6f4ea; }
+.alert.warning { background: #fef7e0; } .alert.error { background: #fce8e6; }
+.widget { padding: 8px 12px; margin: 8px 0; border: 1px dashed #999; border-radius: 8px; background: #ffffffaa; }
+.live-link { font-size: 0.9em; }
+"""
+
+ALERTS = ("info", "success", "warning", "error")
+
+# 4쪽처럼 카드를 여는 태그와 닫는 태그만 따로 st.markdown 으로 내는 경우 (_balance_divs 참고)
+_OPEN_DIV = re.compile(r"<div(\s[^<>]*)?>")
+_CLOSE_DIV = re.compile(r"</div>")
+
+
+class _KeptMediaStorage(MemoryMediaFileStorage):
+    """AppTest 가 실행 후 버리는 메모리 미디어 저장소를 붙잡아 두어 그림 바이트를 꺼낼 수 있게 함."""
+
+    last = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _KeptMediaStorage.last = self
+
+
+def check_streamlit():
+    """이 도구가 기대는 Streamlit 버전과 AppTest 내부가 맞는지 확인합니다. 다르면 RuntimeError."""
+    version = ".".join(streamlit.__version__.split(".")[:2])
+    if version not in SUPPORTED_STREAMLIT:
+        raise RuntimeError(f"export_static 은 Streamlit {', '.join(SUPPORTED_STREAMLIT)} 에서만 확인했습니다 "
+                           f"(설치된 버전 {streamlit.__version__}). _keep_media() 를 확인한 뒤 "
+                           "SUPPORTED_STREAMLIT 에 추가하세요.")
+    if getattr(app_test_module, "MemoryMediaFileStorage", None) is not MemoryMediaFileStorage:
+        raise RuntimeError("streamlit.testing.v1.app_test 에 MemoryMediaFileStorage 가 없어 "
+                           "그림을 꺼낼 수 없습니다. _keep_media() 를 새 Streamlit 에 맞게 고치세요.")
+
+
+@contextlib.contextmanager
+def _keep_media():
+    check_streamlit()
+    original = app_test_module.MemoryMediaFileStorage
+    _KeptMediaStorage.last = None
+    app_test_module.MemoryMediaFileStorage = _KeptMediaStorage
+    try:
+        yield
+    finally:
+        app_test_module.MemoryMediaFileStorage = original
+
+
+def page_files():
+    pages = {}
+    for name in sorted(os.listdir(os.path.join(ROOT, "pages"))):
+        if name.endswith(".py"):
+            pages[name[:2]] = os.path.join(ROOT, "pages", name)
+    return pages
+
+
+def page_url_path(path):
+    """Streamlit 이 pages/ 파일에 붙이는 주소 (앞 번호를 빼고 공백은 밑줄)."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return re.sub(r"^\d+_", "", stem).replace(" ", "_")
+
+
+class Exporter:
+    def __init__(self, out_dir, live_url):
+        self.out_dir = out_dir
+        self.live_url = live_url.rstrip("/")
+        self.asset_dir = os.path.join(out_dir, "assets")
+        os.makedirs(self.asset_dir, exist_ok=True)
+
+    # -----------------------
+    # 그림
+    # -----------------------
+    def _save_asset(self, data, mimetype):
+        ext = mimetypes.guess_extension(mimetype) or ".bin"
+        name = hashlib.sha256(data).hexdigest()[:16] + ext
+        path = os.path.join(self.asset_dir, name)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(data)
+        return f"assets/{name}"
+
+    def _image_src(self, url):
+        if url.startswith("data:"):
+            header, payload = url[5:].split(",", 1)
+            mimetype = header.split(";")[0]
+            data = base64.b64decode(payload) if header.endswith(";base64") else payload.encode()
+            return self._save_asset(data, mimetype)
+        if url.startswith("http"):
+            return url
+        # AppTest 의 메모리 미디어 저장소에서 바이트를 꺼냄
+        if _KeptMediaStorage.last is None:
+            raise RuntimeError("AppTest 가 바꿔 끼운 미디어 저장소를 쓰지 않았습니다. _keep_media() 를 확인하세요.")
+        media = _KeptMediaStorage.last.get_file(url.rsplit("/", 1)[-1])
+        return self._save_asset(media.content, media.mimetype)
+
+    # -----------------------
+    # 요소 → HTML
+    # -----------------------
+    def _markdown(self, body, inline=False, tag="div", cls=None):
+        attrs = f' data-md="{html.escape(body, quote=True)}"'
+        if inline:
+            attrs += " data-inline"
+        if cls:
+            attrs += f' class="{cls}"'
+        return f"<{tag}{attrs}></{tag}>"
+
+    def _element(self, node, live_link):
+        kind = node.type
+        proto = getattr(node, "proto", None)
+        if kind == "title":
+            return self._markdown(proto.body, inline=True, tag="h1")
+        if kind in ("header", "subheader"):
+            return self._markdown(proto.body, inline=True, tag="h2" if kind == "header" else "h3")
+        if kind in ("markdown", "caption", "latex", "code"):
+            body = proto.body
+            if kind == "markdown" and (_OPEN_DIV.fullmatch(body.strip()) or _CLOSE_DIV.fullmatch(body.strip())):
+                # 태그 하나뿐인 마크다운은 그대로 두어 뒤따르는 요소들을 감싸게 함
+                return body.strip()
+            if kind == "code":
+                return f"<pre><code>{html.escape(body)}</code></pre>"
+            return self._markdown(body, cls="caption" if kind == "caption" else None)
+        if kind in ALERTS:
+            return self._markdown(proto.body, cls=f"alert {kind}")
+        if kind == "imgs" or kind == "image":
+            figures = []
+            for img in proto.imgs:
+                caption = f"<figcaption>{html.escape(img.caption)}</figcaption>" if img.caption else ""
+                figures.append(f'<figure><img src="{self._image_src(img.url)}" alt="{html.escape(img.caption)}" '
+                               f'loading="lazy">{caption}</figure>')
+            return "".join(figures)
+        label = getattr(node, "label", None)
+        if label is not None:
+            value = getattr(node, "value", "")
+            return (f'<div class="widget">🎛️ {html.escape(label)}: <b>{html.escape(str(value))}</b> (기본값) '
+                    f'<a class="live-link" href="{live_link}">실시간 페이지에서 바꿔 보기 →</a></div>')
+        return f"<!-- 내보내지 않은 요소: {html.escape(str(kind))} -->"
+
+    def _walk(self, node, live_link, parts):
+        children = getattr(node, "children", None)
+        if isinstance(children, dict):
+            for child in children.values():
+                self._walk(child, live_link, parts)
+        else:
+            parts.append(self._element(node, live_link))
+
+    @staticmethod
+    def _balance_divs(parts):
+        """따로 낸 <div> 여닫는 태그의 짝을 맞춥니다. 짝 없는 닫는 태그는 버리고, 열린 채 남은 것은 끝에서 닫음."""
+        balanced, depth = [], 0
+        for part in parts:
+            if _CLOSE_DIV.fullmatch(part):
+                if depth == 0:
+                    continue
+                depth -= 1
+            elif _OPEN_DIV.fullmatch(part):
+                depth += 1
+            balanced.append(part)
+        return balanced + ["</div>"] * depth
+
+    def export_page(self, path):
+        with _keep_media():
+            at = AppTest.from_file(path, default_timeout=120).run()
+        if at.exception:
+            raise RuntimeError(f"{os.path.basename(path)}: {at.exception[0].message}")
+        slug = page_url_path(path)
+        live_link = f"{self.live_url}/{slug}"
+        parts = []
+        self._walk(at.main, live_link, parts)
+        parts = self._balance_divs(parts)
+        with open(path, encoding="utf-8") as f:
+            wide = "wide" if "layout=\"wide\"" in f.read() else ""
+        title = html.escape(slug.replace("_", " "))
+        document = f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<link rel="stylesheet" href="static.css">
+<script src="static.js"></script>
+<script src="{MARKED_URL}"></script>
+<script async src="{MATHJAX_URL}"></script>
+</head>
+<body>
+<div class="stApp"><div class="page {wide}">
+<p class="live-link"><a href="index.html">← 목차</a> · <a href="{live_link}">실시간 페이지</a></p>
+{chr(10).join(parts)}
+</div></div>
+</body>
+</html>
+"""
+        with open(os.path.join(self.out_dir, f"{slug}.html"), "w", encoding="utf-8") as f:
+            f.write(document)
+        return slug
+
+    def export(self, pages):
+        with open(os.path.join(self.out_dir, "static.js"), "w", encoding="utf-8") as f:
+            f.write(RENDER_JS)
+        with open(os.path.join(self.out_dir, "static.css"), "w", encoding="utf-8") as f:
+            f.write(BASE_CSS)
+        slugs = [self.export_page(path) for path in pages]
+        links = "\n".join(f'<li><a href="{s}.html">{html.escape(s.replace("_", " "))}</a></li>' for s in slugs)
+        with open(os.path.join(self.out_dir, "index.html"), "w", encoding="utf-8") as f:
+            f.write(f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>유리함수 디지털 교과서</title>
+<link rel="stylesheet" href="static.css"></head>
+<body><div class="page"><h1>나만의 유리함수 디지털 교과서</h1><ul>
+{links}
+</ul><p><a href="{self.live_url}/">실시간 교과서로 가기</a></p></div></body></html>
+""")
+        with open(os.path.join(self.out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump({"pages": slugs, "assets": sorted(os.listdir(self.asset_dir))}, f, ensure_ascii=False, indent=2)
+        return slugs
+
+
+# -----------------------
+# 정적 파일 서버 (캐시 헤더 포함)
+# -----------------------
+class CachingHandler(http.server.SimpleHTTPRequestHandler):
+    """assets/ 는 내용 해시 이름이라 1년 immutable, HTML 등은 매번 다시 확인."""
+
+    def end_headers(self):
+        if self.path.startswith("/assets/"):
+            self.send_header("Cache-Control", f"public, max-age={ASSET_MAX_AGE}, immutable")
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        super().end_headers()
+
+
+def serve(directory, port):
+    handler = lambda *args, **kwargs: CachingHandler(*args, directory=directory, **kwargs)  # noqa: E731
+    with http.server.ThreadingHTTPServer(("", port), handler) as server:
+        print(f"http://localhost:{port}/ 에서 {directory} 를 제공합니다. (Ctrl+C 로 종료)")
+        server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="내용만 있는 페이지를 정적 HTML 로 내보내기")
+    parser.add_argument("--out", default=os.path.join(ROOT, "site"), help="출력 폴더")
+    parser.add_argument("--pages", default=",".join(DEFAULT_PAGES), help="내보낼 페이지 번호 (쉼표로 구분)")
+    parser.add_argument("--live-url", default="", help="입력 요소 옆 링크가 가리킬 실시간 Streamlit 주소")
+    parser.add_argument("--serve", type=int, metavar="PORT", help="내보낸 뒤 이 포트로 정적 서버를 띄움")
+    args = parser.parse_args()
+
+    check_streamlit()
+    available = page_files()
+    requested = [p.strip() for p in args.pages.split(",") if p.strip()]
+    unknown = [p for p in requested if p not in available]
+    if unknown:
+        parser.error(f"없는 페이지 번호입니다: {', '.join(unknown)} (가능한 번호: {', '.join(available)})")
+    pages = [available[p] for p in requested]
+    slugs = Exporter(args.out, args.live_url).export(pages)
+    print(f"{len(slugs)}쪽을 {args.out} 에 내보냈습니다: {', '.join(slugs)}")
+    if args.serve:
+        serve(args.out, args.serve)
+
+
+if __name__ == "__main__":
+    main()
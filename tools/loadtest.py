@@ -0,0 +1,301 @@
+"""동시 접속 부하 테스트 (Streamlit AppTest 로 브라우저 없이 세션을 흉내 냄).
+
+    python tools/loadtest.py --sessions 1,5,10,20 --rounds 2
+
+가상 학생 N 명이 동시에 main.py 와 각 페이지를 차례로 돌아다니며 실제와 비슷한
+조작(3쪽 슬라이더 훑기, 5쪽 15문제 모두 답하기, 6쪽 정답 확인 + 새 문제 반복 등)을
+합니다. N 마다 재실행 지연 p50/p95/p99, 초당 재실행 수(처리량), 세션 프로세스의 최대
+메모리(RSS)를 표로 출력합니다.
+
+AppTest 는 한 프로세스 안에서 여러 스레드가 함께 쓰면 스크립트 컴파일과 위젯 상태가
+서로 엉켜 앱과 상관없는 오류가 나므로, 가상 세션마다 별도 프로세스(spawn)에서 돌리고
+모두 준비되면 한꺼번에 출발시킵니다. 따라서 프로세스 안 캐시(그림 캐시, 문제 색인 등)는
+세션끼리 나누지 않으며, CPU 를 나눠 쓰는 N 개의 세션으로서의 지연을 잽니다.
+
+오류가 난 재실행은 지연 통계에서 빼고 따로 세며, 오류가 하나라도 있는 단계는 실패로
+표시하고 종료 코드 1 로 끝납니다.
+"""
+import argparse
+import glob
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import resource
+import sys
+import threading
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+from streamlit import logger as st_logger  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from utils.coalesce import frame_stats  # noqa: E402
+
+# 수백 번의 재실행에서 반복되는 경고(세션 상태·글꼴 등)로 결과가 묻히지 않도록 합니다.
+st_logger.set_log_level("error")
+logging.getLogger("matplotlib").setLevel(logging.ERROR)
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+# -----------------------
+# 페이지별 조작 시나리오: 각 시나리오는 재실행 한 번마다 at.run() 을 호출하는 run 함수를 받습니다.
+# -----------------------
+def scenario_load(at, run):
+    run()
+
+
+def scenario_slider_sweep(at, run):
+    # 3쪽: y = a/x 슬라이더를 훑은 뒤 (ax+b)/(cx+d) 슬라이더 네 개를 차례로 훑음
+    run()
+    for value in (-4.0, -2.0, -0.5, 0.5, 2.0, 4.0):
+        at.slider[0].set_value(value)
+        run()
+    for i, values in enumerate([(2.0, -3.0), (-6.0, 4.5), (0.0, 2.5), (-8.0, 3.0)], start=1):
+        for value in values:
+            at.slider[i].set_value(value)
+            run()
+
+
+def scenario_model_sliders(at, run):
+    # 4쪽: s, W, r 슬라이더를 하나씩 움직임
+    run()
+    for i, values in enumerate([(10, 60), (300, 800), (20, 150)]):
+        for value in values:
+            at.slider[i].set_value(value)
+            run()
+
+
+def scenario_answer_all(at, run):
+    # 5쪽: 15문제를 위에서부터 하나씩 답함 (답을 고를 때마다 재실행)
+    run()
+    for k in range(len(at.radio)):
+        radio = at.radio[k]
+        radio.set_value(radio.options[(k * 3) % len(radio.options)])
+        run()
+
+
+def scenario_inverse_quiz(at, run, loops=3):
+    # 6쪽: 답 입력 → 정답 확인 → 새 문제를 반복 (절반은 정답, 절반은 오답)
+    run()
+    for loop in range(loops):
+        a, b, c, d = (at.session_state[f"problem_{k}"] for k in "abcd")
+        answer = (-d, b, c, -a) if loop % 2 == 0 else (1, 1, 1, 1)
+        for key, value in zip("abcd", answer):
+            at.number_input(key=f"user_inv_{key}").set_value(value)
+        run()
+        at.button[0].click()
+        run()
+        at.button[1].click()
+        run()
+
+
+SCENARIOS = {
+    "main": scenario_load,
+    "01": scenario_load,
+    "02": scenario_load,
+    "03": scenario_slider_sweep,
+    "04": scenario_model_sliders,
+    "05": scenario_answer_all,
+    "06": scenario_inverse_quiz,
+    "07": scenario_load,
+    "08": scenario_load,
+}
+
+
+def page_files():
+    pages = {"main": os.path.join(ROOT, "main.py")}
+    for path in sorted(glob.glob(os.path.join(ROOT, "pages", "*.py"))):
+        prefix = os.path.basename(path)[:2]
+        if prefix in SCENARIOS:
+            pages[prefix] = path
+    return pages
+
+
+# -----------------------
+# 메모리 측정
+# -----------------------
+def current_rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        # /proc 가 없으면 지금까지의 최대값으로 대신합니다.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class RssSampler(threading.Thread):
+    def __init__(self, interval=0.05):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = current_rss_mb()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self.peak = max(self.peak, current_rss_mb())
+            time.sleep(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.peak = max(self.peak, current_rss_mb())
+
+
+# -----------------------
+# 가상 세션
+# -----------------------
+def virtual_session(index, pages, rounds, timeout, latencies, errors):
+    order = list(pages)
+    # 세션마다 시작 페이지를 달리해 부하가 한 페이지에 몰리지 않게 합니다.
+    order = order[index % len(order):] + order[:index % len(order)]
+    for _ in range(rounds):
+        for page in order:
+            at = AppTest.from_file(pages[page], default_timeout=timeout)
+
+            def run(page=page, at=at):
+                start = time.perf_counter()
+                at.run()
+                elapsed = time.perf_counter() - start
+                # 오류가 난 재실행은 지연 통계에 넣지 않습니다.
+                if at.exception:
+                    errors.append((page, at.exception[0].message))
+                else:
+                    latencies.append((page, elapsed))
+
+            try:
+                SCENARIOS[page](at, run)
+            except Exception as e:  # 시나리오 자체가 깨져도 다른 세션은 계속 진행
+                errors.append((page, repr(e)))
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return float("nan")
+    k = min(len(sorted_values) - 1, max(0, round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+def _session_process(index, pages, rounds, timeout, barrier, results):
+    # 세션 프로세스: 모두 준비될 때까지 기다렸다가 시나리오를 돌고 결과를 큐에 넣습니다.
+    latencies, errors = [], []
+    sampler = RssSampler()
+    sampler.start()
+    barrier.wait()
+    start = time.time()
+    virtual_session(index, pages, rounds, timeout, latencies, errors)
+    end = time.time()
+    sampler.stop()
+    results.put({"latencies": latencies, "errors": errors, "start": start, "end": end,
+                 "peak_rss_mb": sampler.peak, "frames": frame_stats()})
+
+
+def run_level(n_sessions, pages, rounds, timeout):
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(n_sessions)
+    results = ctx.Queue()
+    processes = [ctx.Process(target=_session_process, args=(i, pages, rounds, timeout, barrier, results))
+                 for i in range(n_sessions)]
+    for p in processes:
+        p.start()
+    # 큐를 먼저 비워야 큰 결과를 넣는 프로세스가 join 에서 멈추지 않습니다.
+    collected = []
+    try:
+        while len(collected) < n_sessions:
+            try:
+                collected.append(results.get(timeout=1.0))
+            except queue.Empty:
+                if not any(p.is_alive() for p in processes):
+                    break
+    finally:
+        # Ctrl+C 등으로 중단되면 세션 프로세스가 남지 않게 정리합니다.
+        if len(collected) < n_sessions:
+            for p in processes:
+                if p.is_alive():
+                    p.terminate()
+        for p in processes:
+            p.join()
+
+    latencies, errors, frames = [], [], {}
+    for result in collected:
+        latencies.extend(result["latencies"])
+        errors.extend(result["errors"])
+        for key, stats in result["frames"].items():
+            total = frames.setdefault(key, dict.fromkeys(stats, 0))
+            for name, value in stats.items():
+                total[name] += value
+    for _ in range(n_sessions - len(collected)):
+        errors.append(("-", "세션 프로세스가 결과 없이 끝났습니다"))
+    wall = (max(r["end"] for r in collected) - min(r["start"] for r in collected)) if collected else 0.0
+
+    values = sorted(t for _, t in latencies)
+    per_page = {}
+    for page, t in latencies:
+        per_page.setdefault(page, []).append(t)
+    return {
+        "sessions": n_sessions,
+        "reruns": len(values),
+        "wall_s": wall,
+        "throughput_rps": len(values) / wall if wall else 0.0,
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "peak_rss_mb": max((r["peak_rss_mb"] for r in collected), default=float("nan")),
+        "errors": len(errors),
+        "ok": not errors,
+        "first_errors": errors[:3],
+        "p95_ms_by_page": {p: percentile(sorted(v), 95) * 1000 for p, v in sorted(per_page.items())},
+        "frames": {f"{page}/{name}": stats for (page, name), stats in sorted(frames.items())},
+    }
+
+
+def print_table(results):
+    print(f"{'N':>4} {'reruns':>7} {'rps':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'RSS MB':>8} "
+          f"{'errors':>6} {'결과':>4}")
+    for r in results:
+        print(f"{r['sessions']:>4} {r['reruns']:>7} {r['throughput_rps']:>7.1f} {r['p50_ms']:>8.1f} "
+              f"{r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['peak_rss_mb']:>8.0f} {r['errors']:>6} "
+              f"{'OK' if r['ok'] else 'FAIL':>4}")
+    for r in results:
+        pages = ", ".join(f"{p} {v:.0f}" for p, v in r["p95_ms_by_page"].items())
+        print(f"N={r['sessions']} 페이지별 p95(ms): {pages}")
+        for page, message in r["first_errors"]:
+            print(f"  ! {page}: {message}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 접속 부하 테스트")
+    parser.add_argument("--sessions", default="1,5,10", help="동시 세션 수 목록 (쉼표로 구분)")
+    parser.add_argument("--rounds", type=int, default=1, help="세션마다 전체 페이지를 도는 횟수")
+    parser.add_argument("--pages", default=",".join(SCENARIOS), help="대상 페이지 (main,01,...,08)")
+    parser.add_argument("--timeout", type=float, default=120, help="재실행 한 번의 제한 시간(초)")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    available = page_files()
+    pages = {p: available[p] for p in args.pages.split(",") if p in available}
+    results = []
+    for n in (int(v) for v in args.sessions.split(",")):
+        results.append(run_level(n, pages, args.rounds, args.timeout))
+        print(f"N={n} 완료: {results[-1]['reruns']}회 재실행, {results[-1]['wall_s']:.1f}s, "
+              f"오류 {results[-1]['errors']}", file=sys.stderr)
+    print_table(results)
+    # 슬라이더 시나리오의 재실행 지연에는 그림 최소 간격(MATHHH_MIN_FRAME_MS)만큼 기다린 시간이 들어 있습니다.
+    for r in results:
+        for key, stats in r["frames"].items():
+            print(f"N={r['sessions']} 그림 합치기 {key}: 그림 {stats['drawn']}, 버림 {stats['dropped']}, "
+                  f"기다림 {stats['waited_s']:.1f}s")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if not all(r["ok"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""여러 페이지에서 함께 쓰는 도구 모음."""
+import os
+
+# matplotlib 을 처음 불러오기 전에 화면 없는 Agg 백엔드를 지정해 둡니다.
+# (서버에서 GUI 백엔드를 찾느라 시간을 쓰지 않도록)
+os.environ.setdefault("MPLBACKEND", "Agg")
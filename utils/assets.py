@@ -0,0 +1,103 @@
+"""페이지에 넣는 그림 파일을 프로세스당 한 번만 읽어 화면용으로 줄여 둡니다.
+
+원본을 한 번 디코딩해 표시 폭에 맞게 줄이고, 투명도가 있으면 팔레트 PNG, 없으면
+JPEG 로 압축한 바이트를 보관합니다. st.image 에는 width="content" 로 넘기므로
+Streamlit 이 다시 줄이거나 인코딩하지 않고 바이트를 그대로 보냅니다. (폭을 숫자로 주면
+그 폭보다 큰 그림은 호출할 때마다 다시 줄여 인코딩함) 같은 바이트는 같은 미디어 주소를
+받으므로 브라우저도 한 번만 내려받습니다.
+
+파일이 없으면 그 사실도 NEGATIVE_TTL 초 동안 기억해, 재실행마다 파일 시스템을 다시
+뒤지지 않습니다. (그 사이에 파일을 넣으면 TTL 이 지난 뒤 나타남)
+"""
+import functools
+import io
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import streamlit as st
+
+DISPLAY_WIDTH = 240  # CSS px (그림을 이 폭으로 줄여 두고 그대로 표시)
+JPEG_QUALITY = 85
+NEGATIVE_TTL = 30.0
+
+
+@dataclass(frozen=True)
+class ImageAsset:
+    """화면용으로 줄이고 압축한 그림."""
+
+    data: bytes
+    format: str  # "PNG" 또는 "JPEG" (st.image 가 다시 인코딩하지 않도록 그대로 알려 줌)
+    size: tuple
+    source_bytes: int
+
+
+def _load(path, max_width):
+    from PIL import Image
+
+    try:
+        source_bytes = os.path.getsize(path)
+        with Image.open(path) as image:
+            image.load()
+    except (OSError, ValueError):
+        return None
+    if image.width > max_width:
+        image = image.resize((max_width, round(image.height * max_width / image.width)), Image.Resampling.LANCZOS)
+    buf = io.BytesIO()
+    if image.mode in ("RGBA", "LA", "P") or "transparency" in image.info:
+        image.convert("RGBA").quantize(colors=256, method=Image.Quantize.FASTOCTREE).save(buf, format="PNG", optimize=True)
+        fmt = "PNG"
+    else:
+        image.convert("RGB").save(buf, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+        fmt = "JPEG"
+    return ImageAsset(buf.getvalue(), fmt, image.size, source_bytes)
+
+
+class AssetCache:
+    """(경로, 최대 폭) 별 화면용 그림. 없는 파일은 negative_ttl 초 동안 None 으로 기억합니다."""
+
+    def __init__(self, negative_ttl=NEGATIVE_TTL):
+        self.negative_ttl = negative_ttl
+        self._entries = {}  # key -> (ImageAsset 또는 None, 확인한 시각)
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(("hits", "negative_hits", "loads"), 0)
+
+    def get(self, path, max_width=DISPLAY_WIDTH):
+        key = (os.path.abspath(path), max_width)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                asset, checked = entry
+                if asset is not None:
+                    self._stats["hits"] += 1
+                    return asset
+                if now - checked < self.negative_ttl:
+                    self._stats["negative_hits"] += 1
+                    return None
+        asset = _load(path, max_width)
+        with self._lock:
+            self._entries[key] = (asset, now)
+            self._stats["loads"] += 1
+        return asset
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries))
+
+
+@functools.lru_cache(maxsize=None)
+def asset_cache():
+    """프로세스 전체가 함께 쓰는 그림 캐시."""
+    return AssetCache()
+
+
+def show_image_asset(path, caption=None, width=DISPLAY_WIDTH):
+    """화면용 그림을 표시합니다. 파일이 없거나 읽을 수 없으면 아무것도 하지 않고 False."""
+    asset = asset_cache().get(path, width)
+    if asset is None:
+        return False
+    # 크기는 asset 이 이미 맞춰 두었으므로 Streamlit 이 다시 줄이지 않도록 원래 크기로 표시
+    st.image(asset.data, caption=caption, width="content", output_format=asset.format)
+    return True
@@ -0,0 +1,146 @@
+"""수업 중 문제별 응답 현황 (프로세스 안에서 모든 세션이 함께 쓰는 집계).
+
+학생이 답을 낼 때마다 해당 문제의 보기별 개수만 O(1) 로 고칩니다. 같은 학생이 답을
+바꾸면 이전 답(세션 상태에 보관)을 빼고 새 답을 더하므로 항상 "학생마다 마지막 답"
+기준입니다. 대시보드는 세션을 훑지 않고 문제 수에만 비례하는 스냅숏을 읽습니다.
+
+잠금은 문제 키의 해시로 고른 줄무늬(stripe) 잠금이라 동시에 답을 내는 학생들이
+서로 다른 문제라면 기다리지 않습니다.
+"""
+import functools
+import threading
+
+import streamlit as st
+
+STRIPES = 16
+_SESSION_KEY = "class_stats_answers"
+
+
+class QuestionStats:
+    __slots__ = ("page", "topic", "answered", "correct", "choices")
+
+    def __init__(self, page, topic):
+        self.page = page
+        self.topic = topic
+        self.answered = 0
+        self.correct = 0
+        self.choices = {}
+
+
+class _Stripe:
+    __slots__ = ("table", "lock", "generation")
+
+    def __init__(self):
+        self.table = {}
+        self.lock = threading.Lock()
+        # 이 줄무늬를 마지막으로 비운 세대. 집계의 세대보다 작으면 쓰기 전에 비웁니다.
+        self.generation = 0
+
+
+class ClassAggregate:
+    """(page, topic) 별 응답 수·정답 수·보기별 개수."""
+
+    def __init__(self, stripes=STRIPES):
+        self._stripes = [_Stripe() for _ in range(stripes)]
+        self._students = 0
+        self._students_lock = threading.Lock()
+        # reset() 마다 1 씩 늘어나며, 이전 세대에 낸 답은 다시 빼지 않습니다.
+        self.generation = 0
+
+    def _stripe(self, key):
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def _sync(self, stripe):
+        # stripe.lock 을 잡은 채로 부릅니다. reset() 뒤 아직 비우지 않은 줄무늬를 비웁니다.
+        generation = self.generation
+        if stripe.generation != generation:
+            stripe.table.clear()
+            stripe.generation = generation
+        return generation
+
+    def add_student(self, generation):
+        """generation 세대의 학생 한 명을 셉니다. 그사이 집계를 비웠으면 세지 않습니다."""
+        with self._students_lock:
+            if generation == self.generation:
+                self._students += 1
+
+    def update(self, page, topic, choice, correct, previous=None, generation=None):
+        """답 하나를 반영하고, 반영한 세대를 돌려줍니다.
+
+        previous=(이전 답, 이전 정답 여부) 이면 그것을 먼저 뺍니다. 다만 previous 를 낸 세대
+        generation 이 지금 세대와 다르면(그사이 reset) 이미 비운 집계이므로 빼지 않습니다.
+        choices 는 (답, 정답 여부) 별 개수입니다.
+        """
+        key = (page, topic)
+        stripe = self._stripe(key)
+        with stripe.lock:
+            current = self._sync(stripe)
+            if generation is not None and generation != current:
+                previous = None
+            table = stripe.table
+            stats = table.get(key)
+            if stats is None:
+                stats = table[key] = QuestionStats(page, topic)
+            if previous is not None:
+                old_choice, old_correct = previous
+                stats.answered -= 1
+                stats.correct -= int(old_correct)
+                old_key = (old_choice, old_correct)
+                left = stats.choices.get(old_key, 0) - 1
+                if left > 0:
+                    stats.choices[old_key] = left
+                else:
+                    stats.choices.pop(old_key, None)
+            stats.answered += 1
+            stats.correct += int(correct)
+            stats.choices[choice, correct] = stats.choices.get((choice, correct), 0) + 1
+            return current
+
+    def snapshot(self):
+        """(학생 수, [{page, topic, answered, correct, choices}, ...]) — 줄무늬마다 잠깐씩만 잠급니다."""
+        rows = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                self._sync(stripe)
+                rows.extend({"page": s.page, "topic": s.topic, "answered": s.answered,
+                             "correct": s.correct, "choices": dict(s.choices)} for s in stripe.table.values())
+        return self._students, rows
+
+    def reset(self):
+        # 세대를 먼저 올려, 비우는 동안 들어온 이전 세대의 답이 새 집계에 남지 않게 합니다.
+        with self._students_lock:
+            self._students = 0
+            self.generation += 1
+        for stripe in self._stripes:
+            with stripe.lock:
+                self._sync(stripe)
+
+
+@functools.lru_cache(maxsize=None)
+def class_aggregate():
+    """프로세스 전체가 함께 쓰는 집계."""
+    return ClassAggregate()
+
+
+def count_answer(page, topic, question, choice, correct):
+    """현재 세션의 답을 집계에 반영합니다. question 은 같은 문제를 다시 풀었는지 알아보는 키."""
+    aggregate = class_aggregate()
+    state = st.session_state.get(_SESSION_KEY)
+    # 처음 답하는 세션이거나 집계를 비운 뒤라면 새 학생으로 셉니다.
+    if state is None or state["generation"] != aggregate.generation:
+        state = st.session_state[_SESSION_KEY] = {"generation": aggregate.generation, "answers": {}}
+        aggregate.add_student(state["generation"])
+    key = (page, question)
+    choice = "(무응답)" if choice is None else str(choice)
+    correct = bool(correct)
+    applied = aggregate.update(page, topic, choice, correct, state["answers"].get(key), state["generation"])
+    if applied != state["generation"]:
+        # 답하는 사이에 집계를 비웠으면 이 답은 새 세대의 첫 답으로 들어갔습니다.
+        state = st.session_state[_SESSION_KEY] = {"generation": applied, "answers": {}}
+        aggregate.add_student(applied)
+    state["answers"][key] = (choice, correct)
+
+
+def reset_class_stats():
+    """새 수업을 위해 집계를 비웁니다. 이전 수업에 낸 답은 새 집계에서 빼지 않습니다."""
+    class_aggregate().reset()
@@ -0,0 +1,321 @@
+"""브라우저에서 직접 그리는 유리함수 그래프 (서버 왕복 없이 슬라이더로 다시 그림).
+
+서버는 지금 슬라이더 값만 담은 HTML 한 번만 보내고, 이후 슬라이더 조작은 모두
+브라우저의 JavaScript 가 처리합니다. 곡선 표본은 utils/sampling.adaptive_sample 을
+그대로 옮긴 adaptiveSample() 로 구하므로 (같은 budget·허용 오차·극 분할·화면 밖 자르기)
+서버에서 그린 그림(utils/rational_plots)과 같은 점으로 그려집니다. 점근선과 c = 0 분기도
+draw_linear_fractional 과 같은 규칙입니다.
+"""
+import json
+from string import Template
+
+import streamlit as st
+
+# 공통: 좌표축·격자·곡선·범례를 그리는 작은 캔버스 차트
+_CHART_JS = r"""
+const XMIN = -10, XMAX = 10, YMIN = -10, YMAX = 10;
+
+// utils/sampling.adaptive_sample 과 같은 알고리즘: 극(breaks)마다 끊고, 화면에서 현과 많이
+// 벌어지는 구간의 가운데에만 점을 더 넣습니다. 구간별 [xs, ys] 목록을 돌려줍니다.
+const SAMPLE_BUDGET = 240, SAMPLE_INITIAL = 17, SAMPLE_TOL = 1e-3, POLE_OFFSET = 1e-9;
+
+function adaptiveSample(f, breaks) {
+  const xSpan = XMAX - XMIN, ySpan = YMAX - YMIN;
+  const loClip = YMIN - ySpan, hiClip = YMAX + ySpan;
+  const offset = xSpan * POLE_OFFSET, minDx = xSpan * POLE_OFFSET * 10;
+  const clip = y => Number.isNaN(y) ? NaN : Math.min(Math.max(y, loClip), hiClip);
+
+  const inside = breaks.filter(p => XMIN < p && p < XMAX).sort((p, q) => p - q);
+  const edges = [XMIN, ...inside, XMAX];
+  const bounds = [];
+  for (let i = 0; i < edges.length - 1; i++) {
+    const lo = edges[i] + (i > 0 ? offset : 0);
+    const hi = edges[i + 1] - (i < edges.length - 2 ? offset : 0);
+    if (lo < hi) bounds.push([lo, hi]);
+  }
+  if (!bounds.length) return [];
+
+  const initial = Math.max(3, Math.min(SAMPLE_INITIAL, Math.floor(SAMPLE_BUDGET / bounds.length)));
+  let xs = [], ys = [], seg = [];
+  bounds.forEach(([lo, hi], k) => {
+    for (let i = 0; i < initial; i++) {
+      const x = i === initial - 1 ? hi : lo + (hi - lo) * (i / (initial - 1));
+      xs.push(x); ys.push(clip(f(x))); seg.push(k);
+    }
+  });
+
+  while (xs.length < SAMPLE_BUDGET) {
+    const cand = [];
+    for (let i = 0; i < xs.length - 1; i++) {
+      if (seg[i] !== seg[i + 1] || !(xs[i + 1] - xs[i] > minDx)) continue;
+      const xm = 0.5 * (xs[i] + xs[i + 1]);
+      const ym = clip(f(xm));
+      let err = Math.abs(ym - 0.5 * (ys[i] + ys[i + 1])) / ySpan;
+      // 정의되지 않는 점(nan)과 맞닿은 구간은 경계를 찾을 때까지 나눕니다.
+      if (Number.isNaN(err)) {
+        const defined = Number.isFinite(ys[i]) + Number.isFinite(ys[i + 1]) + Number.isFinite(ym);
+        err = defined > 0 && defined < 3 ? Infinity : 0;
+      }
+      if (err > SAMPLE_TOL) cand.push({ i, xm, ym, err });
+    }
+    if (!cand.length) break;
+    const room = SAMPLE_BUDGET - xs.length;
+    const chosen = cand.length > room ? cand.sort((p, q) => q.err - p.err).slice(0, room) : cand;
+    const mid = new Map(chosen.map(c => [c.i, c]));
+    const nx = [], ny = [], ns = [];
+    for (let i = 0; i < xs.length; i++) {
+      nx.push(xs[i]); ny.push(ys[i]); ns.push(seg[i]);
+      const c = mid.get(i);
+      if (c) { nx.push(c.xm); ny.push(c.ym); ns.push(seg[i]); }
+    }
+    xs = nx; ys = ny; seg = ns;
+  }
+
+  const parts = [];
+  let start = 0;
+  for (let i = 1; i <= xs.length; i++) {
+    if (i === xs.length || seg[i] !== seg[i - 1]) {
+      parts.push([xs.slice(start, i), ys.slice(start, i)]);
+      start = i;
+    }
+  }
+  return parts;
+}
+
+// utils/rational.RationalFunction.evaluate 와 같이 분모가 (거의) 0 인 곳은 nan
+const DENOM_EPS = 1e-8;
+function ratio(num, den) { return Math.abs(den) <= DENOM_EPS ? NaN : num / den; }
+
+function fmt(v, digits) { return v.toFixed(digits); }
+
+function makeChart(canvas) {
+  const ctx = canvas.getContext("2d");
+  const pad = 34;
+  function resize() {
+    const size = Math.min(canvas.parentElement.clientWidth, 520);
+    const ratio = window.devicePixelRatio || 1;
+    canvas.style.width = size + "px";
+    canvas.style.height = size + "px";
+    canvas.width = size * ratio;
+    canvas.height = size * ratio;
+    ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+    return size;
+  }
+  let size = resize();
+  const chart = {
+    legend: [],
+    sx(x) { return pad + (x - XMIN) / (XMAX - XMIN) * (size - 2 * pad); },
+    sy(y) { return size - pad - (y - YMIN) / (YMAX - YMIN) * (size - 2 * pad); },
+    begin() {
+      size = resize();
+      this.legend = [];
+      ctx.clearRect(0, 0, size, size);
+      ctx.fillStyle = "#ffffff";
+      ctx.fillRect(0, 0, size, size);
+      ctx.font = "11px sans-serif";
+      ctx.lineWidth = 0.8;
+      for (let t = XMIN; t <= XMAX; t += 2.5) {
+        ctx.strokeStyle = "#b0b0b0";
+        ctx.beginPath();
+        ctx.moveTo(this.sx(t), this.sy(YMIN)); ctx.lineTo(this.sx(t), this.sy(YMAX));
+        ctx.moveTo(this.sx(XMIN), this.sy(t)); ctx.lineTo(this.sx(XMAX), this.sy(t));
+        ctx.stroke();
+        ctx.fillStyle = "#000000";
+        ctx.textAlign = "center";
+        ctx.fillText(String(t), this.sx(t), size - pad + 14);
+        ctx.textAlign = "right";
+        ctx.fillText(String(t), pad - 4, this.sy(t) + 4);
+      }
+      ctx.save();
+      ctx.beginPath();
+      ctx.rect(pad, pad, size - 2 * pad, size - 2 * pad);
+      ctx.clip();
+    },
+    curve(xs, ys, style) {
+      ctx.strokeStyle = style.color;
+      ctx.globalAlpha = style.alpha || 1;
+      ctx.lineWidth = style.width || 1.5;
+      ctx.setLineDash(style.dash || []);
+      ctx.beginPath();
+      let pen = false;
+      for (let i = 0; i < xs.length; i++) {
+        if (!Number.isFinite(ys[i])) { pen = false; continue; }
+        if (pen) ctx.lineTo(this.sx(xs[i]), this.sy(ys[i]));
+        else { ctx.moveTo(this.sx(xs[i]), this.sy(ys[i])); pen = true; }
+      }
+      ctx.stroke();
+      ctx.setLineDash([]);
+      ctx.globalAlpha = 1;
+      if (style.label) this.legend.push(style);
+    },
+    segments(parts, style) {
+      parts.forEach(([xs, ys], i) => this.curve(xs, ys, i === 0 ? style : { ...style, label: undefined }));
+    },
+    hline(y, style) { this.curve([XMIN, XMAX], [y, y], style); },
+    vline(x, style) {
+      ctx.strokeStyle = style.color;
+      ctx.globalAlpha = style.alpha || 1;
+      ctx.lineWidth = style.width || 1.5;
+      ctx.setLineDash(style.dash || []);
+      ctx.beginPath();
+      ctx.moveTo(this.sx(x), this.sy(YMIN)); ctx.lineTo(this.sx(x), this.sy(YMAX));
+      ctx.stroke();
+      ctx.setLineDash([]);
+      ctx.globalAlpha = 1;
+      if (style.label) this.legend.push(style);
+    },
+    text(msg) {
+      ctx.fillStyle = "#000000";
+      ctx.textAlign = "center";
+      ctx.fillText(msg, size / 2, size / 2);
+    },
+    end() {
+      ctx.restore();
+      ctx.strokeStyle = "#000000";
+      ctx.lineWidth = 0.8;
+      ctx.strokeRect(pad, pad, size - 2 * pad, size - 2 * pad);
+      if (!this.legend.length) return;
+      ctx.font = "12px sans-serif";
+      const w = Math.max(...this.legend.map(s => ctx.measureText(s.label).width)) + 44;
+      const h = this.legend.length * 18 + 8;
+      const x0 = size - pad - w - 6, y0 = pad + 6;
+      ctx.fillStyle = "rgba(255,255,255,0.8)";
+      ctx.fillRect(x0, y0, w, h);
+      ctx.strokeStyle = "#cccccc";
+      ctx.strokeRect(x0, y0, w, h);
+      this.legend.forEach((s, i) => {
+        const y = y0 + 14 + i * 18;
+        ctx.strokeStyle = s.color;
+        ctx.globalAlpha = s.alpha || 1;
+        ctx.lineWidth = s.width || 1.5;
+        ctx.setLineDash(s.dash || []);
+        ctx.beginPath(); ctx.moveTo(x0 + 6, y - 4); ctx.lineTo(x0 + 30, y - 4); ctx.stroke();
+        ctx.setLineDash([]);
+        ctx.globalAlpha = 1;
+        ctx.fillStyle = "#000000";
+        ctx.textAlign = "left";
+        ctx.fillText(s.label, x0 + 36, y);
+      });
+    },
+  };
+  return chart;
+}
+
+function bindSliders(specs, onChange) {
+  const box = document.getElementById("sliders");
+  const inputs = {};
+  specs.forEach(sp => {
+    const row = document.createElement("label");
+    row.className = "row";
+    row.innerHTML = `<span>${sp.label}</span><input type="range" min="${sp.min}" max="${sp.max}" step="${sp.step}" value="${sp.value}"><b></b>`;
+    box.appendChild(row);
+    const input = row.querySelector("input");
+    const out = row.querySelector("b");
+    const digits = String(sp.step).includes(".") ? String(sp.step).split(".")[1].length : 0;
+    input.addEventListener("input", () => { out.textContent = fmt(parseFloat(input.value), digits); onChange(); });
+    out.textContent = fmt(parseFloat(input.value), digits);
+    inputs[sp.name] = input;
+  });
+  return name => parseFloat(inputs[name].value);
+}
+"""
+
+_PAGE = Template(r"""
+<style>
+  body { margin: 0; font-family: 'Noto Sans KR', sans-serif; }
+  #sliders .row { display: grid; grid-template-columns: 90px 1fr 48px; align-items: center; gap: 8px; margin: 4px 0; }
+  #sliders input { width: 100%; accent-color: rgb(153,70,95); }
+  #msg { min-height: 1.4em; margin: 6px 0; font-size: 14px; }
+  #msg.error { color: #b00020; }
+  #msg.info { color: #0b5394; }
+</style>
+<div id="sliders"></div>
+<div id="msg"></div>
+<div><canvas id="chart"></canvas></div>
+<script>
+$chart_js
+const SLIDERS = $sliders;
+$body
+</script>
+""")
+
+# y = a/x : 서버의 draw_inverse_proportion 과 같은 적응형 표본 (x = 0 에서 끊음)
+_INVERSE_PROPORTION_JS = r"""
+const chart = makeChart(document.getElementById("chart"));
+const value = bindSliders(SLIDERS, draw);
+function draw() {
+  const a = value("a");
+  chart.begin();
+  chart.segments(adaptiveSample(x => ratio(a, x), [0]), { color: "#1f77b4", label: "y = " + fmt(a, 1) + "/x" });
+  chart.hline(0, { color: "#000000", width: 1 });
+  chart.vline(0, { color: "#000000", width: 1 });
+  chart.end();
+}
+draw();
+window.addEventListener("resize", draw);
+"""
+
+# y = (ax + b)/(cx + d) : 서버의 draw_linear_fractional 과 같은 c = 0 분기·적응형 표본·점근선
+_LINEAR_FRACTIONAL_JS = r"""
+const chart = makeChart(document.getElementById("chart"));
+const value = bindSliders(SLIDERS, draw);
+const msg = document.getElementById("msg");
+
+function say(kind, text) { msg.className = kind; msg.textContent = text; }
+
+function draw() {
+  const a = value("a"), b = value("b"), c = value("c"), d = value("d");
+  say("", "");
+  chart.begin();
+  if (Math.abs(c) < 1e-9) {
+    if (Math.abs(d) < 1e-9) {
+      say("error", "⚠️ c = 0 이고 d = 0 이면 함수가 정의되지 않습니다.");
+      chart.text("함수 불가");
+    } else {
+      const slope = a / d, intercept = b / d;
+      chart.segments(adaptiveSample(x => ratio(a * x + b, d), []),
+                     { color: "green", label: "y = " + fmt(slope, 2) + "x + " + fmt(intercept, 2) });
+      say("info", "✅ c = 0 이므로 함수는 일차함수 형태입니다.");
+    }
+  } else {
+    const asymX = -d / c;
+    chart.segments(adaptiveSample(x => ratio(a * x + b, c * x + d), [asymX]), { color: "tomato" });
+    if (XMIN < asymX && asymX < XMAX) {
+      chart.vline(asymX, { color: "gray", dash: [6, 4], label: "x = " + fmt(asymX, 2) + " (수직점근선)" });
+    }
+    const horiz = a / c;
+    if (YMIN < horiz && horiz < YMAX) {
+      chart.hline(horiz, { color: "purple", dash: [6, 4], label: "y = " + fmt(horiz, 2) + " (수평점근선)" });
+    } else {
+      chart.hline(horiz, { color: "purple", dash: [6, 4], alpha: 0.5 });
+    }
+  }
+  chart.hline(0, { color: "#000000", width: 1 });
+  chart.vline(0, { color: "#000000", width: 1 });
+  chart.end();
+}
+draw();
+window.addEventListener("resize", draw);
+"""
+
+
+def _render(sliders, body, height):
+    html = _PAGE.substitute(chart_js=_CHART_JS, sliders=json.dumps(sliders, ensure_ascii=False), body=body)
+    st.iframe(html, height=height)
+
+
+def inverse_proportion_chart(a=1.0):
+    """y = a/x 그래프를 브라우저 쪽 슬라이더와 함께 표시합니다. 슬라이더는 a 에서 시작합니다."""
+    sliders = [{"name": "a", "label": "a 값 조절", "min": -5.0, "max": 5.0, "step": 0.1, "value": a}]
+    _render(sliders, _INVERSE_PROPORTION_JS, height=600)
+
+
+def linear_fractional_chart(a=1.0, b=0.0, c=1.0, d=0.0):
+    """y = (ax + b)/(cx + d) 그래프를 브라우저 쪽 슬라이더와 함께 표시합니다. 슬라이더는 주어진 값에서 시작합니다."""
+    sliders = [
+        {"name": "a", "label": "a", "min": -5.0, "max": 5.0, "step": 0.1, "value": a},
+        {"name": "b", "label": "b", "min": -10.0, "max": 10.0, "step": 0.5, "value": b},
+        {"name": "c", "label": "c (0 가능)", "min": -5.0, "max": 5.0, "step": 0.1, "value": c},
+        {"name": "d", "label": "d", "min": -10.0, "max": 10.0, "step": 0.5, "value": d},
+    ]
+    _render(sliders, _LINEAR_FRACTIONAL_JS, height=720)
@@ -0,0 +1,116 @@
+"""슬라이더를 끄는 동안 쌓이는 중간 값 그림을 건너뛰고 최신 값만 그리기.
+
+    with frame("03", "inverse"):
+        show_cached_figure(...)
+
+슬라이더를 끌면 브라우저가 중간 값마다 다시 실행을 요청합니다. Streamlit 은 새 요청이 오면
+실행 중인 스크립트를 다음 st 호출 지점에서 멈추지만, matplotlib 로 그리는 동안에는 그런
+지점이 없어 이미 지나간 값의 그림도 끝까지 그려집니다. frame() 은 앞 그림이 새 값에 밀려
+멈췄을 때(= 끄는 중)에만 같은 구간의 그림 사이에 최소 간격을 두고, 기다리는 동안 짧게
+쉬면서 가벼운 st 호출(빈 자리 갱신)을 끼워 넣어 그 사이에 온 새 값이 지금 실행을 멈추게
+합니다. 그래서 빠르게 끄는 동안에는 간격마다 최신 값 하나만 그려지고, 앞 그림을 다 그린
+뒤에 온 값(손을 뗀 뒤의 마지막 값 등)은 기다리지 않고 바로 그려집니다.
+
+구간 안에서(또는 기다리다가) Streamlit 의 RerunException·StopException 으로 멈춘 실행만
+"버린 그림"으로 셉니다. 다른 예외는 세지 않고 그대로 올려 보냅니다. 세션별 수는
+?plotinfo=1 일 때 그림 아래에, 프로세스 전체 합은 frame_stats() 로 볼 수 있습니다.
+(구간에 닿기 전에 Streamlit 이 합쳐 버린 요청은 셀 수 없습니다)
+
+    MATHHH_MIN_FRAME_MS  같은 구간 그림 사이의 최소 간격(ms, 기본 50. 0 이면 기다리지 않음)
+"""
+import os
+import threading
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import RerunException, StopException
+
+MIN_FRAME_MS = float(os.environ.get("MATHHH_MIN_FRAME_MS", 50))
+# 기다리는 동안 새 값이 왔는지 확인하는 간격(초)
+POLL_INTERVAL = 0.01
+# 새 값(또는 중지)에 밀려 실행이 멈출 때 Streamlit 이 던지는 예외
+_INTERRUPTS = (RerunException, StopException)
+
+_lock = threading.Lock()
+# (page, section) -> [그린 수, 버린 수, 기다린 시간 합(초)]
+_totals = {}
+
+
+class _Frame:
+    __slots__ = ("key", "state", "min_interval")
+
+    def __init__(self, key, state, min_interval):
+        self.key = key
+        self.state = state
+        self.min_interval = min_interval
+
+    def __enter__(self):
+        state = self.state
+        # 앞 그림이 새 값에 밀려 멈췄다면 끄는 중이므로 최소 간격을 지킵니다.
+        if state["pending"]:
+            try:
+                waited = _wait(state["last"] + self.min_interval - time.monotonic())
+            except _INTERRUPTS:
+                self._drop()
+                raise
+            _add(self.key, 0, 0, waited)
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        state = self.state
+        if exc_type is None:
+            state.update(pending=False, last=time.monotonic())
+            state["drawn"] += 1
+            _add(self.key, 1, 0, 0.0)
+            if "plotinfo" in st.query_params:
+                st.caption(f"그림 합치기: 그림 {state['drawn']} · 버림 {state['dropped']} "
+                           f"(최소 간격 {self.min_interval * 1000:g} ms)")
+        elif issubclass(exc_type, _INTERRUPTS):
+            self._drop()
+        else:
+            state["pending"] = False
+        return False
+
+    def _drop(self):
+        self.state["pending"] = True
+        self.state["dropped"] += 1
+        _add(self.key, 0, 1, 0.0)
+
+
+def _wait(remaining):
+    """remaining 초를 기다리며 st 호출 지점을 만들어 줍니다. 기다린 시간(초)을 돌려줍니다."""
+    if remaining <= 0:
+        return 0.0
+    start = time.monotonic()
+    checkpoint = st.empty()
+    deadline = start + remaining
+    while True:
+        now = time.monotonic()
+        if now >= deadline:
+            return now - start
+        time.sleep(min(POLL_INTERVAL, deadline - now))
+        # 빈 자리를 다시 비우는 것만으로도 메시지가 나가므로 새 요청이 있으면 여기서 멈춥니다.
+        checkpoint.empty()
+
+
+def _add(key, drawn, dropped, waited):
+    with _lock:
+        totals = _totals.setdefault(key, [0, 0, 0.0])
+        totals[0] += drawn
+        totals[1] += dropped
+        totals[2] += waited
+
+
+def frame(page, name, min_interval_ms=None):
+    """page 의 name 그림을 그리는 구간. 새 값에 밀린 그림을 세고, 끄는 중이면 최소 간격을 지킵니다."""
+    interval = MIN_FRAME_MS if min_interval_ms is None else min_interval_ms
+    frames = st.session_state.setdefault("_frames", {})
+    state = frames.setdefault((page, name), {"last": 0.0, "pending": False, "drawn": 0, "dropped": 0})
+    return _Frame((page, name), state, interval / 1000)
+
+
+def frame_stats():
+    """프로세스 전체의 구간별 {"drawn", "dropped", "waited_s"}."""
+    with _lock:
+        return {key: {"drawn": d, "dropped": x, "waited_s": round(w, 3)}
+                for key, (d, x, w) in _totals.items()}
@@ -0,0 +1,220 @@
+"""그림을 접속한 기기와 네트워크에 맞는 형식·해상도로 보냅니다.
+
+학교 와이파이처럼 느린 망에서는 재실행마다 보내는 그림 용량이 지연의 대부분이므로,
+    - 해상도(DPI)는 화면 폭에 맞춰 고르고 (쿼리 ?vw=390&dpr=3, 없으면 User-Agent 로 추정)
+    - 형식은 png(무손실), png8(팔레트 양자화, 기본값), webp(손실 압축), svg(경로 단순화
+      벡터) 가운데 환경 변수 MATHHH_PLOT_FORMAT 으로 고릅니다. 고정 형식은 한 번만
+      인코딩하고 화질(PSNR)은 재지 않습니다.
+    - MATHHH_PLOT_FORMAT=auto 는 진단용입니다. MATHHH_PLOT_AUTO_FORMATS 후보를 모두
+      인코딩하고 다시 풀어 PSNR 을 잰 뒤, MATHHH_PLOT_MIN_PSNR(dB) 이상인 것 가운데
+      전송량이 가장 작은 형식을 고르므로 그림마다 CPU 를 두 배 가까이 씁니다.
+      주소에 ?plotinfo=1 을 붙이면 그림마다 후보별 용량·인코딩 시간·PSNR 을 보여 주니,
+      형식을 정할 때만 켜서 비교하세요.
+
+st.image 는 PNG 가 아닌 바이트를 JPEG/PNG 로 다시 인코딩하므로 webp, svg 는
+data URI 로 넘겨 그대로 전달되게 합니다. (전송량은 base64 로 늘어난 크기로 계산)
+"""
+import base64
+import io
+import os
+import time
+from dataclasses import dataclass
+
+import streamlit as st
+
+FORMATS = ("png", "png8", "webp", "svg")
+PLOT_FORMAT = os.environ.get("MATHHH_PLOT_FORMAT", "png8")
+AUTO_FORMATS = tuple(os.environ.get("MATHHH_PLOT_AUTO_FORMATS", "png8,webp").split(","))
+MIN_PSNR = float(os.environ.get("MATHHH_PLOT_MIN_PSNR", "38"))
+
+# 예전 st.pyplot 의 200 DPI 를 상한으로 두고, 정적 그림 캐시가 커지지 않도록 25 단위로 맞춤
+MIN_DPI = 75
+MAX_DPI = 200
+DPI_STEP = 25
+# 이보다 높은 픽셀 비율은 눈으로 차이가 거의 없어 2 배까지만 맞춥니다.
+MAX_PIXEL_RATIO = 2
+MAX_CONTENT_WIDTH = 730  # Streamlit 가운데 정렬 레이아웃의 본문 최대 폭 (CSS px)
+MOBILE_VIEWPORT = (390, 3)
+DESKTOP_VIEWPORT = (MAX_CONTENT_WIDTH, 2)
+_MOBILE_MARKERS = ("Mobi", "Android", "iPhone", "iPad")
+
+PNG8_COLORS = 64
+WEBP_QUALITY = 80
+SVG_RC = {"path.simplify": True, "path.simplify_threshold": 0.5, "svg.fonttype": "none"}
+
+_MIME = {"png": "image/png", "png8": "image/png", "webp": "image/webp", "svg": "image/svg+xml"}
+
+
+@dataclass(frozen=True)
+class EncodedFigure:
+    """한 형식으로 인코딩한 그림. psnr 은 재지 않았거나 벡터(svg)·무손실(png)이면 None."""
+
+    format: str
+    data: bytes
+    encode_ms: float
+    psnr: object = None
+
+    @property
+    def inline(self):
+        # PNG 는 st.image 가 그대로 보내고, 나머지는 data URI 로 넘깁니다.
+        return self.format not in ("png", "png8")
+
+    @property
+    def wire_bytes(self):
+        return 4 * ((len(self.data) + 2) // 3) if self.inline else len(self.data)
+
+    def image_source(self):
+        if self.inline:
+            return f"data:{_MIME[self.format]};base64,{base64.b64encode(self.data).decode('ascii')}"
+        return self.data
+
+
+@dataclass(frozen=True)
+class DeliveryReport:
+    """그림 한 장의 전달 결과: 고른 형식과 비교한 후보들."""
+
+    dpi: int
+    render_ms: float
+    chosen: EncodedFigure
+    candidates: tuple
+
+
+# -----------------------
+# 해상도
+# -----------------------
+def client_viewport():
+    """(CSS 폭 px, 기기 픽셀 비율). 쿼리 ?vw=&dpr= 이 있으면 그 값, 없으면 User-Agent 로 추정."""
+    try:
+        return float(st.query_params["vw"]), float(st.query_params.get("dpr", 1))
+    except (KeyError, ValueError):
+        pass
+    try:
+        agent = st.context.headers.get("User-Agent", "")
+    except Exception:  # 스크립트 실행 문맥 밖 (AppTest, 미리 렌더링 등)
+        agent = ""
+    return MOBILE_VIEWPORT if any(m in agent for m in _MOBILE_MARKERS) else DESKTOP_VIEWPORT
+
+
+def choose_dpi(fig_width_in, viewport=None):
+    """그림 폭(인치)이 화면에 꽉 차게 보일 때 기기 픽셀과 맞먹는 DPI."""
+    css_width, ratio = viewport or client_viewport()
+    pixels = min(css_width, MAX_CONTENT_WIDTH) * min(ratio, MAX_PIXEL_RATIO)
+    dpi = round(pixels / fig_width_in / DPI_STEP) * DPI_STEP
+    return int(min(MAX_DPI, max(MIN_DPI, dpi)))
+
+
+# -----------------------
+# 인코딩
+# -----------------------
+def _render(fig, dpi):
+    # 모든 래스터 형식의 원본이자 PSNR 기준. 바로 다시 풀 것이므로 압축은 최소로 합니다.
+    from PIL import Image
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight", pil_kwargs={"compress_level": 1})
+    buf.seek(0)
+    return Image.open(buf).convert("RGB")
+
+
+def _psnr(reference, data):
+    import numpy as np
+    from PIL import Image
+
+    a = np.asarray(reference, dtype=np.float32)
+    b = np.asarray(Image.open(io.BytesIO(data)).convert("RGB"), dtype=np.float32)
+    mse = float(((a - b) ** 2).mean())
+    return float("inf") if mse == 0 else 10 * np.log10(255 ** 2 / mse)
+
+
+def _encode_png(fig, image, dpi):
+    buf = io.BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _encode_png8(fig, image, dpi):
+    from PIL import Image
+
+    buf = io.BytesIO()
+    image.quantize(colors=PNG8_COLORS, method=Image.Quantize.FASTOCTREE).save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+def _encode_webp(fig, image, dpi):
+    buf = io.BytesIO()
+    image.save(buf, format="WEBP", quality=WEBP_QUALITY, method=4)
+    return buf.getvalue()
+
+
+def _encode_svg(fig, image, dpi):
+    from matplotlib import rc_context
+
+    buf = io.BytesIO()
+    with rc_context(SVG_RC):
+        fig.savefig(buf, format="svg", bbox_inches="tight")
+    return buf.getvalue()
+
+
+_ENCODERS = {"png": _encode_png, "png8": _encode_png8, "webp": _encode_webp, "svg": _encode_svg}
+# 원본과 달라질 수 있어 PSNR 을 잴 수 있는 형식
+_LOSSY = ("png8", "webp")
+
+
+def encode(fig, fmt, dpi, image=None, measure=False):
+    """fig 를 fmt 형식으로 인코딩합니다. image 는 같은 DPI 로 미리 렌더링한 원본(있으면 재사용).
+
+    measure 이면 손실 형식의 결과를 다시 풀어 원본 대비 PSNR 도 잽니다. (auto 진단용)
+    """
+    if fmt not in _ENCODERS:
+        raise ValueError(f"지원하지 않는 그림 형식: {fmt} (가능: {', '.join(FORMATS)})")
+    if image is None and fmt != "svg":
+        image = _render(fig, dpi)
+    start = time.perf_counter()
+    data = _ENCODERS[fmt](fig, image, dpi)
+    encode_ms = (time.perf_counter() - start) * 1000
+    psnr = _psnr(image, data) if measure and fmt in _LOSSY else None
+    return EncodedFigure(fmt, data, encode_ms, psnr)
+
+
+def deliver(fig, fmt=None, dpi=None, min_psnr=MIN_PSNR):
+    """fig 를 보낼 형식으로 인코딩해 DeliveryReport 로 돌려줍니다.
+
+    고정 형식이면 한 번만 인코딩합니다. fmt 가 auto(진단용)이면 AUTO_FORMATS 를 모두
+    인코딩해, PSNR 기준을 넘는 것 가운데 전송량이 가장 작은 것을 고릅니다.
+    (넘는 것이 없으면 무손실 png)
+    """
+    fmt = fmt or PLOT_FORMAT
+    dpi = dpi or choose_dpi(fig.get_size_inches()[0])
+    auto = fmt == "auto"
+    formats = AUTO_FORMATS if auto else (fmt,)
+
+    image, render_ms = None, 0.0
+    if any(f != "svg" for f in formats):
+        start = time.perf_counter()
+        image = _render(fig, dpi)
+        render_ms = (time.perf_counter() - start) * 1000
+
+    candidates = [encode(fig, f, dpi, image, measure=auto) for f in formats]
+    passing = [c for c in candidates if c.psnr is None or c.psnr >= min_psnr]
+    if not passing:
+        if image is None:
+            image = _render(fig, dpi)
+        passing = [encode(fig, "png", dpi, image)]
+        candidates += passing
+    chosen = min(passing, key=lambda c: c.wire_bytes)
+    return DeliveryReport(dpi, render_ms, chosen, tuple(candidates))
+
+
+# -----------------------
+# 표시
+# -----------------------
+def show_report(report):
+    """전달 결과의 그림을 본문 폭에 맞춰 표시합니다. (?plotinfo=1 이면 후보 비교도 표시)"""
+    st.image(report.chosen.image_source(), width="stretch", output_format="PNG")
+    if "plotinfo" in st.query_params:
+        parts = []
+        for c in report.candidates:
+            quality = "" if c.psnr is None else f", PSNR {c.psnr:.1f} dB"
+            mark = "✓ " if c is report.chosen else ""
+            parts.append(f"{mark}{c.format} {c.wire_bytes / 1024:.1f} KB, {c.encode_ms:.0f} ms{quality}")
+        st.caption(f"{report.dpi} DPI (렌더링 {report.render_ms:.0f} ms) · " + " · ".join(parts))
@@ -0,0 +1,358 @@
+"""유리식 계산 문제 생성기 (약분 · 통분 · 곱셈과 나눗셈).
+
+계수가 작은 정수인 다항식을 튜플(높은 차수부터)로 직접 계산하므로 SymPy 없이
+문제 하나를 수십 마이크로초에 만듭니다. 정답은 문제를 만든 인수에서 얻은 뒤 문제 식을
+정수 교차곱으로 다시 계산해 같은지 확인하고, 오답 보기는 학생들이 흔히 하는 실수
+(분자·분모끼리 더하기, 부호 실수, 다른 인수 지우기 등)로 만들되 정답과 같은 식이 되는
+것은 버립니다.
+
+같은 문제는 표준형(약분하지 않은 식을 내용 최대공약수·부호로 정리한 것, 덧셈·곱셈은
+두 항의 순서를 무시)의 해시로 걸러 냅니다.
+
+    rng = random.Random(seed)
+    problems = generate_unique(rng, 3)          # 약분, 통분, 곱셈·나눗셈 한 문제씩
+    problems[0].question, problems[0].answer, problems[0].options
+"""
+import functools
+import math
+import random
+import re
+from typing import NamedTuple
+
+# -----------------------
+# 정수 계수 다항식 (높은 차수부터 적은 튜플, 0 다항식은 (0,))
+# -----------------------
+ZERO = (0,)
+ONE = (1,)
+
+
+def _trim(p):
+    for i, coef in enumerate(p):
+        if coef:
+            return tuple(p[i:])
+    return ZERO
+
+
+def linear(r, k=1):
+    """k(x + r)."""
+    return (k, k * r)
+
+
+def padd(p, q):
+    n = max(len(p), len(q))
+    p = (0,) * (n - len(p)) + tuple(p)
+    q = (0,) * (n - len(q)) + tuple(q)
+    return _trim([a + b for a, b in zip(p, q)])
+
+
+def pneg(p):
+    return tuple(-a for a in p)
+
+
+def psub(p, q):
+    return padd(p, pneg(q))
+
+
+def pmul(p, q):
+    out = [0] * (len(p) + len(q) - 1)
+    for i, a in enumerate(p):
+        if a:
+            for j, b in enumerate(q):
+                out[i + j] += a * b
+    return _trim(out)
+
+
+def pscale(p, k):
+    return _trim([a * k for a in p])
+
+
+def peval(p, x):
+    value = 0
+    for coef in p:
+        value = value * x + coef
+    return value
+
+
+def _divide_root(p, r):
+    """p(x) ÷ (x − r) 의 몫 (나머지가 0 인 것을 확인한 뒤에만 부릅니다)."""
+    out = []
+    carry = 0
+    for coef in p[:-1]:
+        carry = carry * r + coef
+        out.append(carry)
+    return _trim(out)
+
+
+@functools.lru_cache(maxsize=1024)
+def _root_candidates(constant):
+    if constant == 0:
+        return (0,)
+    n = abs(constant)
+    divisors = [d for d in range(1, n + 1) if n % d == 0]
+    return tuple(v for d in divisors for v in (d, -d))
+
+
+def _integer_roots(p):
+    """정수 근 (중근은 한 번만). 최고차 계수로 나누어떨어지지 않는 근은 찾지 않습니다."""
+    roots = []
+    if len(p) < 2:
+        return roots
+    if p[-1] == 0:
+        roots.append(0)
+        p = _trim(p[:-1])
+    for r in _root_candidates(p[-1]) if len(p) > 1 else ():
+        if r and peval(p, r) == 0:
+            roots.append(r)
+    return roots
+
+
+# -----------------------
+# 유리식 num/den
+# -----------------------
+class Expr(NamedTuple):
+    """정수 계수 다항식의 분수 num/den."""
+
+    num: tuple
+    den: tuple = ONE
+
+    def __add__(self, other):
+        return Expr(padd(pmul(self.num, other.den), pmul(other.num, self.den)), pmul(self.den, other.den))
+
+    def __sub__(self, other):
+        return Expr(psub(pmul(self.num, other.den), pmul(other.num, self.den)), pmul(self.den, other.den))
+
+    def __mul__(self, other):
+        return Expr(pmul(self.num, other.num), pmul(self.den, other.den))
+
+    def __truediv__(self, other):
+        return Expr(pmul(self.num, other.den), pmul(self.den, other.num))
+
+    def equals(self, other):
+        """두 식이 같은 유리식인지 (정수 교차곱 비교)."""
+        return pmul(self.num, other.den) == pmul(other.num, self.den)
+
+    def normalized(self):
+        """내용 최대공약수로 나누고 분모의 최고차 계수를 양수로 맞춘 식 (약분은 하지 않음)."""
+        g = math.gcd(*self.num, *self.den)
+        if self.den[0] < 0:
+            g = -g
+        if g in (0, 1):
+            return self
+        return Expr(tuple(a // g for a in self.num), tuple(a // g for a in self.den))
+
+    def reduced(self):
+        """분모의 정수 근에 해당하는 공통 일차 인수를 모두 지운 표준형."""
+        num, den = self.num, self.den
+        if num == ZERO:
+            return Expr(ZERO, ONE)
+        changed = True
+        while changed and len(den) > 1:
+            changed = False
+            for r in _integer_roots(den):
+                if peval(num, r) == 0:
+                    num, den = _divide_root(num, r), _divide_root(den, r)
+                    changed = True
+                    break
+        return Expr(num, den).normalized()
+
+    def text(self, factor_den=True):
+        """학생용 표기: (x² + 3x + 2)/((x + 1)(x - 2)). factor_den 이면 분모를 일차식 곱으로 씁니다."""
+        num = format_poly(self.num)
+        if self.den == ONE:
+            return num
+        den = format_den(self.den) if factor_den else format_poly(self.den)
+        # 항이 여럿인 분자와, 수·x 의 거듭제곱·일차식 하나의 거듭제곱이 아닌 분모는 괄호로 묶습니다.
+        # (2x 처럼 계수가 붙은 단항식도 9/2x 가 (9/2)x 로 읽히지 않도록 묶음)
+        if " " in num:
+            num = f"({num})"
+        if not (_BARE_DEN.fullmatch(den) or den.startswith("(") and den.count("(") == 1):
+            den = f"({den})"
+        return f"{num}/{den}"
+
+    def operand(self):
+        """다른 식과 연산할 때의 표기. 분수이면 통째로 괄호로 묶습니다. ((a/b) ÷ (c/d) 와 같은 꼴)"""
+        text = self.text()
+        return f"({text})" if self.den != ONE else text
+
+
+_SUPERSCRIPTS = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+# 괄호 없이 분모에 둘 수 있는 단항: 수, x, x², x³ ...
+_BARE_DEN = re.compile(r"\d+|x[⁰¹²³⁴⁵⁶⁷⁸⁹]*")
+
+
+def format_poly(p):
+    degree = len(p) - 1
+    terms = []
+    for i, coef in enumerate(p):
+        if coef == 0:
+            continue
+        power = degree - i
+        if power == 0:
+            body = str(abs(coef))
+        else:
+            body = ("" if abs(coef) == 1 else str(abs(coef))) + "x" + (
+                str(power).translate(_SUPERSCRIPTS) if power > 1 else "")
+        if not terms:
+            terms.append(("-" if coef < 0 else "") + body)
+        else:
+            terms.append(("- " if coef < 0 else "+ ") + body)
+    return " ".join(terms) or "0"
+
+
+def format_den(p):
+    """일차식 곱으로 나누어지면 (x + 1)(x - 2) 꼴로, 아니면 전개식 그대로."""
+    if len(p) <= 2 or p[0] != 1:
+        return format_poly(p)
+    factors = []
+    rest = p
+    for r in _integer_roots(p):
+        power = 0
+        while len(rest) > 1 and peval(rest, r) == 0:
+            rest = _divide_root(rest, r)
+            power += 1
+        factor = "x" if r == 0 else f"({format_poly(linear(-r))})"
+        factors.append(factor + (str(power).translate(_SUPERSCRIPTS) if power > 1 else ""))
+    if rest != ONE:
+        return format_poly(p)
+    return "".join(factors)
+
+
+# -----------------------
+# 문제 종류별 생성
+# -----------------------
+KINDS = ("simplify", "add", "muldiv")
+PROMPTS = {
+    "simplify": "다음 식을 약분하시오",
+    "add": "다음 식을 통분하여 계산하시오",
+    "muldiv": "다음 식을 간단히 하시오",
+}
+TOPICS = {
+    "simplify": "유리식 약분 (자동 생성)",
+    "add": "유리식 통분 (자동 생성)",
+    "muldiv": "유리식 곱셈·나눗셈 (자동 생성)",
+}
+ROOTS = range(-6, 7)
+NUM_OPTIONS = 5
+
+
+class ExpressionProblem(NamedTuple):
+    kind: str
+    question: str
+    answer: str
+    options: tuple
+    key: tuple
+
+
+def _simplify(rng):
+    """k(x + s)(x + r) / ((x + t)(x + r)) 또는 k(x + s)(x + r) / (x + r)."""
+    r, s = rng.sample(ROOTS, 2)
+    k = rng.choice((1, 1, 1, 2, 3, -1))
+    f = linear(r)
+    p = linear(s, k)
+    q = linear(rng.choice([t for t in ROOTS if t != s])) if rng.random() < 0.6 else ONE
+    question = Expr(pmul(p, f), pmul(q, f))
+    answer = Expr(p, q)
+    wrongs = [
+        Expr(linear(-s, k), q),        # 부호 실수
+        Expr(q, p),                    # 분자·분모 뒤집기
+        Expr(pscale(f, k), q),         # 남길 인수와 지울 인수를 바꿈
+        Expr(pmul(p, f), q),           # 분모 쪽만 지움
+    ]
+    text = f"{PROMPTS['simplify']}: {question.text(factor_den=False)}"
+    return question, answer, wrongs, text, ("simplify",) + question.normalized()
+
+
+def _add(rng):
+    """a/(x + m) ± b/(x + n)."""
+    m, n = rng.sample(ROOTS, 2)
+    a, b = rng.randint(1, 6), rng.randint(1, 6)
+    op = rng.choice("+-")
+    left, right = Expr((a,), linear(m)), Expr((b,), linear(n))
+    question = left + right if op == "+" else left - right
+    sign = 1 if op == "+" else -1
+    den = pmul(linear(m), linear(n))
+    answer = Expr(padd(linear(n, a), linear(m, sign * b)), den)
+    wrongs = [
+        Expr((a + sign * b,), padd(linear(m), linear(n))),              # 분자끼리, 분모끼리 더함
+        Expr((a + sign * b,), den),                                     # 분자를 그냥 더함
+        Expr(padd(linear(m, a), linear(n, sign * b)), den),             # 엇갈려 곱할 인수를 바꿈
+        Expr(padd(linear(n, a), (sign * b, b * m)), den),               # 뒤 항의 상수항에 부호를 빠뜨림
+    ]
+    text = f"{PROMPTS['add']}: {left.operand()} {op} {right.operand()}"
+    terms = sorted((left.normalized(), right.normalized())) if op == "+" else (left.normalized(), right.normalized())
+    return question, answer, wrongs, text, ("add", op, *terms)
+
+
+def _muldiv(rng):
+    """(x + p)(x + q)/(x + r) × (x + r)/(x + p)  또는  ÷ (x + p)/(x + r)."""
+    p, q, r = rng.sample(ROOTS, 3)
+    left = Expr(pmul(linear(p), linear(q)), linear(r))
+    op = rng.choice("×÷")
+    right = Expr(linear(r), linear(p)) if op == "×" else Expr(linear(p), linear(r))
+    question = left * right if op == "×" else left / right
+    answer = Expr(linear(q))
+    wrongs = [
+        Expr(linear(-q)),                               # 부호 실수
+        Expr(linear(p)),                                # 다른 인수를 남김
+        Expr(linear(q), linear(r)),                     # 분모를 지우지 않음
+        Expr(pmul(linear(q), linear(r)), linear(p)),    # 지울 인수를 잘못 고름
+    ]
+    text = f"{PROMPTS['muldiv']}: {left.operand()} {op} {right.operand()}"
+    terms = sorted((left.normalized(), right.normalized())) if op == "×" else (left.normalized(), right.normalized())
+    return question, answer, wrongs, text, ("muldiv", op, *terms)
+
+
+_BUILDERS = {"simplify": _simplify, "add": _add, "muldiv": _muldiv}
+
+
+def _perturb(answer, rng):
+    """정답 분자의 상수항을 조금 바꾼 보기 (실수 보기가 모자랄 때)."""
+    delta = rng.choice((-2, -1, 1, 2))
+    return Expr(padd(answer.num, (delta,)), answer.den)
+
+
+def generate(rng=random, kind=None):
+    """kind(약분 simplify, 통분 add, 곱셈·나눗셈 muldiv) 문제 하나. 보기는 정답 포함 5개."""
+    kind = kind or rng.choice(KINDS)
+    question, answer, wrongs, text, key = _BUILDERS[kind](rng)
+    if not question.equals(answer):
+        raise AssertionError(f"정답 검산 실패: {text} → {answer.text()}")
+
+    answer = answer.reduced()
+    seen = {answer}
+    options = [answer.text()]
+    candidates = iter(wrongs)
+    while len(options) < NUM_OPTIONS:
+        wrong = next(candidates, None) or _perturb(answer, rng)
+        if wrong.den == ZERO:
+            continue
+        wrong = wrong.reduced()
+        # 정답과 같은 식이거나 이미 있는 보기와 같은 식은 버림
+        if wrong in seen or wrong.equals(answer):
+            continue
+        seen.add(wrong)
+        options.append(wrong.text())
+    correct = options[0]
+    rng.shuffle(options)
+    return ExpressionProblem(kind, text, correct, tuple(options), key)
+
+
+def generate_unique(rng=random, count=3, kinds=KINDS, seen=None, max_attempts=None):
+    """서로 다른 문제 count 개. kinds 를 차례로 돌며 만들고, 표준형이 겹치는 문제는 다시 뽑습니다.
+
+    seen 에 이미 낸 문제의 key 집합을 주면 그것과도 겹치지 않게 하고, 새 key 를 더해 둡니다.
+    """
+    seen = set() if seen is None else seen
+    max_attempts = max_attempts or count * 50
+    problems = []
+    attempts = 0
+    while len(problems) < count:
+        attempts += 1
+        if attempts > max_attempts:
+            raise ValueError(f"서로 다른 문제를 {count}개 만들지 못했습니다 ({len(problems)}개에서 멈춤)")
+        problem = generate(rng, kinds[len(problems) % len(kinds)])
+        if problem.key in seen:
+            continue
+        seen.add(problem.key)
+        problems.append(problem)
+    return problems
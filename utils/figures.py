@@ -0,0 +1,150 @@
+"""matplotlib 그림을 이미지로 바꿔 표시하고, 변하지 않는 그림은 프로세스 단위로 캐시합니다.
+
+matplotlib 은 실제로 그림을 그릴 때만 불러오므로, 캐시된 그림만 보여 주는
+재실행에서는 matplotlib 을 건드리지 않습니다.
+"""
+import threading
+from contextlib import contextmanager
+
+import streamlit as st
+
+from utils.delivery import PLOT_FORMAT, DeliveryReport, choose_dpi, deliver, show_report
+
+# 재사용을 위해 보관하는 빈 Figure 의 최대 개수
+FIGURE_POOL_SIZE = 8
+
+_figure_pool = []
+_figure_pool_lock = threading.Lock()
+
+
+def acquire_figure(figsize=(6.4, 4.8)):
+    """그림 풀에서 빈 Figure 를 빌려 옵니다. (풀이 비어 있으면 새로 만듦)
+
+    pyplot 을 거치지 않는 Figure 라 pyplot 의 그림 목록에 쌓이지 않고, 반납하지
+    못한 채 재실행이 중단되어도 참조가 사라지면 그대로 회수됩니다. Streamlit 은
+    재실행마다 새 스레드에서 스크립트를 돌리므로 풀은 프로세스 전체가 함께 쓰고,
+    빌려 간 Figure 는 반납할 때까지 그 스레드만 사용합니다.
+    """
+    with _figure_pool_lock:
+        fig = _figure_pool.pop() if _figure_pool else None
+    if fig is None:
+        from matplotlib.figure import Figure
+
+        fig = Figure()
+    fig.set_size_inches(figsize)
+    return fig
+
+
+def release_figure(fig):
+    """Figure 를 비워서 풀에 반납합니다. 풀이 가득 차 있으면 버립니다."""
+    fig.clear()
+    with _figure_pool_lock:
+        if len(_figure_pool) < FIGURE_POOL_SIZE:
+            _figure_pool.append(fig)
+
+
+@contextmanager
+def pooled_figure(figsize=(6.4, 4.8)):
+    """with 블록 동안 풀의 Figure 를 빌려 쓰고, 끝나면 반드시 반납합니다."""
+    fig = acquire_figure(figsize)
+    try:
+        yield fig
+    finally:
+        release_figure(fig)
+
+
+@st.cache_resource(show_spinner=False)
+def _render_static(key, figsize, fmt, dpi, _draw):
+    # key, figsize, 형식, DPI 로만 캐시를 구분합니다. (_draw 는 해시하지 않음)
+    with pooled_figure(figsize) as fig:
+        _draw(fig)
+        return deliver(fig, fmt, dpi)
+
+
+def static_figure(draw, figsize=(6, 4), fmt=None):
+    """매개변수가 없는 그림 함수를 서버 프로세스당 한 번만 렌더링합니다.
+
+    draw(fig) 는 빈 Figure 에 그림을 그리는 함수이며, 인코딩 결과(DeliveryReport)는
+    형식·DPI 별로 메모리에 보관되어 모든 세션이 그대로 재사용합니다.
+    """
+    key = f"{draw.__code__.co_filename}:{draw.__qualname__}"
+    return _render_static(key, figsize, fmt or PLOT_FORMAT, choose_dpi(figsize[0]), draw)
+
+
+def show_static_figure(draw, figsize=(6, 4)):
+    """캐시된 정적 그림을 본문 폭에 맞춰 표시합니다."""
+    show_report(static_figure(draw, figsize))
+
+
+def render_figure(draw, figsize=(6.4, 4.8), args=(), fmt=None, dpi=None):
+    """draw(fig, *args) 로 그린 그림을 인코딩해 DeliveryReport 로 돌려줍니다.
+
+    draw 가 utils 모듈의 최상위 함수이고 렌더링 프로세스 풀이 켜져 있으면 (함수 이름, args)
+    만 작업 프로세스로 보내 그리므로 스크립트 스레드가 GIL 을 잡고 기다리지 않습니다.
+    풀이 꺼져 있거나 가득 찼거나 실패하면 이 스레드에서 그립니다. (utils.render_pool 참고)
+    """
+    from utils.render_pool import render_pool
+
+    fmt = fmt or PLOT_FORMAT
+    dpi = dpi or choose_dpi(figsize[0])
+    pool = render_pool()
+    if pool is not None and pool.accepts(draw):
+        report = pool.render(draw, args, figsize, fmt, dpi)
+        if report is not None:
+            return report
+    return render_local(draw, figsize, args, fmt, dpi)
+
+
+def render_local(draw, figsize, args, fmt, dpi):
+    """render_figure() 의 실제 그리기. (작업 프로세스에서도 이 함수를 부름)"""
+    with pooled_figure(figsize) as fig:
+        draw(fig, *args)
+        return deliver(fig, fmt, dpi)
+
+
+def show_rendered_figure(draw, figsize=(6.4, 4.8), args=()):
+    """render_figure() 의 그림을 표시합니다. (캐시하지 않는 그림용)"""
+    show_report(render_figure(draw, figsize, args))
+
+
+def cached_figure(key, draw, figsize=(6.4, 4.8), fmt=None, dpi=None, cache=None, args=()):
+    """draw(fig, *args) 로 그린 그림을 key(양자화한 매개변수 튜플)별로 세션 공용 캐시에 보관해 재사용합니다.
+
+    형식과 DPI 도 키에 들어가므로 기기 종류마다 따로 보관됩니다. cache 를 주지 않으면
+    기본 렌더링 캐시를 씁니다. (utils.render_cache 참고) 캐시에 없을 때는
+    render_figure() 로 그립니다.
+    """
+    from utils.render_cache import render_cache
+
+    fmt = fmt or PLOT_FORMAT
+    dpi = dpi or choose_dpi(figsize[0])
+    full_key = (key, tuple(figsize), fmt, dpi)
+    if cache is None:
+        cache = render_cache()
+    report = cache.get(full_key)
+    if report is None:
+        report = render_figure(draw, figsize, args, fmt, dpi)
+        # 비교용 후보는 버리고 고른 형식만 보관합니다.
+        report = DeliveryReport(report.dpi, report.render_ms, report.chosen, (report.chosen,))
+        cache.put(full_key, report, len(report.chosen.data))
+    return report
+
+
+def show_cached_figure(key, draw, figsize=(6.4, 4.8), cache=None, args=()):
+    """cached_figure() 의 그림을 표시합니다. (?plotinfo=1 이면 캐시·렌더링 풀 통계도 표시)"""
+    from utils.render_cache import render_cache
+    from utils.render_pool import render_pool
+
+    show_report(cached_figure(key, draw, figsize, cache=cache, args=args))
+    if "plotinfo" in st.query_params:
+        stats = (render_cache() if cache is None else cache).stats()
+        st.caption("렌더링 캐시: " + ", ".join(f"{k} {v}" for k, v in stats.items()))
+        pool = render_pool()
+        if pool is not None:
+            st.caption("렌더링 풀: " + ", ".join(f"{k} {v}" for k, v in pool.stats().items()))
+
+
+def plot_segments(ax, segments, label=None, **style):
+    """RationalFunction.adaptive_segments() 결과를 같은 모양의 선으로 그립니다 (범례는 한 번만)."""
+    for i, (x, y) in enumerate(segments):
+        ax.plot(x, y, label=label if i == 0 else None, **style)
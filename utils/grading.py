@@ -0,0 +1,58 @@
+"""일차분수함수 (Ax + B)/(Cx + D) 답안 채점.
+
+두 함수 (Ax + B)/(Cx + D), (A'x + B')/(C'x + D') 가 같은 함수인지는
+(Ax + B)(C'x + D') = (A'x + B')(Cx + D) 가 다항식으로 같은지, 즉 세 계수
+
+    AC' - A'C,   AD' + BC' - A'D - B'C,   BD' - B'D
+
+가 모두 0 인지로 정확히 판정할 수 있습니다. (ad - bc ≠ 0 이면 계수 벡터가
+비례하는 것과 같습니다.) 정수·유한 실수 입력은 이 방법으로 정수 곱셈만 하고,
+그 밖의 입력만 SymPy 를 그때 불러와 simplify 로 비교합니다.
+"""
+from fractions import Fraction
+from numbers import Rational, Real
+
+
+def _exact(value):
+    """정수/유리수는 그대로, 유한한 실수는 Fraction 으로 정확히 바꿉니다. 그 외는 None."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, Rational):
+        return value
+    if isinstance(value, Real):
+        value = float(value)
+        if value != value or value in (float("inf"), float("-inf")):
+            return None
+        return int(value) if value.is_integer() else Fraction(value)
+    return None
+
+
+def _cross_equal(p, q):
+    a, b, c, d = p
+    a2, b2, c2, d2 = q
+    if (c == 0 and d == 0) or (c2 == 0 and d2 == 0):
+        return False
+    return (a * c2 - a2 * c == 0
+            and a * d2 + b * c2 - a2 * d - b2 * c == 0
+            and b * d2 - b2 * d == 0)
+
+
+def _sympy_equal(p, q):
+    from sympy import simplify, symbols, sympify
+
+    x = symbols("x")
+    a, b, c, d = (sympify(v) for v in p)
+    a2, b2, c2, d2 = (sympify(v) for v in q)
+    return simplify((a * x + b) / (c * x + d) - (a2 * x + b2) / (c2 * x + d2)) == 0
+
+
+def same_linear_fractional(p, q):
+    """계수 (A, B, C, D) 로 주어진 두 일차분수함수가 같은 함수인지 판정합니다."""
+    exact_p = [_exact(v) for v in p]
+    exact_q = [_exact(v) for v in q]
+    if None not in exact_p and None not in exact_q:
+        return _cross_equal(exact_p, exact_q)
+    try:
+        return bool(_sympy_equal(p, q))
+    except Exception:
+        return False
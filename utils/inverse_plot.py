@@ -0,0 +1,101 @@
+"""6쪽(역함수 마스터) f 와 f⁻¹ 비교 그림과 그 캐시.
+
+문제는 정수 a, b, d ∈ [-5, 5], 0 이 아닌 c ∈ [-5, 5], ad − bc ≠ 0 인 (a, b, c, d) 뿐이라
+그림의 종류가 유한합니다. 그래서 (a, b, c, d) 를 키로 메모리(예산 제한)와 디스크
+두 계층에 보관하고, 디스크에는 넣는 즉시 저장해 서버를 다시 시작해도 남게 합니다.
+tools/build_inverse_plots.py 로 전체 문제 공간을 미리 채워 둘 수 있습니다.
+
+    MATHHH_INVERSE_CACHE_MB   메모리 예산 (기본 32 MB)
+    MATHHH_INVERSE_CACHE_DIR  디스크 계층 폴더 (기본 data/inverse_plots, 빈 값이면 메모리만)
+"""
+import functools
+import os
+
+from utils.figures import cached_figure, plot_segments, show_cached_figure
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DIR = os.path.join(ROOT, "data", "inverse_plots")
+DEFAULT_BUDGET_MB = 32
+
+COEFF_RANGE = range(-5, 6)
+FIGSIZE = (8, 8)
+Y_LIM = 10
+# 그림 모양을 바꾸면 올려서 디스크에 남은 예전 그림을 쓰지 않게 합니다.
+VERSION = 1
+
+
+def problem_space():
+    """6쪽에서 나올 수 있는 모든 (a, b, c, d)."""
+    return [(a, b, c, d)
+            for a in COEFF_RANGE for b in COEFF_RANGE for c in COEFF_RANGE for d in COEFF_RANGE
+            if c != 0 and a * d - b * c != 0]
+
+
+def inverse_plot_key(a, b, c, d):
+    return ("inverse_comparison", VERSION, int(a), int(b), int(c), int(d))
+
+
+def draw_inverse_comparison(fig, a, b, c, d):
+    """f(x) = (ax + b)/(cx + d) 와 f⁻¹(x) = (−dx + b)/(cx − a), 네 점근선, y = x."""
+    from utils.rational import RationalFunction
+
+    # 정답 역함수 계수
+    inv_a, inv_b, inv_c, inv_d = -d, b, c, -a
+
+    # 점근선 계산
+    va_f = -d / c  # f(x)의 세로 점근선
+    ha_f = a / c   # f(x)의 가로 점근선
+    va_inv = -inv_d / inv_c  # f^-1(x)의 세로 점근선 (ha_f와 같음)
+    ha_inv = inv_a / inv_c   # f^-1(x)의 가로 점근선 (va_f와 같음)
+
+    f = RationalFunction.linear(a, b, c, d)
+    f_inv = RationalFunction.linear(inv_a, inv_b, inv_c, inv_d)
+
+    # 점근선 주변 5 범위로 설정
+    x_range_min = min(va_f, va_inv) - 5
+    x_range_max = max(va_f, va_inv) + 5
+
+    ax = fig.subplots()
+    # 점근선을 기준으로 좌우로 분리하여 화면(y: -10 ~ 10)에 맞춰 적응형으로 계산
+    plot_segments(ax, f.adaptive_segments(x_range_min, x_range_max, -Y_LIM, Y_LIM), label=r'$f(x)$', color='blue')
+    plot_segments(ax, f_inv.adaptive_segments(x_range_min, x_range_max, -Y_LIM, Y_LIM),
+                  label=r'$f^{-1}(x)$', color='orange')
+
+    # 원래 함수 점근선 (파란색), 역함수 점근선 (주황색)
+    ax.axvline(va_f, color='blue', linestyle='--', linewidth=1, alpha=0.6)
+    ax.axhline(ha_f, color='blue', linestyle='--', linewidth=1, alpha=0.6)
+    ax.axvline(va_inv, color='orange', linestyle=':', linewidth=1, alpha=0.6)
+    ax.axhline(ha_inv, color='orange', linestyle=':', linewidth=1, alpha=0.6)
+
+    # y=x 대칭선
+    ax.plot([-10, 10], [-10, 10], color='gray', linestyle='-.', linewidth=1, alpha=0.5, label='$y=x$')
+
+    ax.set_title(r'$f(x)$와 $f^{-1}(x)$ 그래프 (y=x 대칭 확인)')
+    ax.set_xlabel('$x$')
+    ax.set_ylabel('$y$')
+    ax.set_xlim(x_range_min, x_range_max)
+    ax.set_ylim(-Y_LIM, Y_LIM)
+    ax.grid(True, linestyle=':', alpha=0.7)
+    ax.legend(loc='lower right')
+    ax.set_aspect('equal', adjustable='box')
+
+
+@functools.lru_cache(maxsize=None)
+def inverse_plot_cache():
+    """프로세스 전체가 함께 쓰는 비교 그림 캐시 (메모리 + 영구 디스크)."""
+    from utils.render_cache import RenderCache
+
+    budget_mb = float(os.environ.get("MATHHH_INVERSE_CACHE_MB", DEFAULT_BUDGET_MB))
+    disk_dir = os.environ.get("MATHHH_INVERSE_CACHE_DIR", DEFAULT_DIR) or None
+    return RenderCache(int(budget_mb * 2**20), disk_dir, write_through=True)
+
+
+def inverse_figure(a, b, c, d, dpi=None):
+    """(a, b, c, d) 의 비교 그림을 캐시에서 꺼내거나 그립니다. (DeliveryReport)"""
+    return cached_figure(inverse_plot_key(a, b, c, d), draw_inverse_comparison, FIGSIZE, dpi=dpi,
+                         cache=inverse_plot_cache(), args=(a, b, c, d))
+
+
+def show_inverse_comparison(a, b, c, d):
+    show_cached_figure(inverse_plot_key(a, b, c, d), draw_inverse_comparison, FIGSIZE,
+                       cache=inverse_plot_cache(), args=(a, b, c, d))
@@ -0,0 +1,200 @@
+"""페이지 구간별 실행 시간 측정.
+
+    with section("03", "sampling"):
+        ...
+
+환경 변수 MATHHH_METRICS_FILE 에 파일 경로를 주면 구간마다 걸린 시간(벽시계),
+호출 횟수, 메모리 할당 변화량을 기록합니다. 경로가 .prom 으로 끝나면 Prometheus
+텍스트 형식의 누적값을, 그 밖에는 이벤트 한 줄씩 JSONL 로 씁니다.
+설정하지 않으면 section() 은 아무 일도 하지 않는 컨텍스트를 돌려주므로 비용이 거의 없습니다.
+
+구간을 재는 쪽은 파일을 기다리지 않습니다. 이벤트는 메모리 큐에 넣기만 하고, 쓰기 스레드가
+모아서 한 번에 덧붙입니다(.prom 은 주기마다 다시 씀). 큐가 가득 차면 버린 뒤 dropped 를 셉니다.
+
+메모리 할당 변화량은 tracemalloc 이 필요해 느려지므로 MATHHH_METRICS_ALLOC=1 일 때만 잽니다.
+tracemalloc 은 프로세스 전체의 할당량만 알려 주므로, 여러 세션이 동시에 실행 중이면 그 사이
+다른 스레드가 할당한 양도 섞입니다. 부하가 없을 때 한 세션으로 잰 값만 믿을 만합니다.
+"""
+import atexit
+import functools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+
+logger = logging.getLogger(__name__)
+
+METRICS_FILE = os.environ.get("MATHHH_METRICS_FILE", "")
+TRACE_ALLOC = os.environ.get("MATHHH_METRICS_ALLOC", "") not in ("", "0")
+# .prom 파일은 이 간격(초)마다 다시 씁니다.
+PROMETHEUS_INTERVAL = 5.0
+# JSONL 은 이 간격(초) 안에 들어온 이벤트를 한 번에 씁니다.
+FLUSH_INTERVAL = 0.5
+
+_NULL = nullcontext()
+_lock = threading.Lock()
+# (page, section) -> [호출 횟수, 시간 합(초), 할당 합(바이트)]
+_totals = {}
+
+_STOP = object()
+
+
+class _Section:
+    __slots__ = ("page", "name", "start", "alloc_start")
+
+    def __init__(self, page, name):
+        self.page = page
+        self.name = name
+
+    def __enter__(self):
+        self.alloc_start = tracemalloc.get_traced_memory()[0] if TRACE_ALLOC else 0
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        alloc = tracemalloc.get_traced_memory()[0] - self.alloc_start if TRACE_ALLOC else None
+        _record(self.page, self.name, elapsed, alloc)
+        return False
+
+
+def section(page, name):
+    """page 의 name 구간을 잽니다. 측정이 꺼져 있으면 빈 컨텍스트를 돌려줍니다."""
+    if not METRICS_FILE:
+        return _NULL
+    return _Section(page, name)
+
+
+def _record(page, name, elapsed, alloc):
+    with _lock:
+        totals = _totals.setdefault((page, name), [0, 0.0, 0])
+        totals[0] += 1
+        totals[1] += elapsed
+        totals[2] += alloc or 0
+    writer = _writer()
+    if not writer.prometheus:
+        event = {"ts": round(time.time(), 3), "page": page, "section": name, "ms": round(elapsed * 1000, 3)}
+        if alloc is not None:
+            # 프로세스 전체의 변화량 (모듈 설명 참고)
+            event["alloc_kb"] = round(alloc / 1024, 1)
+        writer.put(json.dumps(event, ensure_ascii=False) + "\n")
+
+
+class _Writer:
+    """이벤트 줄을 모아 백그라운드에서 파일에 쓰는 스레드. (.prom 이면 주기마다 누적값을 다시 씀)"""
+
+    def __init__(self, path, max_queue=10_000, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.prometheus = path.endswith(".prom")
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="metrics-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, line):
+        """줄 하나를 큐에 넣습니다. 절대 기다리지 않으며, 넣지 못하면 False."""
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            with _lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def flush(self, timeout=5.0):
+        """지금까지 넣은 줄이 모두 쓰일 때까지 기다립니다. (종료·시험용)"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._queue.unfinished_tasks == 0:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def close(self, timeout=5.0):
+        if self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                return
+            self._thread.join(timeout)
+
+    def _next_batch(self):
+        # JSONL 은 첫 줄을 기다린 뒤 flush_interval 동안 모으고, .prom 은 주기마다 깨어납니다.
+        batch = []
+        try:
+            batch.append(self._queue.get(timeout=PROMETHEUS_INTERVAL if self.prometheus else None))
+        except queue.Empty:
+            return batch
+        deadline = time.monotonic() + self.flush_interval
+        while batch[-1] is not _STOP:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        written = None
+        while True:
+            batch = self._next_batch()
+            stop = bool(batch) and batch[-1] is _STOP
+            try:
+                if self.prometheus:
+                    with _lock:
+                        text = prometheus_text()
+                    if text != written:
+                        self._write(text, mode="w")
+                        written = text
+                else:
+                    lines = [line for line in batch if line is not _STOP]
+                    if lines:
+                        self._write("".join(lines), mode="a")
+            except OSError:
+                logger.exception("측정값을 %s 에 쓰지 못했습니다", self.path)
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, text, mode):
+        with open(self.path, mode, encoding="utf-8") as f:
+            f.write(text)
+
+
+@functools.lru_cache(maxsize=None)
+def _writer():
+    writer = _Writer(METRICS_FILE)
+    atexit.register(writer.close)
+    return writer
+
+
+def prometheus_text():
+    """누적값을 Prometheus 텍스트 형식으로 만듭니다. (호출하는 쪽이 잠금을 잡고 있어도 됨)"""
+    lines = [
+        "# HELP mathhh_section_seconds Wall time spent in instrumented page sections.",
+        "# TYPE mathhh_section_seconds summary",
+    ]
+    for (page, name), (count, seconds, _) in sorted(_totals.items()):
+        labels = f'page="{page}",section="{name}"'
+        lines.append(f"mathhh_section_seconds_count{{{labels}}} {count}")
+        lines.append(f"mathhh_section_seconds_sum{{{labels}}} {seconds:.6f}")
+    if TRACE_ALLOC:
+        lines.append("# TYPE mathhh_section_alloc_bytes_total counter")
+        for (page, name), (_, _, alloc) in sorted(_totals.items()):
+            lines.append(f'mathhh_section_alloc_bytes_total{{page="{page}",section="{name}"}} {alloc}')
+    return "\n".join(lines) + "\n"
+
+
+if METRICS_FILE and TRACE_ALLOC and not tracemalloc.is_tracing():
+    tracemalloc.start()
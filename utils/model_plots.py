@@ -0,0 +1,28 @@
+"""4쪽(유리함수의 실생활 활용) 그림 그리기.
+
+렌더링 풀의 작업 프로세스가 이름으로 불러 쓸 수 있도록 모듈 최상위 함수로 두고,
+인자로는 격자에서 잘라 낸 작은 배열만 받습니다. (격자 전체를 보내지 않음)
+"""
+
+
+def draw_time_curve(fig, x, T):
+    """서버 수 x 에 따른 처리 시간 T(x) 곡선."""
+    ax = fig.subplots()
+    ax.plot(x, T)
+    ax.set_xlabel("서버 수 x (대)")
+    ax.set_ylabel("처리 시간 T")
+    ax.set_title("🔒 암호화된 데이터 처리 시간 — 유리함수 관계")
+    ax.grid(True, alpha=0.3)
+
+
+def draw_servers_needed(fig, needed, extent, r, target):
+    """(s, W) 마다 T ≤ target 이 되는 최소 서버 수 지도.
+
+    (r, target) 만으로 정해지는 그림이라 캐시해 두고, 현재 (s, W) 의 값은 그림 아래 글로 보여 줍니다.
+    """
+    ax2 = fig.subplots()
+    image = ax2.imshow(needed.T, origin="lower", aspect="auto", cmap="RdPu", extent=extent)
+    fig.colorbar(image, ax=ax2, label="필요한 서버 수 x (대)")
+    ax2.set_xlabel("암호화 느려짐 정도 s (배)")
+    ax2.set_ylabel("전체 연산량 W")
+    ax2.set_title(f"T ≤ {target} 이 되는 최소 서버 수 (r = {r})")
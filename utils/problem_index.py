@@ -0,0 +1,96 @@
+"""분수 사칙연산 문제 색인.
+
+(a/b) ○ (c/d) 꼴에서 a, b, c, d 가 1~12 이고 결과가 정수인 문제를 전부 한 번만
+찾아 두고, 연산자와 결과값별로 묶어 둡니다. 문제를 뽑을 때는 무작위 시도를
+반복하지 않고 색인에서 바로 하나를 고릅니다.
+"""
+import bisect
+import functools
+import random
+
+OPERATORS = ("+", "-", "*", "/")
+_SYMBOLS = {"+": "+", "-": "-", "*": "×", "/": "÷"}
+
+
+def _evaluate(op, a, b, c, d):
+    """(a/b) op (c/d) 의 분자, 분모를 돌려줍니다."""
+    if op == "+":
+        return a * d + b * c, b * d
+    if op == "-":
+        return a * d - b * c, b * d
+    if op == "*":
+        return a * c, b * d
+    return a * d, b * c
+
+
+def format_operation(op, a, b, c, d):
+    return f"({a}/{b}) {_SYMBOLS[op]} ({c}/{d})"
+
+
+class OperationIndex:
+    """결과가 정수인 분수 연산 문제 전체를 연산자·결과값별로 담은 색인."""
+
+    def __init__(self, low=1, high=12, value_range=(1, 100)):
+        vmin, vmax = value_range
+        # buckets[op][value] = [(a, b, c, d), ...]
+        self.buckets = {op: {} for op in OPERATORS}
+        numbers = range(low, high + 1)
+        for op in OPERATORS:
+            for a in numbers:
+                for b in numbers:
+                    for c in numbers:
+                        for d in numbers:
+                            num, den = _evaluate(op, a, b, c, d)
+                            if den == 0 or num % den != 0:
+                                continue
+                            value = num // den
+                            if vmin <= value <= vmax:
+                                self.buckets[op].setdefault(value, []).append((a, b, c, d))
+        # 결과값 범위로 거를 때 bisect 로 바로 자를 수 있도록 값 순서로 펼쳐 둡니다.
+        self._values = {}
+        self._problems = {}
+        for op, by_value in self.buckets.items():
+            values, problems = [], []
+            for value in sorted(by_value):
+                for abcd in by_value[value]:
+                    values.append(value)
+                    problems.append(abcd)
+            self._values[op] = values
+            self._problems[op] = problems
+
+    def _ranges(self, ops, value_range):
+        ops = OPERATORS if ops is None else ops
+        ranges = []
+        for op in ops:
+            values = self._values[op]
+            if value_range is None:
+                lo, hi = 0, len(values)
+            else:
+                lo = bisect.bisect_left(values, value_range[0])
+                hi = bisect.bisect_right(values, value_range[1])
+            if hi > lo:
+                ranges.append((op, lo, hi))
+        return ranges
+
+    def count(self, ops=None, value_range=None):
+        """조건(연산자 목록, 결과값 범위)을 만족하는 문제 수."""
+        return sum(hi - lo for _, lo, hi in self._ranges(ops, value_range))
+
+    def sample(self, rng=random, ops=None, value_range=None):
+        """조건을 만족하는 문제 가운데 하나를 고르게 뽑아 (식, 정답 문자열) 로 돌려줍니다."""
+        ranges = self._ranges(ops, value_range)
+        total = sum(hi - lo for _, lo, hi in ranges)
+        if total == 0:
+            raise ValueError(f"조건에 맞는 문제가 없습니다: ops={ops}, value_range={value_range}")
+        k = rng.randrange(total)
+        for op, lo, hi in ranges:
+            if k < hi - lo:
+                a, b, c, d = self._problems[op][lo + k]
+                return format_operation(op, a, b, c, d), str(self._values[op][lo + k])
+            k -= hi - lo
+
+
+@functools.lru_cache(maxsize=None)
+def operation_index():
+    """프로세스당 한 번만 만드는 기본 색인 (a, b, c, d ∈ 1..12, 결과 1~100)."""
+    return OperationIndex()
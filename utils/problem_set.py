@@ -0,0 +1,44 @@
+"""세션마다 한 번만 만들어 두는 문제 세트.
+
+문제 세트는 저장된 seed 로부터 결정적으로 만들어지고 st.session_state 에 보관됩니다.
+이후 재실행(답 선택 클릭 등)에서는 그대로 다시 쓰고, 학생이 새 세트를 요청할 때만
+새 seed 로 다시 만듭니다.
+"""
+import random
+from dataclasses import dataclass
+
+import streamlit as st
+
+
+@dataclass(frozen=True)
+class ProblemSet:
+    """seed 와 (문제, 정답, 보기 목록) 튜플들의 묶음."""
+
+    seed: int
+    problems: tuple
+
+    def __len__(self):
+        return len(self.problems)
+
+    def __iter__(self):
+        return iter(self.problems)
+
+
+def new_seed():
+    return random.SystemRandom().randrange(2**32)
+
+
+def session_problem_set(build, key="problem_set"):
+    """세션에 저장된 문제 세트를 돌려줍니다. 없으면 build(seed) 로 새로 만듭니다."""
+    problem_set = st.session_state.get(key)
+    if problem_set is None:
+        problem_set = build(new_seed())
+        st.session_state[key] = problem_set
+    return problem_set
+
+
+def reset_problem_set(build, key="problem_set", answer_keys=()):
+    """새 seed 로 문제 세트를 다시 만들고 이전 답 선택을 지웁니다. (버튼 콜백용)"""
+    st.session_state[key] = build(new_seed())
+    for answer_key in answer_keys:
+        st.session_state.pop(answer_key, None)
@@ -0,0 +1,95 @@
+"""유리함수 P(x)/Q(x) 의 벡터화 계산 엔진.
+
+여러 페이지가 제각각 쓰던 분모 0 판정값, 발산값 자르기(1e6), 점근선 기준 구간 분할을
+한곳에 모았습니다. 계수는 높은 차수부터 적은 1차원 배열로 보관합니다.
+"""
+import numpy as np
+
+from utils.sampling import adaptive_sample
+
+# 분모가 이 값 이하이면 정의되지 않는 점으로 봅니다.
+DENOM_EPS = 1e-8
+# 절댓값이 이 값을 넘는 함수값은 nan 으로 바꿔 점근선을 가로지르는 선을 막습니다.
+CLIP = 1e6
+
+
+def _trim(coeffs):
+    coeffs = np.atleast_1d(np.asarray(coeffs, dtype=float))
+    nonzero = np.flatnonzero(coeffs)
+    if len(nonzero) == 0:
+        return coeffs[-1:] * 0.0
+    return coeffs[nonzero[0]:].copy()
+
+
+def _polyval_into(coeffs, x, out):
+    """호너 방법으로 다항식 값을 out 에 바로 계산합니다 (임시 배열 없음)."""
+    out.fill(coeffs[0])
+    for coef in coeffs[1:]:
+        np.multiply(out, x, out=out)
+        out += coef
+    return out
+
+
+class RationalFunction:
+    """계수 배열로 표현한 유리함수 num(x) / den(x)."""
+
+    __slots__ = ("num", "den", "_poles")
+
+    def __init__(self, num, den):
+        self.num = _trim(num)
+        self.den = _trim(den)
+        if not self.den.any():
+            raise ValueError("분모가 0인 다항식으로는 유리함수를 만들 수 없습니다.")
+        self._poles = None
+
+    @classmethod
+    def linear(cls, a, b, c, d):
+        """(ax + b) / (cx + d) 꼴의 함수를 만듭니다."""
+        return cls([a, b], [c, d])
+
+    def __repr__(self):
+        return f"RationalFunction(num={self.num.tolist()}, den={self.den.tolist()})"
+
+    @property
+    def poles(self):
+        """분모가 0이 되는 실수 x (오름차순)."""
+        if self._poles is None:
+            if len(self.den) == 1:
+                poles = np.empty(0)
+            elif len(self.den) == 2:
+                poles = np.array([-self.den[1] / self.den[0]])
+            else:
+                roots = np.roots(self.den)
+                poles = np.unique(roots[np.abs(roots.imag) < 1e-9].real)
+            self._poles = poles
+        return self._poles
+
+    def evaluate(self, x, out=None, clip=CLIP):
+        """x 에서의 함수값을 계산합니다. 정의되지 않거나 |y| > clip 인 곳은 nan 입니다."""
+        x = np.asarray(x, dtype=float)
+        if out is None:
+            out = np.empty_like(x)
+        # 분모 배열은 |분모| 와 |함수값| 을 담는 작업 배열로 다시 씁니다.
+        den = np.empty_like(x)
+        mask = np.empty(x.shape, dtype=bool)
+        _polyval_into(self.den, x, den)
+        _polyval_into(self.num, x, out)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(out, den, out=out)
+        np.abs(den, out=den)
+        np.less_equal(den, DENOM_EPS, out=mask)
+        np.copyto(out, np.nan, where=mask)
+        np.abs(out, out=den)
+        np.greater(den, clip, out=mask)
+        np.copyto(out, np.nan, where=mask)
+        return out
+
+    __call__ = evaluate
+
+    def adaptive_segments(self, x_min, x_max, y_min, y_max, budget=240):
+        """화면 [x_min, x_max] × [y_min, y_max] 에 맞춰 적응형으로 표본 추출한 구간 목록.
+
+        휘어지는 곳과 극 근처에만 점을 더 넣으므로 같은 모양을 더 적은 점으로 그립니다.
+        """
+        return adaptive_sample(lambda x: self.evaluate(x, clip=np.inf), x_min, x_max, y_min, y_max,
+                               breaks=self.poles, budget=budget)
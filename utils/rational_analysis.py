@@ -0,0 +1,195 @@
+"""임의의 유리함수 P(x)/Q(x) 분석 (점근선, 구멍, 절편).
+
+SymPy 로 약분·나눗셈·실근 계산을 한 번만 하고 결과를 계수 튜플을 키로 하는 LRU 에
+보관합니다. 같은 함수를 다시 보면 기호 계산 없이 캐시에서 꺼내며, 그래프는 약분한
+계수로 만든 RationalFunction(NumPy 호너 계산)으로 그립니다.
+
+계수는 높은 차수부터 적습니다. 실수 입력은 표기 그대로 유리수로 바꾸므로
+(0.1 → 1/10) 같은 입력은 같은 키가 됩니다.
+"""
+import functools
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import NamedTuple
+
+import numpy as np
+
+CACHE_SIZE = 256
+# 이보다 차수가 높으면 분석하지 않습니다. (실근 계산 시간이 급격히 늘어남)
+MAX_DEGREE = 8
+
+ASYMPTOTE_NAMES = {
+    "horizontal": "수평점근선",
+    "oblique": "사선 점근선",
+    "curvilinear": "곡선 점근선",
+    "none": "없음 (다항함수)",
+}
+
+
+class Value(NamedTuple):
+    """그래프용 실수 값과 화면용 LaTeX 표기."""
+
+    value: float
+    latex: str
+
+
+@dataclass(frozen=True)
+class RationalAnalysis:
+    """P(x)/Q(x) 의 분석 결과. 계수는 모두 높은 차수부터."""
+
+    num: tuple  # 입력 계수 (Fraction)
+    den: tuple
+    reduced_num: tuple  # 공통인수를 약분한 계수 (float)
+    reduced_den: tuple
+    vertical: tuple  # 수직점근선 x 값 (Value)
+    holes: tuple  # 구멍 ((Value x, Value y), ...)
+    asymptote: tuple  # 몫 다항식 계수 (float). 분모가 상수(다항함수)이면 ()
+    x_intercepts: tuple  # (Value, ...)
+    y_intercept: object  # Value 또는 None (x = 0 에서 정의되지 않을 때)
+    latex: str  # 입력 그대로의 P(x)/Q(x)
+    reduced_latex: str  # 약분한 식
+    common_factor_latex: str  # 약분한 공통인수 ("" 이면 약분할 것이 없음)
+    asymptote_latex: str  # 점근선 y = ... 의 오른쪽 ("" 이면 없음)
+
+    @property
+    def asymptote_kind(self):
+        """"horizontal", "oblique", "curvilinear", "none" 중 하나."""
+        if not self.asymptote:
+            return "none"
+        return {1: "horizontal", 2: "oblique"}.get(len(self.asymptote), "curvilinear")
+
+    def function(self):
+        """약분한 식으로 만든 NumPy 계산기. (작업 배열을 가지므로 호출마다 새로 만듦)"""
+        from utils.rational import RationalFunction
+
+        return RationalFunction(self.reduced_num, self.reduced_den)
+
+    def asymptote_values(self, x):
+        """점근선(몫 다항식)의 x 에서의 값."""
+        return np.polyval(self.asymptote, x)
+
+
+def _coefficient(value):
+    if isinstance(value, (int, Fraction)) and not isinstance(value, bool):
+        return Fraction(value)
+    value = float(value)
+    if not np.isfinite(value):
+        raise ValueError("계수는 유한한 실수여야 합니다.")
+    return Fraction(repr(value))
+
+
+def normalize(coeffs):
+    """계수 목록을 캐시 키로 쓰는 Fraction 튜플로 바꿉니다. (앞쪽 0 은 지움)"""
+    coeffs = [_coefficient(c) for c in coeffs]
+    while len(coeffs) > 1 and coeffs[0] == 0:
+        coeffs.pop(0)
+    return tuple(coeffs) or (Fraction(0),)
+
+
+def analyze(num, den):
+    """P(x)/Q(x) 를 분석합니다. 같은 계수의 두 번째 호출부터는 기호 계산이 없습니다."""
+    num, den = normalize(num), normalize(den)
+    if not any(den):
+        raise ValueError("분모가 0인 다항식으로는 유리함수를 만들 수 없습니다.")
+    if max(len(num), len(den)) - 1 > MAX_DEGREE:
+        raise ValueError(f"분자·분모의 차수는 {MAX_DEGREE} 이하로 입력하세요.")
+    return _analyze(num, den)
+
+
+def analysis_cache_info():
+    return _analyze.cache_info()
+
+
+def _value(root):
+    # 근호로 나타낼 수 없는 근(CRootOf)은 소수로 적습니다.
+    from sympy import CRootOf, latex
+
+    value = float(root)
+    if isinstance(root, CRootOf):
+        return Value(value, f"{value:.4g}")
+    return Value(value, latex(root))
+
+
+def _real_roots(poly):
+    from sympy import real_roots
+
+    if poly.is_zero or poly.degree() < 1:
+        return []
+    return list(dict.fromkeys(real_roots(poly)))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _analyze(num, den):
+    from sympy import Poly, Rational, latex, symbols
+
+    x = symbols("x")
+    P = Poly([Rational(c.numerator, c.denominator) for c in num], x)
+    Q = Poly([Rational(c.numerator, c.denominator) for c in den], x)
+
+    # 공통인수 G 를 약분하면 G 의 근 가운데 약분한 분모의 근이 아닌 것이 구멍입니다.
+    G = P.gcd(Q)
+    Pr, Qr = P.exquo(G), Q.exquo(G)
+    # 약분한 분모를 최고차항 계수 1 로 맞춰 표기를 깔끔하게 합니다.
+    lead = Qr.LC()
+    Pr, Qr = Pr.quo_ground(lead), Qr.quo_ground(lead)
+
+    vertical = tuple(_value(r) for r in _real_roots(Qr))
+    holes = tuple((_value(r), _value(Pr.eval(r) / Qr.eval(r)))
+                  for r in _real_roots(G) if Qr.eval(r) != 0)
+    hole_xs = {h[0].value for h in holes}
+    x_intercepts = tuple(v for v in map(_value, _real_roots(Pr)) if v.value not in hole_xs)
+    y_intercept = None if Q.eval(0) == 0 else _value(P.eval(0) / Q.eval(0))
+
+    # 분자 ÷ 분모의 몫이 점근선입니다. (차수에 따라 수평·사선·곡선)
+    if Qr.degree() == 0:
+        asymptote, asymptote_latex = (), ""
+    else:
+        quotient = Pr.div(Qr)[0]
+        asymptote = tuple(float(c) for c in quotient.all_coeffs())
+        asymptote_latex = latex(quotient.as_expr())
+
+    return RationalAnalysis(
+        num=num,
+        den=den,
+        reduced_num=tuple(float(c) for c in Pr.all_coeffs()),
+        reduced_den=tuple(float(c) for c in Qr.all_coeffs()),
+        vertical=vertical,
+        holes=holes,
+        asymptote=asymptote,
+        x_intercepts=x_intercepts,
+        y_intercept=y_intercept,
+        latex=rf"\frac{{{latex(P.as_expr())}}}{{{latex(Q.as_expr())}}}",
+        reduced_latex=latex(Pr.as_expr() / Qr.as_expr()),
+        common_factor_latex=latex(G.as_expr()) if G.degree() > 0 else "",
+        asymptote_latex=asymptote_latex,
+    )
+
+
+def draw_analysis(fig, result, view):
+    """분석 결과를 [-view, view]² 화면에 그립니다: 곡선, 점근선, 구멍(빈 원), 절편."""
+    from utils.figures import plot_segments
+
+    kind = result.asymptote_kind
+    ax = fig.subplots()
+    f = result.function()
+    plot_segments(ax, f.adaptive_segments(-view, view, -view, view), color='tomato', label="y = f(x)")
+    for i, v in enumerate(result.vertical):
+        ax.axvline(v.value, color='gray', linestyle='--', label="수직점근선" if i == 0 else None)
+    if kind != "none":
+        xs = np.linspace(-view, view, 400)
+        ax.plot(xs, result.asymptote_values(xs), color='purple', linestyle='--', label=ASYMPTOTE_NAMES[kind])
+    if result.holes:
+        ax.plot([x.value for x, _ in result.holes], [y.value for _, y in result.holes], 'o',
+                markerfacecolor='white', markeredgecolor='tomato', markersize=8, label="구멍")
+    points = [(v.value, 0.0) for v in result.x_intercepts]
+    if result.y_intercept is not None:
+        points.append((0.0, result.y_intercept.value))
+    if points:
+        ax.plot(*zip(*points), 'o', color='black', markersize=4)
+    ax.axhline(0, color='black', linewidth=1)
+    ax.axvline(0, color='black', linewidth=1)
+    ax.set_xlim(-view, view)
+    ax.set_ylim(-view, view)
+    ax.set_aspect('equal')
+    ax.grid(True)
+    ax.legend(loc='upper right')
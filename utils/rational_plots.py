@@ -0,0 +1,136 @@
+"""3쪽(유리함수의 그래프와 평행이동) 그림 그리기와 캐시 키.
+
+그림 함수는 Streamlit 을 쓰지 않는 순수 함수라서 페이지에서도, 서버 시작 후
+백그라운드 미리 그리기에서도 같은 결과를 만듭니다. 캐시 키는 슬라이더 간격으로
+양자화한 정수 튜플입니다.
+"""
+import threading
+
+from utils.delivery import DESKTOP_VIEWPORT, MOBILE_VIEWPORT, choose_dpi
+from utils.figures import cached_figure, plot_segments
+
+# 슬라이더와 같은 범위·간격
+A_RANGE = (-5.0, 5.0, 0.1)
+FIGSIZE = (6, 6)
+XMIN, XMAX = -10, 10
+YMIN, YMAX = -10, 10
+
+_precompute_thread = None
+_precompute_lock = threading.Lock()
+# 종료할 때 미리 그리기를 그림 사이에서 멈추게 하는 신호
+_precompute_stop = threading.Event()
+
+
+def quantize(value, step):
+    """슬라이더 값을 간격 단위 정수로 바꿉니다. (0.30000000000000004 와 0.3 이 같은 키가 되도록)"""
+    return int(round(value / step))
+
+
+def inverse_proportion_key(a):
+    return ("inverse_proportion", quantize(a, 0.1))
+
+
+def linear_fractional_key(a, b, c, d):
+    return ("linear_fractional", quantize(a, 0.1), quantize(b, 0.5), quantize(c, 0.1), quantize(d, 0.5))
+
+
+def draw_inverse_proportion(fig, a):
+    """y = a/x"""
+    from utils.rational import RationalFunction
+
+    ax = fig.subplots()
+    f1 = RationalFunction([a], [1, 0])
+    plot_segments(ax, f1.adaptive_segments(XMIN, XMAX, YMIN, YMAX), label=f"y = {a}/x", color='C0')
+    ax.axhline(0, color='black', linewidth=1)
+    ax.axvline(0, color='black', linewidth=1)
+    ax.set_xlim(XMIN, XMAX)
+    ax.set_ylim(YMIN, YMAX)
+    ax.set_aspect('equal')
+    ax.grid(True)
+    ax.legend()
+
+
+def draw_linear_fractional(fig, a2, b2, c2, d2):
+    """y = (ax + b)/(cx + d). c = 0 이면 일차함수, c = d = 0 이면 빈 그림."""
+    from utils.rational import RationalFunction
+
+    ax2 = fig.subplots()
+
+    # c = 0 인 경우(일차함수 형태) 처리
+    if abs(c2) < 1e-9:
+        if abs(d2) < 1e-9:
+            # 빈 플롯만 표시
+            ax2.text(0.5, 0.5, "함수 불가", transform=ax2.transAxes, ha='center')
+        else:
+            # y = (a/d) x + (b/d)
+            slope = a2 / d2
+            intercept = b2 / d2
+            line = RationalFunction([a2, b2], [d2])
+            plot_segments(ax2, line.adaptive_segments(XMIN, XMAX, YMIN, YMAX), color='green',
+                          label=f"y = {slope:.2f}x + {intercept:.2f}")
+    else:
+        # 일반적인 유리함수: 분모 = c2*x + d2
+        f2 = RationalFunction.linear(a2, b2, c2, d2)
+        asym_x = f2.poles[0]  # 세로점근선 위치
+        # 점근선 근처와 휘어지는 곳에만 점을 촘촘히 넣는 적응형 표본 추출 (점근선 좌우는 따로 그림)
+        plot_segments(ax2, f2.adaptive_segments(XMIN, XMAX, YMIN, YMAX), color='tomato')
+
+        # 점근선(세로/가로) 표시 — 화면 범위에 있을 때만
+        if XMIN < asym_x < XMAX:
+            ax2.axvline(asym_x, color='gray', linestyle='--', label=f"x = {asym_x:.2f} (수직점근선)")
+        # 가로 점근선 y = a/c
+        horiz = a2 / c2
+        if YMIN < horiz < YMAX:
+            ax2.axhline(horiz, color='purple', linestyle='--', label=f"y = {horiz:.2f} (수평점근선)")
+        else:
+            # 그래도 보여주기 위해 점선(범위 밖이면 레이블 없이)
+            ax2.axhline(horiz, color='purple', linestyle='--', alpha=0.5)
+
+    ax2.axhline(0, color='black', linewidth=1)
+    ax2.axvline(0, color='black', linewidth=1)
+    ax2.set_xlim(XMIN, XMAX)
+    ax2.set_ylim(YMIN, YMAX)
+    ax2.set_aspect('equal')
+    ax2.grid(True)
+    # 빈 그림에는 범례 항목이 없어 경고가 나므로 그릴 것이 있을 때만 표시
+    if ax2.get_legend_handles_labels()[0]:
+        ax2.legend(loc='upper right')
+
+
+def inverse_proportion_figure(a, dpi=None):
+    """페이지와 같은 키·크기로 y = a/x 그림을 캐시에서 꺼내거나 그립니다."""
+    return cached_figure(inverse_proportion_key(a), draw_inverse_proportion, FIGSIZE, dpi=dpi, args=(a,))
+
+
+def precompute_inverse_proportion(viewports=(DESKTOP_VIEWPORT, MOBILE_VIEWPORT), stop=None):
+    """y = a/x 의 모든 슬라이더 값(101개)을 기본 기기 종류별로 미리 그려 캐시에 넣습니다.
+
+    stop(threading.Event)이 설정되면 그리던 그림까지만 마치고 멈춥니다.
+    """
+    start, stop_value, step = A_RANGE
+    count = quantize(stop_value - start, step) + 1
+    for viewport in viewports:
+        dpi = choose_dpi(FIGSIZE[0], viewport)
+        for k in range(count):
+            if stop is not None and stop.is_set():
+                return
+            # 슬라이더가 돌려주는 값과 같은 표기(소수 첫째 자리)로 맞춤
+            inverse_proportion_figure(round(start + k * step, 1), dpi=dpi)
+
+
+def start_precompute():
+    """precompute_inverse_proportion() 을 백그라운드 스레드에서 한 번만 실행합니다.
+
+    matplotlib 이 그리는 도중에 인터프리터가 끝나지 않도록 데몬이 아닌 스레드로 돌리고,
+    종료가 시작되면 (비데몬 스레드를 기다리기 전에) 멈춤 신호를 보냅니다.
+    """
+    global _precompute_thread
+    with _precompute_lock:
+        if _precompute_thread is not None:
+            return
+        _precompute_thread = threading.Thread(target=precompute_inverse_proportion, name="precompute-03",
+                                              kwargs={"stop": _precompute_stop})
+        # concurrent.futures 의 작업 스레드와 같은 방법: atexit 보다 먼저, 스레드 join 전에 불림
+        threading._register_atexit(_precompute_stop.set)
+        _precompute_thread.start()
+
@@ -0,0 +1,124 @@
+"""여러 세션이 함께 쓰는 렌더링 결과 LRU 캐시.
+
+슬라이더는 정해진 간격으로만 움직이므로 많은 학생이 똑같은 계수 조합을 요청합니다.
+양자화한 매개변수 튜플을 키로 인코딩된 그림을 보관해 두면, 같은 상태는 다시 그리지
+않고 마이크로초 단위로 꺼내 쓸 수 있습니다.
+
+    MATHHH_RENDER_CACHE_MB   메모리 예산 (기본 64 MB)
+    MATHHH_RENDER_CACHE_DIR  지정하면 메모리에서 밀려난 항목을 이 폴더에 저장했다가 다시 읽음
+"""
+import functools
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+DEFAULT_BUDGET_MB = 64
+
+
+class RenderCache:
+    """바이트 예산이 있는 스레드 안전 LRU 캐시 (+ 선택적 디스크 계층).
+
+    write_through=True 이면 넣는 즉시 디스크에도 저장해 재시작 뒤에도 남게 하고,
+    아니면 메모리에서 밀려날 때만 디스크로 옮깁니다.
+    """
+
+    def __init__(self, max_bytes, disk_dir=None, write_through=False):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.write_through = bool(disk_dir) and write_through
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(("hits", "disk_hits", "misses", "evictions", "evicted_bytes", "spills"), 0)
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, hashlib.sha1(repr(key).encode()).hexdigest() + ".pkl")
+
+    def get(self, key):
+        """key 의 값을 돌려줍니다. 메모리에 없으면 디스크 계층을 보고, 그래도 없으면 None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[0]
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(key), "rb") as f:
+                    stored_key, value, nbytes = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+                stored_key = None
+            if stored_key == key:
+                with self._lock:
+                    self._stats["disk_hits"] += 1
+                self._put_memory(key, value, nbytes)
+                return value
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, key, value, nbytes):
+        """값을 넣고, 예산을 넘으면 가장 오래 쓰지 않은 항목부터 내보냅니다."""
+        self._put_memory(key, value, nbytes)
+        if self.write_through:
+            self._spill(key, value, nbytes)
+
+    def _put_memory(self, key, value, nbytes):
+        evicted = []
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                old_key, (old_value, old_nbytes) = self._entries.popitem(last=False)
+                self._bytes -= old_nbytes
+                self._stats["evictions"] += 1
+                self._stats["evicted_bytes"] += old_nbytes
+                evicted.append((old_key, old_value, old_nbytes))
+        # 디스크 쓰기는 잠금 밖에서 합니다. (write_through 이면 이미 디스크에 있음)
+        if self.disk_dir and not self.write_through:
+            for item in evicted:
+                self._spill(*item)
+
+    def _spill(self, key, value, nbytes):
+        path = self._disk_path(key)
+        if os.path.exists(path):
+            return
+        # 여러 프로세스(서버, 미리 그리기 도구)가 같은 폴더에 쓸 수 있으므로 임시 파일 이름에 pid 도 넣음
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump((key, value, nbytes), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            return
+        with self._lock:
+            self._stats["spills"] += 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes)
+
+
+@functools.lru_cache(maxsize=None)
+def render_cache():
+    """프로세스 전체가 함께 쓰는 기본 렌더링 캐시."""
+    budget_mb = float(os.environ.get("MATHHH_RENDER_CACHE_MB", DEFAULT_BUDGET_MB))
+    return RenderCache(int(budget_mb * 2**20), os.environ.get("MATHHH_RENDER_CACHE_DIR") or None)
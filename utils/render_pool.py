@@ -0,0 +1,164 @@
+"""matplotlib 그림을 작업 프로세스들에서 그리는 렌더링 풀.
+
+Agg 래스터화와 PNG 인코딩은 GIL 을 잡고 돌기 때문에, 스크립트 스레드에서 그리면 동시에
+접속한 세션들이 코어가 많아도 한 줄로 기다립니다. 풀은 그림 명세 — utils 모듈의
+최상위 그리기 함수(이름으로 전달됨)와 그 인자(계수, 범위, 작은 배열) — 만 작업 프로세스로
+보내고 인코딩된 DeliveryReport 를 받아 오므로 처리량이 코어 수만큼 늘어납니다.
+
+- 대기열 상한: 처리 중 + 대기 중인 그림이 max_pending 개이면 더 보내지 않고 호출한
+  스레드가 직접 그립니다. (호출자 실행 방식의 역압력 — 대기열이 끝없이 길어지지 않음)
+- 시간 제한: timeout 초 안에 결과가 없으면 포기하고 호출한 스레드가 직접 그립니다.
+- 작업 프로세스가 죽으면 풀을 새로 만듭니다.
+
+    MATHHH_RENDER_WORKERS  작업 프로세스 수 (기본: 코어 수 − 1, 최대 8. 0 이면 끄기)
+    MATHHH_RENDER_QUEUE    최대 대기열 깊이 (기본: 작업 프로세스 수 × 4)
+    MATHHH_RENDER_TIMEOUT  그림 하나의 제한 시간(초, 기본 15)
+"""
+import atexit
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+MAX_DEFAULT_WORKERS = 8
+DEFAULT_TIMEOUT = 15.0
+
+
+def _init_worker():
+    import warnings
+
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    os.environ["MATHHH_RENDER_WORKERS"] = "0"  # 작업 프로세스 안에서 풀을 또 만들지 않음
+    logging.getLogger("matplotlib").setLevel(logging.ERROR)
+    warnings.filterwarnings("ignore", category=UserWarning)
+    # 첫 그림에서 글꼴 캐시·Agg 를 불러오는 시간을 미리 씁니다.
+    import matplotlib.figure  # noqa: F401
+
+    import utils.figures  # noqa: F401
+
+
+def _render_in_worker(draw, args, figsize, fmt, dpi):
+    from utils.figures import render_local
+
+    return render_local(draw, figsize, args, fmt, dpi)
+
+
+class RenderPool:
+    """그림 명세를 작업 프로세스로 보내 DeliveryReport 를 받아 오는 풀."""
+
+    def __init__(self, workers, max_pending=None, timeout=DEFAULT_TIMEOUT):
+        self.workers = workers
+        self.max_pending = max_pending or workers * 4
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._closed = False
+        self._pending = 0
+        self._stats = dict.fromkeys(("submitted", "completed", "rejected", "timeouts", "failures"), 0)
+        self._stats["max_pending_seen"] = 0
+
+    @staticmethod
+    def accepts(draw):
+        """작업 프로세스가 이름으로 다시 불러올 수 있는 그리기 함수인지.
+
+        페이지 스크립트 안의 함수나 람다·지역 함수는 이름으로 찾을 수 없으므로 제외합니다.
+        """
+        module = getattr(draw, "__module__", None) or ""
+        return module.startswith("utils.") and "<" not in getattr(draw, "__qualname__", "<")
+
+    def _get_executor(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("렌더링 풀이 종료되었습니다")
+            if self._executor is None:
+                # Streamlit 서버는 여러 스레드를 쓰므로 fork 대신 spawn 으로 깨끗한 프로세스를 띄웁니다.
+                context = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=context, initializer=_init_worker)
+            return self._executor
+
+    def _reset(self, executor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _release(self, _future=None):
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def render(self, draw, args, figsize, fmt, dpi):
+        """작업 프로세스에서 그린 DeliveryReport. 대기열이 가득 찼거나 시간 초과·실패이면 None."""
+        if not self._slots.acquire(blocking=False):
+            self._count("rejected")
+            return None
+        with self._lock:
+            self._pending += 1
+            self._stats["max_pending_seen"] = max(self._stats["max_pending_seen"], self._pending)
+        executor = None
+        try:
+            executor = self._get_executor()
+            future = executor.submit(_render_in_worker, draw, args, figsize, fmt, dpi)
+        except (BrokenProcessPool, RuntimeError, OSError):
+            # 종료 중이거나 작업 프로세스를 띄우지 못함 → 호출한 스레드가 직접 그림
+            self._release()
+            if executor is not None and not self._closed:
+                self._reset(executor)
+            self._count("failures")
+            return None
+        self._count("submitted")
+        # 자리는 작업이 실제로 끝날 때 돌려줍니다. (시간 초과로 포기한 작업도 끝날 때까지는 자리를 차지함)
+        future.add_done_callback(self._release)
+        try:
+            report = future.result(timeout=self.timeout)
+        except FutureTimeout:
+            future.cancel()
+            self._count("timeouts")
+            logger.warning("그림 %s%r 이(가) %gs 안에 끝나지 않아 직접 그립니다", draw.__qualname__, args, self.timeout)
+            return None
+        except BrokenProcessPool:
+            self._reset(executor)
+            self._count("failures")
+            return None
+        except Exception:
+            logger.exception("작업 프로세스에서 그림 %s 을(를) 그리지 못했습니다", draw.__qualname__)
+            self._count("failures")
+            return None
+        self._count("completed")
+        return report
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, pending=self._pending, max_pending=self.max_pending, workers=self.workers)
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+@functools.lru_cache(maxsize=None)
+def render_pool():
+    """프로세스 전체가 함께 쓰는 렌더링 풀. 꺼져 있으면 None."""
+    default_workers = min(MAX_DEFAULT_WORKERS, (os.cpu_count() or 1) - 1)
+    workers = int(os.environ.get("MATHHH_RENDER_WORKERS", default_workers))
+    if workers <= 0:
+        return None
+    max_pending = int(os.environ.get("MATHHH_RENDER_QUEUE", 0)) or None
+    timeout = float(os.environ.get("MATHHH_RENDER_TIMEOUT", DEFAULT_TIMEOUT))
+    pool = RenderPool(workers, max_pending, timeout)
+    atexit.register(pool.shutdown)
+    return pool
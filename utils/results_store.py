@@ -0,0 +1,178 @@
+"""학생 답안 기록 저장소 (메모리 큐 → 백그라운드 일괄 쓰기 → SQLite).
+
+재실행이 디스크를 기다리지 않도록 record() 는 메모리 큐에 넣기만 하고, 쓰기 스레드가
+모아서 한 트랜잭션으로 SQLite(WAL 모드)에 씁니다. 큐가 가득 차면 기다리지 않고
+버린 뒤 dropped 를 셉니다.
+
+    MATHHH_RESULTS_DB  데이터베이스 경로 (기본 data/results.sqlite3, 빈 값이면 기록하지 않음)
+"""
+import atexit
+import functools
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+
+import streamlit as st
+
+from utils.class_stats import count_answer
+
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DB = os.path.join(ROOT, "data", "results.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    session TEXT NOT NULL,
+    page TEXT NOT NULL,
+    question TEXT NOT NULL,
+    prompt TEXT,
+    answer TEXT,
+    correct INTEGER
+)
+"""
+INSERT = "INSERT INTO answers (ts, session, page, question, prompt, answer, correct) VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+_STOP = object()
+
+
+class ResultsStore:
+    """답안 이벤트를 모아 백그라운드에서 SQLite 에 쓰는 저장소."""
+
+    def __init__(self, path, max_queue=10_000, batch_size=500, flush_interval=0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(("enqueued", "written", "dropped", "flushes", "failed"), 0)
+        self._stats.update(last_flush_ms=0.0, max_flush_ms=0.0)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="results-writer", daemon=True)
+        self._thread.start()
+
+    def record(self, session, page, question, answer, correct, prompt=None):
+        """답안 하나를 큐에 넣습니다. 절대 기다리지 않으며, 넣지 못하면 False."""
+        row = (time.time(), session, page, str(question), prompt,
+               None if answer is None else str(answer), None if correct is None else int(bool(correct)))
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+            return False
+        with self._lock:
+            self._stats["enqueued"] += 1
+        return True
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, queued=self._queue.qsize(), max_queue=self._queue.maxsize)
+
+    def flush(self, timeout=5.0):
+        """지금까지 넣은 이벤트가 모두 쓰일 때까지 기다립니다. (종료·시험용)"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._queue.unfinished_tasks == 0:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def close(self, timeout=5.0):
+        if self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                return
+            self._thread.join(timeout)
+
+    # -----------------------
+    # 쓰기 스레드
+    # -----------------------
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(SCHEMA)
+        conn.commit()
+        return conn
+
+    def _next_batch(self):
+        # 첫 이벤트는 기다리고, 이후로는 flush_interval 안에 들어온 것까지 batch_size 만큼 모읍니다.
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and batch[-1] is not _STOP:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        conn = None
+        while True:
+            batch = self._next_batch()
+            stop = batch[-1] is _STOP
+            rows = [row for row in batch if row is not _STOP]
+            if rows:
+                start = time.perf_counter()
+                try:
+                    conn = conn or self._connect()
+                    with conn:
+                        conn.executemany(INSERT, rows)
+                    ok = True
+                except sqlite3.Error:
+                    logger.exception("답안 기록 %d건을 쓰지 못했습니다", len(rows))
+                    conn, ok = None, False
+                elapsed = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    self._stats["written" if ok else "failed"] += len(rows)
+                    self._stats["flushes"] += 1
+                    self._stats["last_flush_ms"] = elapsed
+                    self._stats["max_flush_ms"] = max(self._stats["max_flush_ms"], elapsed)
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                if conn is not None:
+                    conn.close()
+                return
+
+
+@functools.lru_cache(maxsize=None)
+def results_store():
+    """프로세스 전체가 함께 쓰는 저장소. 기록이 꺼져 있으면 None."""
+    path = os.environ.get("MATHHH_RESULTS_DB", DEFAULT_DB)
+    if not path:
+        return None
+    store = ResultsStore(path)
+    atexit.register(store.close)
+    return store
+
+
+def session_id():
+    """이 브라우저 세션의 익명 식별자."""
+    if "results_session" not in st.session_state:
+        st.session_state.results_session = uuid.uuid4().hex
+    return st.session_state.results_session
+
+
+def record_answer(page, question, answer, correct, prompt=None, topic=None):
+    """현재 세션의 답안 하나를 기록 큐에 넣고 수업 현황 집계에 반영합니다. (디스크를 기다리지 않음)
+
+    topic 은 현황판에서 묶어 볼 문제 이름입니다. (기본값은 prompt, 없으면 question)
+    """
+    count_answer(page, topic or prompt or question, question, answer, correct)
+    store = results_store()
+    if store is not None:
+        store.record(session_id(), page, question, answer, correct, prompt)
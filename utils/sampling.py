@@ -0,0 +1,73 @@
+"""점근선을 고려한 적응형 곡선 표본 추출.
+
+고정된 np.linspace 격자 대신, 화면에서 곡선이 휘는 곳과 세로점근선 근처에만 점을
+더 넣고 평평한 곳은 성기게 둡니다. 점 개수는 budget 을 넘지 않습니다.
+"""
+import numpy as np
+
+# 곡선이 화면(정규화 좌표)에서 현(chord)과 이만큼 이상 벌어지면 구간을 더 나눕니다.
+DEFAULT_TOL = 1e-3
+# 세로점근선에서 이만큼(전체 x 폭 대비) 떨어진 곳까지 곡선을 따라갑니다.
+POLE_OFFSET = 1e-9
+
+
+def adaptive_sample(f, x_min, x_max, y_min, y_max, breaks=(), budget=240, initial=17, tol=DEFAULT_TOL):
+    """f 를 [x_min, x_max] 에서 breaks(극) 마다 끊어 적응형으로 표본 추출합니다.
+
+    y 값은 화면 범위 위아래로 한 화면 높이만큼 여유를 둔 곳에서 잘라 돌려주므로
+    점근선 근처에서도 큰 값이나 nan 연결선 없이 화면 가장자리까지 곡선이 이어집니다.
+    반환값은 구간별 (x, y) 배열 목록입니다.
+    """
+    x_span = x_max - x_min
+    y_span = y_max - y_min
+    lo_clip, hi_clip = y_min - y_span, y_max + y_span
+    offset = x_span * POLE_OFFSET
+    min_dx = x_span * POLE_OFFSET * 10
+
+    inside = sorted(p for p in breaks if x_min < p < x_max)
+    edges = [x_min] + inside + [x_max]
+    bounds = []
+    for i in range(len(edges) - 1):
+        lo = edges[i] + (offset if i > 0 else 0.0)
+        hi = edges[i + 1] - (offset if i < len(edges) - 2 else 0.0)
+        if lo < hi:
+            bounds.append((lo, hi))
+    if not bounds:
+        return []
+
+    # 구간마다 균등한 초기 격자에서 시작해, 오차가 큰 구간의 가운데에 점을 추가합니다.
+    initial = max(3, min(initial, budget // len(bounds)))
+    t = np.linspace(0.0, 1.0, initial)
+    xs_parts, seg_parts = [], []
+    for k, (lo, hi) in enumerate(bounds):
+        xs_parts.append(lo + (hi - lo) * t)
+        seg_parts.append(np.full(initial, k))
+    xs = np.concatenate(xs_parts)
+    seg = np.concatenate(seg_parts)
+    ys = np.clip(f(xs), lo_clip, hi_clip)
+
+    while len(xs) < budget:
+        valid = (seg[:-1] == seg[1:]) & (np.diff(xs) > min_dx)
+        idx = np.flatnonzero(valid)
+        if len(idx) == 0:
+            break
+        x_mid = 0.5 * (xs[idx] + xs[idx + 1])
+        y_mid = np.clip(f(x_mid), lo_clip, hi_clip)
+        y0, y1 = ys[idx], ys[idx + 1]
+        err = np.abs(y_mid - 0.5 * (y0 + y1)) / y_span
+        # 정의되지 않는 점(nan)과 맞닿은 구간은 경계를 찾을 때까지 나눕니다.
+        defined = np.isfinite(y0) + np.isfinite(y1) + np.isfinite(y_mid)
+        err = np.where(np.isnan(err), np.where((defined > 0) & (defined < 3), np.inf, 0.0), err)
+        candidates = np.flatnonzero(err > tol)
+        if len(candidates) == 0:
+            break
+        room = budget - len(xs)
+        if len(candidates) > room:
+            candidates = candidates[np.argpartition(err[candidates], -room)[-room:]]
+        order = np.argsort(np.concatenate([xs, x_mid[candidates]]), kind="stable")
+        xs = np.concatenate([xs, x_mid[candidates]])[order]
+        ys = np.concatenate([ys, y_mid[candidates]])[order]
+        seg = np.concatenate([seg, seg[idx[candidates]]])[order]
+
+    cuts = np.flatnonzero(np.diff(seg)) + 1
+    return list(zip(np.split(xs, cuts), np.split(ys, cuts)))
@@ -0,0 +1,245 @@
+"""페이지 상태를 프로세스 밖에 보관하는 세션 저장소.
+
+st.session_state 는 서버 프로세스 안에만 있어서, 서버를 여러 개 띄우면 같은 학생이
+다른 프로세스로 연결될 때 상태를 잃고, 서버를 다시 시작하면 모두의 문제가 사라집니다.
+page_state() 는 페이지가 지정한 키들만 골라 작게 직렬화해 저장소에 두고, 새 세션이
+시작되면 주소의 ?sid= 로 같은 학생의 상태를 찾아 st.session_state 에 되살립니다.
+
+    state = page_state("06", ("problem_a", "problem_b", ...))   # 맨 위: 있으면 되살림
+    ...
+    state.save()                                                 # 바뀐 경우에만 씀
+
+- memory (기본): 프로세스 안의 딕셔너리. 새로 고침해도 남지만 프로세스끼리는 나누지 않음
+- sqlite: 같은 호스트의 모든 서버 프로세스가 한 파일(WAL)을 함께 씀. 여러 코어에 서버를
+  하나씩 띄우고 부하 분산기를 앞에 두어도(고정 세션 없이) 상태가 이어지고, 재시작에도 남음
+
+값은 정수·실수·문자열·bool 같은 단순 값만 담으며, 공백 없는 JSON 으로 저장합니다.
+주소의 sid 가 곧 열쇠이므로, 주소를 공유하면 상태도 공유됩니다.
+
+    MATHHH_SESSION_BACKEND  memory | sqlite (기본 memory)
+    MATHHH_SESSION_DB       sqlite 경로 (기본 data/sessions.sqlite3)
+    MATHHH_SESSION_TTL_H    이 시간(시간 단위, 기본 24) 동안 쓰이지 않은 상태는 지움 (두 저장소 모두)
+"""
+import functools
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DB = os.path.join(ROOT, "data", "sessions.sqlite3")
+DEFAULT_TTL_H = 24
+# 메모리 저장소가 들고 있는 최대 상태 수 (넘으면 가장 오래 쓰지 않은 것부터 버림)
+MAX_MEMORY_ENTRIES = 10_000
+# sqlite 는 이 횟수만큼 쓸 때마다 오래된 상태를 지웁니다.
+PURGE_EVERY = 500
+
+SID_PARAM = "sid"
+_SID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_state (
+    key TEXT PRIMARY KEY,
+    ts REAL NOT NULL,
+    data BLOB NOT NULL
+)
+"""
+
+
+def dumps(values):
+    return json.dumps(values, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data):
+    return json.loads(data)
+
+
+class MemoryBackend:
+    """프로세스 안에 두는 저장소 (기본값).
+
+    항목은 마지막으로 쓰거나 읽은 순서로 놓여 있어서, ttl 이 지난 상태는 앞에서부터 지웁니다.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries=MAX_MEMORY_ENTRIES, ttl=DEFAULT_TTL_H * 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (마지막으로 쓰거나 읽은 시각, data)
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(("reads", "hits", "writes", "evicted", "purged"), 0)
+
+    def _purge(self, now):
+        cutoff = now - self.ttl
+        while self._data:
+            key, (ts, _) = next(iter(self._data.items()))
+            if ts >= cutoff:
+                break
+            del self._data[key]
+            self._stats["purged"] += 1
+
+    def get(self, key):
+        with self._lock:
+            now = time.time()
+            self._purge(now)
+            self._stats["reads"] += 1
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._stats["hits"] += 1
+            self._data[key] = (now, entry[1])
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, data):
+        with self._lock:
+            now = time.time()
+            self._purge(now)
+            self._stats["writes"] += 1
+            self._data[key] = (now, data)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self._stats["evicted"] += 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, backend=self.name, entries=len(self._data))
+
+
+class SQLiteBackend:
+    """여러 서버 프로세스가 함께 쓰는 SQLite(WAL) 저장소."""
+
+    name = "sqlite"
+
+    def __init__(self, path, ttl=DEFAULT_TTL_H * 3600):
+        self.path = path
+        self.ttl = ttl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 상태 하나는 수십 바이트라 연결 하나를 잠금으로 나눠 써도 충분합니다.
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(("reads", "hits", "writes", "failed", "purged"), 0)
+
+    def get(self, key):
+        with self._lock:
+            self._stats["reads"] += 1
+            try:
+                row = self._conn.execute("SELECT data, ts FROM session_state WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                logger.exception("세션 상태 %s 을(를) 읽지 못했습니다", key)
+                self._stats["failed"] += 1
+                return None
+            if row is None or row[1] < time.time() - self.ttl:
+                return None
+            self._stats["hits"] += 1
+            return bytes(row[0])
+
+    def set(self, key, data):
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute("INSERT OR REPLACE INTO session_state (key, ts, data) VALUES (?, ?, ?)",
+                                       (key, time.time(), data))
+                    self._stats["writes"] += 1
+                    if self._stats["writes"] % PURGE_EVERY == 0:
+                        cursor = self._conn.execute("DELETE FROM session_state WHERE ts < ?",
+                                                    (time.time() - self.ttl,))
+                        self._stats["purged"] += cursor.rowcount
+            except sqlite3.Error:
+                logger.exception("세션 상태 %s 을(를) 쓰지 못했습니다", key)
+                self._stats["failed"] += 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, backend=self.name)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+BACKENDS = {"memory": MemoryBackend, "sqlite": SQLiteBackend}
+
+
+@functools.lru_cache(maxsize=None)
+def session_backend():
+    """프로세스 전체가 함께 쓰는 세션 저장소."""
+    name = os.environ.get("MATHHH_SESSION_BACKEND", "memory") or "memory"
+    if name not in BACKENDS:
+        raise ValueError(f"MATHHH_SESSION_BACKEND 는 {', '.join(BACKENDS)} 중 하나여야 합니다: {name!r}")
+    ttl = float(os.environ.get("MATHHH_SESSION_TTL_H", DEFAULT_TTL_H)) * 3600
+    if name == "sqlite":
+        path = os.environ.get("MATHHH_SESSION_DB", DEFAULT_DB) or DEFAULT_DB
+        return SQLiteBackend(path, ttl)
+    return MemoryBackend(ttl=ttl)
+
+
+def session_key():
+    """주소의 ?sid= 에 둔 이 학생의 식별자. 없거나 형식이 틀리면 새로 만들어 주소에 붙입니다."""
+    sid = st.query_params.get(SID_PARAM, "")
+    if not _SID_PATTERN.fullmatch(sid):
+        sid = uuid.uuid4().hex
+        st.query_params[SID_PARAM] = sid
+    return sid
+
+
+class PageState:
+    """한 페이지에서 저장소에 보관할 st.session_state 키들."""
+
+    def __init__(self, backend, sid, page, keys):
+        self.backend = backend
+        self.key = f"{sid}:{page}"
+        self.keys = tuple(keys)
+        # 마지막으로 저장(또는 되살린) 값. 같으면 다시 쓰지 않습니다.
+        self._marker = f"_saved_state_{page}"
+
+    def restore(self):
+        """이 세션에서 처음 실행될 때 저장소의 값을 st.session_state 에 되살립니다. (되살렸으면 True)"""
+        if self._marker in st.session_state:
+            return False
+        data = self.backend.get(self.key)
+        st.session_state[self._marker] = data
+        if data is None:
+            return False
+        try:
+            values = loads(data)
+        except ValueError:
+            logger.warning("세션 상태 %s 이(가) 깨져 있어 버립니다", self.key)
+            return False
+        for name in self.keys:
+            if name in values:
+                st.session_state[name] = values[name]
+        return True
+
+    def save(self):
+        """지금 값이 마지막으로 저장한 값과 다를 때만 저장소에 씁니다. (썼으면 True)"""
+        data = dumps({name: st.session_state[name] for name in self.keys if name in st.session_state})
+        if st.session_state.get(self._marker) == data:
+            return False
+        self.backend.set(self.key, data)
+        st.session_state[self._marker] = data
+        return True
+
+
+def page_state(page, keys):
+    """page 의 keys 를 저장소와 잇고, 이 세션의 첫 실행이면 저장된 값을 되살립니다."""
+    state = PageState(session_backend(), session_key(), page, keys)
+    state.restore()
+    return state
@@ -0,0 +1,74 @@
+"""암호화 데이터 처리 시간 모형 T(x) = sW/(rx) 의 매개변수 전체 격자 계산.
+
+T 는 서버 수 x 에 대해 K/x (K = sW/r) 꼴이므로, 4쪽 슬라이더가 가질 수 있는 모든
+(s, W, r) 에 대한 K 만 NumPy 브로드캐스트 한 번으로 계산해 프로세스당 한 번 보관합니다.
+(float64 로 100 × 19 × 39 ≈ 0.6 MB) 곡선 T(x) 와 최소 서버 수는 조회할 때 K 에서 바로
+구하므로 x 축까지 펼친 배열은 만들지 않습니다.
+"""
+import functools
+
+import numpy as np
+
+# 슬라이더와 같은 (시작, 끝, 간격)
+S_RANGE = (1, 100, 1)
+W_RANGE = (100, 1000, 50)
+R_RANGE = (10, 200, 5)
+MAX_SERVERS = 200
+# 곡선 T(x) 를 그릴 x 점 개수
+CURVE_POINTS = 400
+
+
+def _grid(start, stop, step):
+    return np.arange(start, stop + step, step, dtype=float)
+
+
+def _index(value, grid_range):
+    start, stop, step = grid_range
+    if not start <= value <= stop:
+        raise ValueError(f"{value} 은(는) 격자 범위 {start}~{stop} 밖입니다.")
+    return int(round((value - start) / step))
+
+
+class ModelSweep:
+    """K[s, W, r] = sW/r 격자와 그 위의 조회 함수."""
+
+    def __init__(self):
+        self.s = _grid(*S_RANGE)
+        self.W = _grid(*W_RANGE)
+        self.r = _grid(*R_RANGE)
+        # 곡선을 매끄럽게 그리기 위한 촘촘한 x (최소 서버 수는 정수 x 로 따로 구함)
+        self.x = np.linspace(1, MAX_SERVERS, CURVE_POINTS)
+        # (s, W, r) 축으로 브로드캐스트해 한 번에 계산
+        self.K = self.s[:, None, None] * self.W[None, :, None] / self.r[None, None, :]
+
+    def curve(self, s, W, r):
+        """(s, W, r) 에서 서버 수 x 에 따른 처리 시간 (x, T(x))."""
+        return self.x, self.K[_index(s, S_RANGE), _index(W, W_RANGE), _index(r, R_RANGE)] / self.x
+
+    def servers_needed(self, r, target):
+        """처리 속도 r 에서 T ≤ target 이 되는 최소 서버 수를 (s, W) 격자로 돌려줍니다.
+
+        서버 MAX_SERVERS 대로도 목표에 못 미치면 NaN 입니다.
+        """
+        return _min_servers(self.K[:, :, _index(r, R_RANGE)], target)
+
+    def min_servers(self, s, W, r, target):
+        """(s, W, r) 에서 T ≤ target 이 되는 최소 서버 수. MAX_SERVERS 대로도 안 되면 None."""
+        k = self.K[_index(s, S_RANGE), _index(W, W_RANGE), _index(r, R_RANGE)]
+        needed = _min_servers(np.array([k]), target)[0]
+        return None if np.isnan(needed) else int(needed)
+
+
+def _min_servers(k, target):
+    # K/x ≤ target 인 가장 작은 x. 나눗셈 반올림으로 한 칸 넘친 곳은 curve() 와 같은 비교로 되돌립니다.
+    needed = np.maximum(np.ceil(k / target), 1.0)
+    over = (needed > 1) & (k / np.maximum(needed - 1, 1) <= target)
+    needed[over] -= 1
+    needed[needed > MAX_SERVERS] = np.nan
+    return needed
+
+
+@functools.lru_cache(maxsize=None)
+def model_sweep():
+    """프로세스당 한 번만 만드는 K 격자."""
+    return ModelSweep()
@@ -0,0 +1,199 @@
+"""서버 시작 시 무거운 라이브러리와 캐시를 미리 데우고, 페이지별 import 시간을 보고합니다.
+
+배포나 재시작 직후 첫 학생이 numpy·matplotlib 를 불러오는 몇 초를 기다리지 않도록
+run.py 가 서버를 띄우기 전에 prewarm() 을 호출합니다. (`streamlit run main.py` 로
+바로 띄운 경우에는 main.py 가 백그라운드 스레드에서 한 번 호출합니다.)
+
+페이지별로 불러오는 모듈은 손으로 적어 두지 않고 pages/*.py 와 main.py 의 맨 위 import 문을
+AST 로 읽어 구합니다(page_imports). 함수 안에서 필요할 때 불러오는 모듈은 페이지를 여는
+시간에 들지 않으므로 세지 않습니다.
+
+SymPy 를 불러오는 유리함수 분석과 모델 표 계산은 쓰는 페이지가 처음 열릴 때 만들어지며,
+미리 하려면 켭니다.
+
+    MATHHH_PREWARM_HEAVY  1 이면 prewarm() 이 SymPy 분석 경로와 모델 표도 미리 데움 (기본 0)
+"""
+import ast
+import functools
+import glob
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PREWARM_HEAVY = os.environ.get("MATHHH_PREWARM_HEAVY", "0") == "1"
+
+# 페이지(파일 이름 앞 번호)별 import 시간 예산(초). 없는 페이지는 DEFAULT_IMPORT_BUDGET.
+# streamlit 자체를 불러오는 시간은 모든 페이지 공통이라 제외합니다.
+# 예산은 측정값의 2배와 측정값 + 0.1s 중 큰 쪽입니다. (04·08 은 numpy 를 처음 불러오는 시간 포함)
+DEFAULT_IMPORT_BUDGET = 0.1
+IMPORT_BUDGETS = {
+    "main": 0.1,  # 측정 0.001s
+    "01": 0.1,  # 0.000s
+    "02": 0.1,  # 0.010s
+    "03": 0.1,  # 0.017s
+    "04": 0.35,  # 0.10–0.16s (utils.sweep 의 numpy)
+    "05": 0.1,  # 0.011s
+    "06": 0.1,  # 0.008s
+    "07": 0.1,  # 0.004s
+    "08": 0.25,  # 0.10–0.11s (utils.rational_analysis 의 numpy)
+}
+
+# streamlit 은 측정 전에 미리 불러 두므로 페이지 모듈 목록에서 뺍니다.
+_SHARED_MODULES = {"streamlit"}
+
+_prewarm_lock = threading.Lock()
+_prewarmed = False
+
+
+class _TopLevelImports(ast.NodeVisitor):
+    # 모듈을 불러올 때 실행되는 import 문만 모읍니다. (함수 본문은 건너뜀)
+
+    def __init__(self):
+        self.modules = []
+
+    def visit_FunctionDef(self, node):
+        pass
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Import(self, node):
+        self.modules.extend(alias.name for alias in node.names)
+
+    def visit_ImportFrom(self, node):
+        if node.module and not node.level:
+            self.modules.append(node.module)
+
+
+def _is_heavy(name):
+    root = name.partition(".")[0]
+    return root not in sys.stdlib_module_names and root not in _SHARED_MODULES
+
+
+@functools.lru_cache(maxsize=None)
+def page_imports():
+    """{페이지: 맨 위에서 불러오는 모듈 목록} (표준 라이브러리·streamlit 제외).
+
+    페이지 이름은 pages/ 파일 이름 앞 번호이고, 진입점은 "main" 입니다.
+    """
+    paths = [os.path.join(ROOT, "main.py")] + sorted(glob.glob(os.path.join(ROOT, "pages", "*.py")))
+    pages = {}
+    for path in paths:
+        name = os.path.basename(path)
+        page = "main" if name == "main.py" else name.partition("_")[0]
+        with open(path, encoding="utf-8") as f:
+            visitor = _TopLevelImports()
+            visitor.visit(ast.parse(f.read(), filename=path))
+        pages[page] = [m for m in dict.fromkeys(visitor.modules) if _is_heavy(m)]
+    return pages
+
+
+def _warm_matplotlib():
+    # 글꼴 캐시, Agg 렌더러, mathtext($f(x)$ 범례), 그림 인코더(PIL) 를 한 번 거쳐 둡니다.
+    from matplotlib.figure import Figure
+
+    from utils.delivery import deliver
+
+    fig = Figure(figsize=(2, 2))
+    ax = fig.subplots()
+    ax.plot([0, 1], [0, 1], label=r"$f^{-1}(x)$")
+    ax.legend()
+    deliver(fig, dpi=100)
+
+
+def _warm_problem_index():
+    from utils.problem_index import operation_index
+
+    operation_index()
+
+
+def _warm_model_sweep():
+    from utils.sweep import model_sweep
+
+    model_sweep()
+
+
+def _warm_rational_analysis():
+    # SymPy 의 다항식·실근 계산 경로를 한 번 거쳐 둡니다.
+    from utils.rational_analysis import analyze
+
+    analyze([1, 0, -1], [1, 0, -4])
+
+
+WARMERS = [_warm_matplotlib, _warm_problem_index]
+# MATHHH_PREWARM_HEAVY=1 일 때만: SymPy 를 불러오고, 모델 표를 계산합니다.
+HEAVY_WARMERS = [_warm_model_sweep, _warm_rational_analysis]
+
+
+def prewarm():
+    """모든 페이지가 맨 위에서 불러오는 모듈을 불러오고 캐시를 채웁니다. 프로세스당 한 번만 실행됩니다.
+
+    반환값은 {단계 이름: 걸린 시간(초)} 입니다.
+    """
+    global _prewarmed
+    with _prewarm_lock:
+        if _prewarmed:
+            return {}
+        timings = {}
+        modules = dict.fromkeys(m for names in page_imports().values() for m in names)
+        for name in modules:
+            start = time.perf_counter()
+            __import__(name)
+            timings[f"import {name}"] = time.perf_counter() - start
+        for warm in WARMERS + (HEAVY_WARMERS if PREWARM_HEAVY else []):
+            start = time.perf_counter()
+            warm()
+            timings[warm.__name__.lstrip("_")] = time.perf_counter() - start
+        _prewarmed = True
+        return timings
+
+
+def start_background_prewarm():
+    """prewarm() 을 데몬 스레드에서 실행합니다. (이미 했으면 아무것도 하지 않음)"""
+    if _prewarmed:
+        return
+    threading.Thread(target=prewarm, name="prewarm", daemon=True).start()
+
+
+def _measure_cold_import(modules):
+    # 새 파이썬 프로세스에서 streamlit 을 먼저 불러온 뒤 페이지 모듈의 import 시간만 잽니다.
+    code = (
+        "import sys, time; sys.path.insert(0, sys.argv[1]); import streamlit\n"
+        "t = time.perf_counter()\n"
+        + "".join(f"import {m}\n" for m in modules)
+        + "print(time.perf_counter() - t)\n"
+    )
+    env = dict(os.environ, MPLBACKEND="Agg")
+    result = subprocess.run([sys.executable, "-c", code, ROOT], capture_output=True, text=True, env=env, cwd=ROOT)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return float(result.stdout.strip())
+
+
+def import_budget_report():
+    """페이지별 콜드 import 시간을 재서 예산과 비교합니다.
+
+    반환값은 (페이지, 측정 시간, 예산, 예산 이내 여부) 목록입니다.
+    """
+    imports = page_imports()
+    pages = list(imports)
+    budgets = [IMPORT_BUDGETS.get(page, DEFAULT_IMPORT_BUDGET) for page in pages]
+    with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as pool:
+        times = list(pool.map(lambda p: _measure_cold_import(imports[p]), pages))
+    return [(page, t, budget, t <= budget) for page, t, budget in zip(pages, times, budgets)]
+
+
+def log_import_budget(report):
+    for page, seconds, budget, ok in report:
+        line = f"[import 예산] {page:>4}: {seconds:6.3f}s / {budget:.2f}s"
+        if ok:
+            logger.info(line)
+        else:
+            logger.warning(line + "  ← 예산 초과")